@@ -0,0 +1,292 @@
+# -*- coding: utf-8 -*-
+"""
+Elero Benchmark.
+
+Benchmarking the hot paths of the Elero lib against a simulated
+transmitter stick. The results are printed as JSON, so they can be
+compared between the versions:
+
+    python config/elero_benchmark.py --latency 0.01 --output result.json
+"""
+import argparse
+import asyncio
+import collections
+import contextlib
+import json
+import os
+import sys
+import time
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from custom_components import elero as elero_platform  # noqa: E402
+from custom_components.elero import cover as elero_component  # noqa: E402
+from custom_components.elero import simulator as elero_simulator  # noqa: E402
+
+# The channels of a transmitter stick.
+STICK_CHANNELS = len(elero_platform.CHANNELS)
+
+
+def percentile(values, percent):
+    """Return the percentile of the values."""
+    if not values:
+        return None
+    values = sorted(values)
+    index = min(int(len(values) * percent / 100), len(values) - 1)
+    return values[index]
+
+
+def summarize(latencies):
+    """Return the statistics of the latencies in milliseconds."""
+    return {
+        "count": len(latencies),
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "max_ms": max(latencies) * 1000,
+    }
+
+
+def create_transmitter(serial_number, latency):
+    """Return a transmitter attached to a new simulated stick and the
+    simulator.
+    """
+    simulator = elero_simulator.EleroSimulator(
+        latency=latency, travel_time=0)
+    transmitter = elero_platform.EleroTransmitter(
+        None, serial_number, None, None, None, None)
+    transmitter._serial = elero_simulator.EleroSimulatorSerial(simulator)
+    transmitter.check()
+    return transmitter, simulator
+
+
+def create_covers(transmitter, polled=False):
+    """Return the covers of all of the channels of the transmitter.
+
+    The covers of a polled transmitter are set like by HA, so the poller
+    of the transmitter polls them. Otherwise the response handlers are set
+    without scheduling the polls, so only the benchmarks send commands.
+    """
+    covers = []
+    for channel in elero_platform.CHANNELS:
+        cover = elero_component.EleroCover(
+            None, transmitter.get_serial_number(), f"Cover {channel}", channel,
+            "roller shutter", ("up", "down", "stop"))
+        cover._transmitter = transmitter
+        if polled:
+            transmitter.set_channel(channel, cover.response_handler)
+        else:
+            transmitter._channel_callbacks[channel] = cover.response_handler
+        covers.append(cover)
+    return covers
+
+
+@contextlib.contextmanager
+def scaled_polls(interval):
+    """Scale the poll interval of the stable channels down to the interval.
+
+    The backoff of the polls is disabled and the age of a fresh state is
+    scaled in the same ratio, so the poller skips the same polls as with
+    the real intervals.
+    """
+    saved = (
+        elero_platform.POLL_INTERVAL_MIN,
+        elero_platform.POLL_INTERVAL_MAX,
+        elero_platform.INFO_CACHE_MAX_AGE,
+    )
+    elero_platform.POLL_INTERVAL_MIN = interval
+    elero_platform.POLL_INTERVAL_MAX = interval
+    elero_platform.INFO_CACHE_MAX_AGE = interval * saved[2] / saved[0]
+    try:
+        yield
+    finally:
+        (
+            elero_platform.POLL_INTERVAL_MIN,
+            elero_platform.POLL_INTERVAL_MAX,
+            elero_platform.INFO_CACHE_MAX_AGE,
+        ) = saved
+
+
+def bench_frames(iterations):
+    """Measure the building and the parsing of the frames."""
+    transmitter, _ = create_transmitter("FRAMES", 0)
+    get_send_command = transmitter._EleroTransmitter__get_send_command
+    parse_response = transmitter._EleroTransmitter__parse_response
+    ack = elero_simulator.create_frame(
+        [elero_platform.BYTE_HEADER, elero_platform.BYTE_LENGTH_5,
+         elero_platform.RESPONSE_ACK, 0x00, 0x41, 0x01])
+    decoder = elero_platform.EleroFrameDecoder()
+
+    def decode():
+        decoder.feed(ack)
+        for frame in decoder:
+            parse_response(frame, 1)
+
+    results = {}
+    for name, func in (
+        ("build_single_channel", lambda: get_send_command((1,), 0x20)),
+        ("build_multi_channel", lambda: get_send_command((1, 7, 12), 0x20)),
+        ("decode_and_parse", decode),
+    ):
+        seconds = min(timeit.repeat(func, number=iterations, repeat=5))
+        results[name] = {"ns_per_op": seconds / iterations * 1e9}
+    transmitter.close_serial()
+    return results
+
+
+def bench_throughput(latency, commands):
+    """Measure the Send commands per second of one stick."""
+    transmitter, _ = create_transmitter("THROUGHPUT", latency)
+    start = time.perf_counter()
+    for i in range(commands):
+        transmitter.up(i % STICK_CHANNELS + 1)
+    seconds = time.perf_counter() - start
+    transmitter.close_serial()
+    return {"commands": commands, "commands_per_second": commands / seconds}
+
+
+def bench_contention(latency, thread_counts, commands):
+    """Measure the latency of open_cover with N concurrent covers.
+
+    The covers are driven from one event loop like by HA.
+    """
+    results = {}
+    for count in thread_counts:
+        transmitter, _ = create_transmitter(f"CONTENTION{count}", latency)
+        covers = create_covers(transmitter)
+        latencies = []
+
+        async def run(cover):
+            for _ in range(commands):
+                start = time.perf_counter()
+                await cover.async_open_cover()
+                latencies.append(time.perf_counter() - start)
+
+        async def run_all():
+            await asyncio.gather(
+                *(run(covers[i % len(covers)]) for i in range(count))
+            )
+
+        start = time.perf_counter()
+        asyncio.run(run_all())
+        seconds = time.perf_counter() - start
+        transmitter.close_serial()
+        results[str(count)] = dict(
+            summarize(latencies),
+            commands_per_second=len(latencies) / seconds,
+        )
+    return results
+
+
+def bench_poll_cycle(latency, channel_counts, cycles, interval):
+    """Measure the poll cycle of 15, 30, 60 ... channels on 1, 2, 4 ... sticks.
+
+    The channels are set like by the covers and polled by the pollers of
+    the transmitters with the scaled interval. The cycle is the time
+    between two polls of a channel, the frames are the Info commands sent
+    to the sticks in a cycle.
+    """
+    results = {}
+    with scaled_polls(interval):
+        for count in channel_counts:
+            sticks = max(count // STICK_CHANNELS, 1)
+            polls = collections.defaultdict(list)
+            transmitters = []
+            for i in range(sticks):
+                transmitter, simulator = create_transmitter(
+                    f"POLL{count}_{i}", latency)
+                for channel in elero_platform.CHANNELS[:count // sticks]:
+                    transmitter.set_channel(
+                        channel,
+                        lambda resp, key=(i, channel): polls[key].append(
+                            time.perf_counter()),
+                    )
+                transmitters.append((transmitter, simulator))
+            # The first polls are spread over the first interval.
+            time.sleep(interval)
+            commands = sum(sim.commands for _, sim in transmitters)
+            start = time.perf_counter()
+            time.sleep(interval * cycles)
+            frames = sum(sim.commands for _, sim in transmitters) - commands
+            for transmitter, _ in transmitters:
+                transmitter.close_serial()
+            gaps = [
+                later - earlier
+                for times in polls.values()
+                for earlier, later in zip(times, times[1:])
+                if earlier >= start
+            ]
+            results[str(count)] = dict(
+                sticks=sticks,
+                cycle_p50_ms=percentile(gaps, 50) * 1000,
+                cycle_max_ms=max(gaps) * 1000,
+                frames_per_cycle=frames / cycles,
+            )
+    return results
+
+
+def bench_control_latency(latency, commands, interval):
+    """Measure the latency of open_cover while the channels are polled.
+
+    The channels are polled by the poller of the transmitter with the
+    scaled interval.
+    """
+    results = {}
+    for polling in (False, True):
+        with scaled_polls(interval):
+            transmitter, _ = create_transmitter(f"CONTROL{polling}", latency)
+            covers = create_covers(transmitter, polling)
+            latencies = []
+
+            async def run():
+                for i in range(commands):
+                    start = time.perf_counter()
+                    await covers[i % len(covers)].async_open_cover()
+                    latencies.append(time.perf_counter() - start)
+
+            asyncio.run(run())
+            transmitter.close_serial()
+        results["polling" if polling else "idle"] = summarize(latencies)
+    return results
+
+
+def main():
+    """Run the benchmarks and print their results as JSON."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--latency", type=float, default=0.005,
+        help="seconds of the response latency of the simulated stick",
+    )
+    parser.add_argument("--iterations", type=int, default=10000)
+    parser.add_argument("--commands", type=int, default=200)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--channels", type=int, nargs="+", default=[15, 30, 60])
+    parser.add_argument("--cycles", type=int, default=5)
+    parser.add_argument(
+        "--poll-interval", type=float, default=1,
+        help="seconds of the scaled poll interval of the stable channels",
+    )
+    parser.add_argument("--output", help="write the results to this file")
+    args = parser.parse_args()
+
+    results = {
+        "version": elero_platform.__version__,
+        "latency_s": args.latency,
+        "frames": bench_frames(args.iterations),
+        "throughput": bench_throughput(args.latency, args.commands),
+        "contention": bench_contention(
+            args.latency, args.threads, max(args.commands // 10, 1)),
+        "poll_cycle": bench_poll_cycle(
+            args.latency, args.channels, args.cycles, args.poll_interval),
+        "control_latency": bench_control_latency(
+            args.latency, max(args.commands // 4, 1), args.poll_interval),
+    }
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(output)
+    print(output)
+
+
+if __name__ == '__main__':
+    main()
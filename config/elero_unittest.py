@@ -2,13 +2,30 @@
 """
 Elero Unittest.
 
-Unittesting the Elero lib.
+Unittesting the Elero lib against a simulated transmitter stick.
 """
+import asyncio
+import os
+import tempfile
+import threading
+import time
 import unittest
-from unittest.mock import Mock
+from unittest import mock
+
+import serial
+from homeassistant.core import State
+from homeassistant.helpers.restore_state import RestoreEntity
 
 from custom_components import elero as elero_platform
-from custom_components.cover import elero as elero_component
+from custom_components.elero import cover as elero_component
+from custom_components.elero import simulator as elero_simulator
+
+# Seconds to wait for a response of the simulator.
+TIMEOUTS = {
+    elero_platform.COMMAND_CHECK: 0.5,
+    elero_platform.COMMAND_INFO: 0.5,
+    elero_platform.COMMAND_SEND: 0.5,
+}
 
 
 class EleroUnittest(unittest.TestCase):
@@ -16,14 +33,8 @@ class EleroUnittest(unittest.TestCase):
 
     def setUp(self):
         """Seting up the unittest."""
-        self._serial = Mock()
-        self.elero_transmitter = elero_platform.EleroTransmitter(
-            1, self._serial)
-        self.elero_device = elero_platform.EleroDevice(
-            self.elero_transmitter, 1)
-
         self.elero_cover = elero_component.EleroCover(None,
-                                                      self.elero_transmitter,
+                                                      'AU00JHUU',
                                                       'Étkező', 7,
                                                       'venetian blind',
                                                       ('up', 'down',
@@ -33,6 +44,10 @@ class EleroUnittest(unittest.TestCase):
         """Testing the name method."""
         self.assertEqual(self.elero_cover.name, 'Étkező')
 
+    def test_unique_id(self):
+        """Testing the unique_id method."""
+        self.assertEqual(self.elero_cover.unique_id, 'AU00JHUU_7')
+
     def test_device_class(self):
         """Testing the device_class method."""
         self.assertEqual(self.elero_cover.device_class, 'window')
@@ -43,11 +58,11 @@ class EleroUnittest(unittest.TestCase):
 
     def test_should_poll(self):
         """Testing the should_poll method."""
-        self.assertEqual(self.elero_cover.should_poll, True)
+        self.assertEqual(self.elero_cover.should_poll, False)
 
     def test_available(self):
         """Testing the available method."""
-        self.assertEqual(self.elero_cover.available, True)
+        self.assertEqual(self.elero_cover.available, False)
 
     def test_current_cover_position(self):
         """Testing the current_cover_position method."""
@@ -73,851 +88,805 @@ class EleroUnittest(unittest.TestCase):
         """Testing the state method."""
         self.assertEqual(self.elero_cover.state, None)
 
-    # EleroCover class
-    def test_get_transmitter_id(self):
-        """Testing the get_transmitter_id method."""
-        self.assertEqual(self.elero_transmitter.get_transmitter_id(), 1)
-
-    def test_read_response(self):
-        """Testing the get_response method."""
-        self._serial.read = Mock(
-            return_value=b'')
-        self.assertEqual(self.elero_device._read_response(0), b'')
-
-    def test_reset_response(self):
-        """Testing the _reset_response method."""
-        self.assertEqual(self.elero_device._reset_response(), None)
-        self.assertEqual(self.elero_device._response['bytes'], None)
-        self.assertEqual(self.elero_device._response['header'], None)
-        self.assertEqual(self.elero_device._response['length'], None)
-        self.assertEqual(self.elero_device._response['command'], None)
-        self.assertEqual(self.elero_device._response['ch_h'], None)
-        self.assertEqual(self.elero_device._response['ch_l'], None)
-        self.assertEqual(self.elero_device._response['chs'], set())
-        self.assertEqual(self.elero_device._response['status'], None)
-        self.assertEqual(self.elero_device._response['cs'], None)
-
-    def test_get_check_command(self):
-        """Testing the CHECK command."""
-        self.assertEqual(self.elero_device._get_check_command(),
-                         [elero_platform.BYTE_HEADER,
-                          elero_platform.BYTE_LENGTH_2,
-                          elero_platform.COMMAND_CHECK])
-
-    def test_get_info_command(self):
-        """Testing the INFO command."""
-        self.assertEqual(self.elero_device._get_info_command(),
-                         [elero_platform.BYTE_HEADER,
-                          elero_platform.BYTE_LENGTH_4,
-                          elero_platform.COMMAND_INFO,
-                          0, 1])
-
-    def test_get_up_command(self):
-        """Testing the UP command."""
-        self.assertEqual(self.elero_device._get_up_command(),
-                         [elero_platform.BYTE_HEADER,
-                          elero_platform.BYTE_LENGTH_5,
-                          elero_platform.COMMAND_SEND,
-                          0, 1,
-                          elero_platform.PAYLOAD_UP])
-
-    def test_get_down_command(self):
-        """Testing the DOWN command."""
-        self.assertEqual(self.elero_device._get_down_command(),
-                         [elero_platform.BYTE_HEADER,
-                          elero_platform.BYTE_LENGTH_5,
-                          elero_platform.COMMAND_SEND,
-                          0, 1,
-                          elero_platform.PAYLOAD_DOWN])
-
-    def test_get_stop_command(self):
-        """Testing the STOP command."""
-        self.assertEqual(self.elero_device._get_stop_command(),
-                         [elero_platform.BYTE_HEADER,
-                          elero_platform.BYTE_LENGTH_5,
-                          elero_platform.COMMAND_SEND,
-                          0, 1,
-                          elero_platform.PAYLOAD_STOP])
-
-    def test_get_intermediate_command(self):
-        """Testing the INTERMEDIATE command."""
-        self.assertEqual(self.elero_device._get_intermediate_command(),
-                         [elero_platform.BYTE_HEADER,
-                          elero_platform.BYTE_LENGTH_5,
-                          elero_platform.COMMAND_SEND,
-                          0, 1,
-                          elero_platform.PAYLOAD_INTERMEDIATE_POS])
-
-    def test_get_ventilation_tilting_command(self):
-        """Testing the VENTILATION command."""
-        self.assertEqual(self.elero_device._get_ventilation_tilting_command(),
-                         [elero_platform.BYTE_HEADER,
-                          elero_platform.BYTE_LENGTH_5,
-                          elero_platform.COMMAND_SEND,
-                          0, 1,
-                          elero_platform.PAYLOAD_VENTILATION_POS_TILTING])
-
-    def test_parse_response_with_no_response(self):
-        """Testing the parse_response method."""
-        # No response or serial data
-        ser_resp = b''
-        self.assertEqual(self.elero_device._parse_response(ser_resp), None)
-        self.assertEqual(self.elero_device._response['bytes'],
-                         elero_platform.NO_SERIAL_RESPONSE)
-        self.assertEqual(self.elero_device._response['header'], None)
-        self.assertEqual(self.elero_device._response['length'], None)
-        self.assertEqual(self.elero_device._response['command'], None)
-        self.assertEqual(self.elero_device._response['ch_h'], None)
-        self.assertEqual(self.elero_device._response['ch_l'], None)
-        self.assertEqual(self.elero_device._response['chs'], set())
-        self.assertEqual(self.elero_device._response['status'],
-                         elero_platform.INFO_NO_INFORMATION)
-        self.assertEqual(self.elero_device._response['cs'], None)
+    def test_response_handler_bottom_position_stop(self):
+        """Testing the response_handler method."""
+        self.elero_cover.response_handler(elero_platform.EleroResponse(
+            elero_platform.RESPONSE_ACK, 0x40, 0x02))
+        self.assertEqual(self.elero_cover.is_closed, True)
+        self.assertEqual(self.elero_cover.current_cover_position, 0)
+        self.assertEqual(self.elero_cover.state, 'closed')
+        self.assertEqual(self.elero_cover.extra_state_attributes,
+                         {'elero_state': 'bottom position stop'})
+
+    def test_response_handler_moving_up(self):
+        """Testing the response_handler method."""
+        self.elero_cover.response_handler(elero_platform.EleroResponse(
+            elero_platform.RESPONSE_ACK, 0x40, 0x0A))
+        self.assertEqual(self.elero_cover.is_opening, True)
+        self.assertEqual(self.elero_cover.is_closing, False)
+        self.assertEqual(self.elero_cover.state, 'opening')
+
+    def test_response_handler_availability(self):
+        """Testing the response_handler method with the None response."""
+        self.elero_cover.response_handler(None)
+        self.assertEqual(self.elero_cover.state, None)
+
+    def restore_state(self, attributes):
+        """Add the cover to HA with the last state of the given attributes."""
+        last_state = State('cover.etkezo', 'closed', attributes)
+        self.elero_cover.async_get_last_state = mock.AsyncMock(
+            return_value=last_state)
+        with mock.patch.object(RestoreEntity, 'async_added_to_hass',
+                               mock.AsyncMock()):
+            asyncio.run(self.elero_cover.async_added_to_hass())
+
+    def test_async_added_to_hass_restore(self):
+        """Testing the restoring of the last state of the cover."""
+        self.restore_state({'elero_state': 'bottom position stop'})
+        self.assertEqual(self.elero_cover.state, 'closed')
+        self.assertEqual(self.elero_cover.current_cover_position, 0)
+        self.assertEqual(self.elero_cover.extra_state_attributes,
+                         {'elero_state': 'bottom position stop'})
+
+    def test_async_added_to_hass_response(self):
+        """Testing that the state from the transmitter is not restored."""
+        self.elero_cover.response_handler(elero_platform.EleroResponse(
+            elero_platform.RESPONSE_ACK, 0x40, 0x0A))
+        self.restore_state({'elero_state': 'bottom position stop'})
+        self.elero_cover.async_get_last_state.assert_not_called()
+        self.assertEqual(self.elero_cover.state, 'opening')
+
+    def test_async_added_to_hass_unknown(self):
+        """Testing the restoring of an unknown last state."""
+        self.restore_state({'elero_state': 'no such state'})
+        self.elero_cover.async_get_last_state.assert_called_once_with()
+        self.assertEqual(self.elero_cover.state, None)
+
+    def test_get_mask_channels(self):
+        """Testing the get_mask_channels function."""
+        self.assertEqual(elero_platform.get_mask_channels(0x00), ())
+        self.assertEqual(elero_platform.get_mask_channels(0x76),
+                         (2, 3, 5, 6, 7))
+        self.assertEqual(elero_platform.get_mask_channels(0x80), (8,))
+        self.assertEqual(elero_platform.get_mask_channels(0x400), (11,))
+        self.assertEqual(elero_platform.get_mask_channels(0x401), (1, 11))
+        self.assertEqual(elero_platform.get_mask_channels(0x7FFF),
+                         tuple(elero_platform.CHANNELS))
+        for mask in range(0x8000):
+            self.assertEqual(
+                elero_platform.get_mask_channels(mask),
+                tuple(ch for ch in elero_platform.CHANNELS
+                      if mask & (1 << (ch - 1))))
 
     def test_parse_response_easy_check_123467(self):
-        """Testing the parse_response method."""
-        # Common and Easy Confirmed (the answer on Easy Check) - 1,2,3,4,6,7
-        ser_resp = b'\xAA\x04\x4B\x00\x6F\x98'
-        self.assertEqual(self.elero_device._parse_response(ser_resp), None)
-        self.assertEqual(self.elero_device._response['bytes'], ser_resp)
-        self.assertEqual(self.elero_device._response['header'], 170)
-        self.assertEqual(self.elero_device._response['length'], 4)
-        self.assertEqual(self.elero_device._response['command'], 75)
-        self.assertEqual(self.elero_device._response['ch_h'], ())
-        self.assertEqual(self.elero_device._response['ch_l'],
-                         (1, 2, 3, 4, 6, 7))
-        self.assertEqual(self.elero_device._response['chs'],
-                         {1, 2, 3, 4, 6, 7})
-        self.assertEqual(self.elero_device._response['status'],
-                         elero_platform.INFO_UNKNOWN)
-        self.assertEqual(self.elero_device._response['cs'], 152)
+        """Testing the EleroResponse of an Easy Confirm."""
+        resp = elero_platform.EleroResponse(
+            elero_platform.RESPONSE_CONFIRM, 0x6F, None)
+        self.assertEqual(resp.channels, (1, 2, 3, 4, 6, 7))
+        self.assertEqual(resp.state, elero_platform.INFO_UNKNOWN)
 
     def test_parse_response_easy_info_andy_01(self):
-        """Testing the parse_response method."""
-        # Easy Ack (the answer on Easy Info) - 11
-        ser_resp = b'\xaa\x05M\x04\x00\x01\xff'
-        self.assertEqual(self.elero_device._parse_response(ser_resp), None)
-        self.assertEqual(self.elero_device._response['bytes'], ser_resp)
-        self.assertEqual(self.elero_device._response['header'], 170)
-        self.assertEqual(self.elero_device._response['length'], 5)
-        self.assertEqual(self.elero_device._response['command'], 77)
-        self.assertEqual(self.elero_device._response['ch_h'], (11,))
-        self.assertEqual(self.elero_device._response['ch_l'], ())
-        self.assertEqual(self.elero_device._response['chs'], {11})
-        self.assertEqual(self.elero_device._response['status'],
+        """Testing the EleroResponse of an Easy Ack."""
+        resp = elero_platform.EleroResponse(
+            elero_platform.RESPONSE_ACK, 0x400, 0x01)
+        self.assertEqual(resp.channels, (11,))
+        self.assertEqual(resp.state, elero_platform.INFO_TOP_POSITION_STOP)
+
+    def test_parse_response_unknown(self):
+        """Testing the EleroResponse of an unknown status."""
+        resp = elero_platform.EleroResponse(
+            elero_platform.RESPONSE_ACK, 0x40, 0x0C)
+        self.assertEqual(resp.channels, (7,))
+        self.assertEqual(resp.state, elero_platform.INFO_UNKNOWN)
+
+
+class EleroFrameDecoderUnittest(unittest.TestCase):
+    """Unittest to the Elero frame decoder."""
+
+    def setUp(self):
+        """Seting up the unittest."""
+        self.decoder = elero_platform.EleroFrameDecoder()
+
+    def test_frames(self):
+        """Testing the decoding of complete frames."""
+        self.decoder.feed(b'\xAA\x04\x4B\x00\x6F\x98\xAA\x05\x4D\x00\x40'
+                          b'\x02\xC2')
+        self.assertEqual(list(self.decoder),
+                         [b'\xAA\x04\x4B\x00\x6F\x98',
+                          b'\xAA\x05\x4D\x00\x40\x02\xC2'])
+        self.assertEqual(self.decoder.frames, 2)
+
+    def test_partial_frame(self):
+        """Testing the decoding of a frame in parts."""
+        self.assertEqual(self.decoder.get_missing_bytes(), 2)
+        self.decoder.feed(b'\xAA\x05')
+        self.assertEqual(list(self.decoder), [])
+        self.assertEqual(self.decoder.get_missing_bytes(), 5)
+        self.decoder.feed(b'\x4D\x00\x40')
+        self.assertEqual(list(self.decoder), [])
+        self.assertEqual(self.decoder.get_missing_bytes(), 2)
+        self.decoder.feed(b'\x02\xC2')
+        self.assertEqual(list(self.decoder),
+                         [b'\xAA\x05\x4D\x00\x40\x02\xC2'])
+
+    def test_resynchronize(self):
+        """Testing the dropping of the stale and the corrupted bytes."""
+        self.decoder.feed(b'\x00\x01\xAA\x05\x4D\x00\x40\x02\xC3'
+                          b'\xAA\x04\x4E\x00\x04\x00')
+        self.assertEqual(list(self.decoder), [b'\xAA\x04\x4E\x00\x04\x00'])
+        self.assertEqual(self.decoder.rejected_frames, 1)
+        self.assertEqual(self.decoder.dropped_bytes, 9)
+
+
+class EleroChannelCacheUnittest(unittest.TestCase):
+    """Unittest to the Elero channel cache."""
+
+    def setUp(self):
+        """Seting up the unittest."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name,
+                                 elero_platform.CHANNEL_CACHE_FILE)
+        self.channel_cache = elero_platform.EleroChannelCache(self.path)
+        self.channel_cache.set_learned_mask('SIM', 0x41)
+        self.channel_cache.set_status('SIM', 7, 0x02)
+        self.channel_cache.set_status('SIM', 1, 0x01)
+        self.channel_cache.save()
+
+    def tearDown(self):
+        """Removing the cache file."""
+        self.directory.cleanup()
+
+    def test_reload(self):
+        """Testing the reloading of the saved cache."""
+        channel_cache = elero_platform.EleroChannelCache(self.path)
+        self.assertEqual(channel_cache.get_learned_mask('SIM'), 0x41)
+        self.assertEqual(channel_cache.get_statuses('SIM'), {1: 0x01, 7: 0x02})
+        self.assertEqual(channel_cache.get_learned_mask('OTHER'), None)
+        self.assertEqual(channel_cache.get_statuses('OTHER'), {})
+
+    def test_warm_start(self):
+        """Testing the start of a transmitter from the cache."""
+        simulator = elero_simulator.EleroSimulator((1, 2, 7), latency=0.01)
+        elero_transmitter = elero_platform.EleroTransmitter(
+            None, 'SIM', None, None, None, None,
+            channel_cache=elero_platform.EleroChannelCache(self.path),
+            timeouts=TIMEOUTS)
+        elero_transmitter.init_serial_port = lambda: None
+        elero_transmitter._serial = elero_simulator.EleroSimulatorSerial(
+            simulator)
+        try:
+            # The Easy Check is not waited for while the port is held.
+            with elero_transmitter._threading_lock:
+                elero_transmitter.init_serial()
+                self.assertEqual(simulator.commands, 0)
+                self.assertEqual(elero_transmitter.is_channel_learned(7), True)
+                self.assertEqual(elero_transmitter.is_channel_learned(2), False)
+                responses = []
+                self.assertEqual(
+                    elero_transmitter.set_channel(7, responses.append), True)
+                self.assertEqual(responses[0].status, 0x02)
+                self.assertEqual(responses[0].channels, (7,))
+            # The Easy Check reconciles the channels in the background.
+            deadline = time.monotonic() + 2
+            while (not elero_transmitter.is_channel_learned(2)
+                   and time.monotonic() < deadline):
+                time.sleep(0.01)
+            self.assertEqual(elero_transmitter.is_channel_learned(2), True)
+        finally:
+            elero_transmitter.close_serial()
+
+
+class EleroTransmitterUnittest(unittest.TestCase):
+    """Unittest to the Elero transmitter with a simulated stick."""
+
+    def setUp(self):
+        """Seting up the unittest."""
+        self.simulator = elero_simulator.EleroSimulator(
+            (1, 2, 3, 7, 11), latency=0.01, travel_time=1,
+            unreachable_channels=(3,), seed=1)
+        self.elero_transmitter = elero_platform.EleroTransmitter(
+            None, 'SIM', None, None, None, None, timeouts=TIMEOUTS)
+        self.elero_transmitter._serial = elero_simulator.EleroSimulatorSerial(
+            self.simulator)
+        self.elero_transmitter.check()
+        self.responses = []
+
+    def tearDown(self):
+        """Closing the transmitter."""
+        self.elero_transmitter.close_serial()
+
+    def set_channel(self, channel):
+        """Set the callback of the channel which collects the responses.
+
+        It is set without scheduling the polls, so the commands of the
+        tests are not mixed with the polls.
+        """
+        self.elero_transmitter._channel_callbacks[channel] = (
+            lambda resp: self.responses.append((channel, resp)))
+
+    def start_threads(self, target, *args_list):
+        """Start a thread of the target for every args and return them."""
+        threads = [threading.Thread(target=target, args=args)
+                   for args in args_list]
+        for thread in threads:
+            thread.start()
+        return threads
+
+    def wait_until(self, condition):
+        """Wait until the condition becomes true."""
+        deadline = time.monotonic() + 2
+        while not condition() and time.monotonic() < deadline:
+            time.sleep(0.001)
+        self.assertTrue(condition())
+
+    def wait_pending(self, count):
+        """Wait until the count of the queued requests is reached."""
+        self.wait_until(
+            lambda: len(self.elero_transmitter._pending) == count)
+
+    def wait_served(self, count):
+        """Wait until the worker has taken the count of the requests."""
+        metrics = self.elero_transmitter.get_metrics()
+        self.wait_until(lambda: metrics.get_summary(
+            elero_platform.METRIC_QUEUE_WAIT)['count'] == count)
+
+    def get_commands(self):
+        """Return the command frames of the exchanges after the Check."""
+        return [e['command'] for e in self.elero_transmitter.get_exchanges()[1:]]
+
+    def test_coalesce_info(self):
+        """Testing the coalescing of the concurrent Info commands."""
+        self.set_channel(11)
+        # The worker is held by a Send, so the Info commands are queued.
+        with self.elero_transmitter._threading_lock:
+            threads = self.start_threads(self.elero_transmitter.up, (1,))
+            self.wait_served(2)
+            threads += self.start_threads(
+                self.elero_transmitter.info, *[(11,)] * 10)
+            self.wait_pending(1)
+        for thread in threads:
+            thread.join(2)
+            self.assertEqual(thread.is_alive(), False)
+        self.assertEqual(self.simulator.commands, 3)
+        self.assertEqual(self.get_commands(),
+                         ['aa054c000120e4', 'aa044e040000'])
+        self.assertEqual(len(self.responses), 1)
+
+    def test_priority(self):
+        """Testing the serving of a queued Send before the queued Infos."""
+        for channel in (1, 2, 7, 11):
+            self.set_channel(channel)
+        with self.elero_transmitter._threading_lock:
+            threads = self.start_threads(self.elero_transmitter.up, (1,))
+            self.wait_served(2)
+            threads += self.start_threads(
+                self.elero_transmitter.info, (2,), (7,))
+            self.wait_pending(2)
+            threads += self.start_threads(self.elero_transmitter.down, (11,))
+            self.wait_pending(3)
+        for thread in threads:
+            thread.join(2)
+        self.assertEqual(self.get_commands(),
+                         ['aa054c000120e4', 'aa054c040040c1',
+                          'aa044e000202', 'aa044e0040c4'])
+
+    def test_close_queued(self):
+        """Testing the closing of the transmitter with queued requests."""
+        self.set_channel(1)
+        self.set_channel(2)
+        with self.elero_transmitter._threading_lock:
+            threads = self.start_threads(self.elero_transmitter.up, (1,))
+            self.wait_served(2)
+            threads += self.start_threads(self.elero_transmitter.info, (2,))
+            self.wait_pending(1)
+            threads += self.start_threads(
+                self.elero_transmitter.close_serial, ())
+            self.wait_until(lambda: self.elero_transmitter._closed)
+        for thread in threads:
+            thread.join(2)
+            self.assertEqual(thread.is_alive(), False)
+        self.assertEqual(self.simulator.commands, 1)
+        self.assertEqual(self.elero_transmitter._serial.is_open, False)
+
+    def test_group_commands(self):
+        """Testing the merging of the concurrent commands into one frame."""
+        self.elero_transmitter._group_commands = True
+        for channel in (1, 2, 7):
+            self.set_channel(channel)
+        threads = self.start_threads(self.elero_transmitter.up, (1,), (2,))
+        threads += self.start_threads(
+            asyncio.run, (self.elero_transmitter.async_up(7),))
+        for thread in threads:
+            thread.join(2)
+            self.assertEqual(thread.is_alive(), False)
+        self.assertEqual(self.get_commands(), ['aa054c004320a2'])
+        self.assertEqual(sorted(ch for ch, _ in self.responses), [1, 2, 7])
+
+    def test_close_group(self):
+        """Testing the closing of the transmitter with a group command."""
+        self.elero_transmitter._group_commands = True
+        threads = self.start_threads(self.elero_transmitter.up, (1,), (2,))
+        self.wait_until(lambda: self.elero_transmitter._group_batches)
+        self.elero_transmitter.close_serial()
+        for thread in threads:
+            thread.join(2)
+            self.assertEqual(thread.is_alive(), False)
+        time.sleep(elero_platform.GROUP_COMMAND_WINDOW)
+        self.assertEqual(self.simulator.commands, 1)
+
+    def test_check(self):
+        """Testing the check method."""
+        self.elero_transmitter.check()
+        self.assertEqual(self.elero_transmitter.is_channel_learned(1), True)
+        self.assertEqual(self.elero_transmitter.is_channel_learned(11), True)
+        self.assertEqual(self.elero_transmitter.is_channel_learned(4), False)
+
+    def test_check_availability(self):
+        """Testing the availability push of the changed learned channels."""
+        for channel in (1, 2, 4):
+            self.set_channel(channel)
+        # Channel 4 is deleted and channel 2 is taught since the last Check.
+        transmitter = self.elero_transmitter
+        transmitter._learned_mask = transmitter._learned_mask ^ 0b1010
+        transmitter.check()
+        self.assertEqual(transmitter.is_channel_learned(2), True)
+        self.assertEqual(transmitter.is_channel_learned(4), False)
+        self.assertIn((2, None), self.responses)
+        self.assertIn((4, None), self.responses)
+        self.assertNotIn((1, None), self.responses)
+
+    def test_poll_slots(self):
+        """Testing the spreading of the polls of the stable channels."""
+        polled = {}
+        for channel in (1, 2, 7, 11):
+            self.elero_transmitter._channel_callbacks[channel] = (
+                lambda _, ch=channel: polled.setdefault(ch, time.monotonic()))
+        with mock.patch.object(elero_platform, 'POLL_INTERVAL_MIN', 0.8), \
+                mock.patch.object(elero_platform, 'POLL_INTERVAL_MOVING', 0.1):
+            start = time.monotonic()
+            for channel in (1, 7, 11):
+                self.elero_transmitter._EleroTransmitter__schedule_poll(
+                    channel, 0.8, 0)
+            # Channel 2 is moving.
+            self.elero_transmitter._EleroTransmitter__schedule_poll(
+                2, 0.1, 0)
+            self.wait_until(lambda: len(polled) == 4)
+        self.assertLess(polled[2] - start, 0.15)
+        stable = sorted(polled[ch] - start for ch in (1, 7, 11))
+        self.assertLess(stable[0], 0.15)
+        # The slot of a stable channel is POLL_INTERVAL_MIN / 4.
+        for earlier, later in zip(stable, stable[1:]):
+            self.assertGreaterEqual(later - earlier, 0.19)
+            self.assertLess(later - earlier, 0.35)
+
+    def test_set_channel(self):
+        """Testing the set_channel method."""
+        self.assertEqual(
+            self.elero_transmitter.set_channel(7, self.responses.append), True)
+        self.assertEqual(
+            self.elero_transmitter.set_channel(8, self.responses.append), False)
+
+    def test_info(self):
+        """Testing the info method."""
+        self.set_channel(11)
+        self.elero_transmitter.info(11)
+        self.assertEqual(self.responses[-1][1].state,
                          elero_platform.INFO_TOP_POSITION_STOP)
-        self.assertEqual(self.elero_device._response['cs'], 255)
-
-    def test_parse_response_easy_info_1(self):
-        """Testing the parse_response method."""
-        # Easy Ack (the answer on Easy Info) - 1
-        ser_resp = b'\xAA\x05\x4D\x00\x01\x00\x03'
-        self.assertEqual(self.elero_device._parse_response(ser_resp), None)
-        self.assertEqual(self.elero_device._response['bytes'], ser_resp)
-        self.assertEqual(self.elero_device._response['header'], 170)
-        self.assertEqual(self.elero_device._response['length'], 5)
-        self.assertEqual(self.elero_device._response['command'], 77)
-        self.assertEqual(self.elero_device._response['ch_h'], ())
-        self.assertEqual(self.elero_device._response['ch_l'], (1,))
-        self.assertEqual(self.elero_device._response['chs'], {1})
-        self.assertEqual(self.elero_device._response['status'],
-                         elero_platform.INFO_NO_INFORMATION)
-        self.assertEqual(self.elero_device._response['cs'], 3)
-
-    def test_parse_response_easy_info_7(self):
-        """Testing the parse_response method."""
-        # Easy Ack (the answer on Easy Info) - 7
-        ser_resp = b'\xAA\x05\x4D\x00\x40\x00\xC4'
+
+    def test_down(self):
+        """Testing the down method and the polls of the moving motor."""
+        self.elero_transmitter.set_channel(
+            2, lambda resp: self.responses.append((2, resp)))
+        self.elero_transmitter.down(2)
+        self.assertEqual(self.responses[-1][1].state,
+                         elero_platform.INFO_START_TO_MOVE_DOWN)
+        # The moving cover is polled although the Send response is fresh.
+        time.sleep(1.3)
+        self.assertEqual(self.simulator.get_status(2),
+                         elero_simulator.STATUS_BOTTOM_POSITION_STOP)
+        self.assertEqual(self.responses[-1][1].state,
+                         elero_platform.INFO_BOTTOM_POSITION_STOP)
+        self.assertEqual(self.elero_transmitter._poll_intervals[2],
+                         elero_platform.POLL_INTERVAL_MIN)
+
+    def test_info_fresh(self):
+        """Testing the skipping of the Info while the state is fresh."""
+        self.set_channel(2)
+        self.elero_transmitter.down(2)
+        commands = self.simulator.commands
+        self.elero_transmitter.info(2)
+        self.assertEqual(self.simulator.commands, commands)
+
+    def test_poll_moving(self):
+        """Testing the polls of a moving cover in every second."""
+        self.simulator = elero_simulator.EleroSimulator(
+            (2,), latency=0.01, travel_time=3.5)
+        self.elero_transmitter._serial._simulator = self.simulator
+        self.elero_transmitter.set_channel(
+            2, lambda resp: self.responses.append((2, resp)))
+        self.elero_transmitter.down(2)
+        time.sleep(3.2)
+        # The Send and an Info in every second of the movement.
+        self.assertIn(self.simulator.commands, (4, 5))
+        self.assertEqual(self.elero_transmitter._poll_intervals[2],
+                         elero_platform.POLL_INTERVAL_MOVING)
+        time.sleep(1)
+        self.assertEqual(self.responses[-1][1].state,
+                         elero_platform.INFO_BOTTOM_POSITION_STOP)
+        self.assertEqual(self.elero_transmitter._poll_intervals[2],
+                         elero_platform.POLL_INTERVAL_MIN)
+
+    def test_poll_backoff(self):
+        """Testing the backoff of the polls of a cover in stable state."""
+        self.set_channel(2)
+        self.elero_transmitter._poll_intervals[2] = (
+            elero_platform.POLL_INTERVAL_MOVING)
+        process_response = (
+            self.elero_transmitter._EleroTransmitter__process_response)
+        intervals = []
+        for _ in range(7):
+            process_response(elero_platform.EleroResponse(
+                elero_platform.RESPONSE_ACK, 0x02, 0x01))
+            intervals.append(self.elero_transmitter._poll_intervals[2])
+        self.assertEqual(intervals, [15, 30, 60, 120, 240, 300, 300])
+        process_response(elero_platform.EleroResponse(
+            elero_platform.RESPONSE_ACK, 0x02, 0x0B))
+        self.assertEqual(self.elero_transmitter._poll_intervals[2],
+                         elero_platform.POLL_INTERVAL_MOVING)
+
+    def test_cover_command_state(self):
+        """Testing the writing of the state after a command of a cover."""
+        cover = elero_component.EleroCover(
+            None, 'SIM', 'Cover', 7, 'roller shutter', ('up', 'down'))
+        cover.entity_id = 'cover.cover'
+        cover.async_write_ha_state = mock.Mock()
+        cover.schedule_update_ha_state = mock.Mock()
+        cover._transmitter = self.elero_transmitter
+        self.elero_transmitter._channel_callbacks[7] = cover.response_handler
+        # The state is written even if the Send is not acknowledged.
+        self.simulator.drop_rate = 1
+        asyncio.run(cover.async_close_cover())
+        self.assertEqual(cover.state, 'closing')
+        cover.async_write_ha_state.assert_called_once_with()
+        cover.schedule_update_ha_state.assert_not_called()
+
+    def test_send_group(self):
+        """Testing the send_group method with a multi-channel Easy Ack."""
+        self.set_channel(1)
+        self.set_channel(7)
+        self.elero_transmitter.send_group((1, 7), elero_platform.PAYLOAD_DOWN)
+        self.assertEqual(self.simulator.commands, 2)
+        self.assertEqual([ch for ch, _ in self.responses], [1, 7])
+        self.assertIs(self.responses[0][1], self.responses[1][1])
+
+    def test_retry(self):
+        """Testing the repeating of the dropped commands."""
+        self.set_channel(1)
+        self.simulator.drop_rate = 0.5
+        for _ in range(10):
+            self.elero_transmitter.up(1)
+        metrics = self.elero_transmitter.get_metrics()
+        timeouts = metrics.get_summary(elero_platform.METRIC_TIMEOUTS)
+        self.assertEqual(timeouts, self.simulator.dropped_commands)
+        self.assertEqual(
+            metrics.get_summary(elero_platform.METRIC_RETRIES, 1),
+            timeouts - metrics.get_summary(elero_platform.METRIC_FAILURES))
+
+    def test_retry_backoff(self):
+        """Testing the serving of the other requests during a backoff."""
+        self.set_channel(1)
+        self.set_channel(2)
+        self.simulator.drop_rate = 1
+        with mock.patch.object(elero_platform, 'RETRY_BACKOFF', 1), \
+                mock.patch.object(elero_platform, 'RETRY_BACKOFF_MAX', 1):
+            threads = self.start_threads(self.elero_transmitter.info, (2,))
+            # The failed Info waits for its retry out of the queue.
+            self.wait_until(
+                lambda: len(self.elero_transmitter.get_exchanges()) == 2)
+            self.wait_pending(1)
+            self.simulator.drop_rate = 0
+            started = time.monotonic()
+            self.elero_transmitter.up(1)
+            self.assertLess(time.monotonic() - started, 0.3)
+            self.assertEqual(threads[0].is_alive(), True)
+            threads[0].join(5)
+        metrics = self.elero_transmitter.get_metrics()
+        self.assertEqual(
+            metrics.get_summary(elero_platform.METRIC_RETRIES, 2), 1)
+        self.assertEqual(self.get_commands(),
+                         ['aa044e000202', 'aa054c000120e4', 'aa044e000202'])
+
+    def test_retry_superseded(self):
+        """Testing the dropping of a repeated command of a later moved channel."""
+        self.set_channel(2)
+        self.simulator.drop_rate = 1
+        self.elero_transmitter._attempts[elero_platform.COMMAND_SEND] = 2
+        with mock.patch.object(elero_platform, 'RETRY_BACKOFF', 1), \
+                mock.patch.object(elero_platform, 'RETRY_BACKOFF_MAX', 1):
+            threads = self.start_threads(self.elero_transmitter.up, (2,))
+            self.wait_until(
+                lambda: len(self.elero_transmitter.get_exchanges()) == 2)
+            self.wait_pending(1)
+            self.elero_transmitter.stop(2)
+            threads[0].join(5)
+        # The Up is not repeated after the Stop.
+        self.assertEqual(self.get_commands(),
+                         ['aa054c000220e3', 'aa054c000210f3', 'aa054c000210f3'])
+
+    def test_metrics(self):
+        """Testing the metrics of the exchanges."""
+        self.set_channel(1)
+        self.set_channel(2)
+        self.elero_transmitter.send_group((1, 2), elero_platform.PAYLOAD_UP)
+        metrics = self.elero_transmitter.get_metrics()
+        self.assertEqual(metrics.get_summary(elero_platform.METRIC_RTT)['count'], 2)
+        self.assertEqual(
+            metrics.get_summary(elero_platform.METRIC_RTT, 2)['count'], 1)
+        self.assertEqual(metrics.get_channels(elero_platform.METRIC_ATTEMPTS),
+                         [1, 2])
+        self.assertEqual(metrics.get_summary(elero_platform.METRIC_TIMEOUTS), 0)
+        lines = metrics.get_prometheus_lines(elero_platform.METRIC_RTT, 'SIM')
+        self.assertIn('elero_rtt_seconds_count{transmitter="SIM",channel="1"} 1',
+                      lines)
+
+    def test_corrupted_frame(self):
+        """Testing the metrics of a corrupted response."""
+        self.set_channel(7)
+        # A response with a wrong checksum is in the stream.
+        self.elero_transmitter._serial._EleroSimulatorSerial__receive(
+            b'\xAA\x05\x4D\x00\x40\x02\xC3')
+        self.elero_transmitter.info(7)
+        self.assertEqual(self.responses[-1][1].state,
+                         elero_platform.INFO_TOP_POSITION_STOP)
+        metrics = self.elero_transmitter.get_metrics()
+        self.assertEqual(
+            metrics.get_summary(elero_platform.METRIC_REJECTED_FRAMES), 1)
+        self.assertEqual(
+            metrics.get_summary(elero_platform.METRIC_DROPPED_BYTES), 7)
+        self.assertEqual(metrics.get_summary(elero_platform.METRIC_GARBAGE), 1)
+        lines = metrics.get_prometheus_lines(
+            elero_platform.METRIC_REJECTED_FRAMES, 'SIM')
         self.assertEqual(
-            self.elero_device._parse_response(ser_resp), None)
+            lines,
+            ['elero_rejected_frames_total{transmitter="SIM",channel="all"} 1'])
+
+    def test_stale_header(self):
+        """Testing the skipping of a stale header before the response."""
+        self.set_channel(7)
+        self.elero_transmitter._serial._EleroSimulatorSerial__receive(b'\xAA')
+        self.elero_transmitter.up(7)
+        exchanges = self.elero_transmitter.get_exchanges()[1:]
+        self.assertEqual([(e['command'], e['error']) for e in exchanges],
+                         [('aa054c004020a5', None)])
+        self.assertEqual(self.simulator.commands, 2)
+        self.assertEqual(self.elero_transmitter._serial.in_waiting, 0)
+        metrics = self.elero_transmitter.get_metrics()
         self.assertEqual(
-            self.elero_device._response['bytes'], ser_resp)
-        self.assertEqual(self.elero_device._response['header'], 170)
-        self.assertEqual(self.elero_device._response['length'], 5)
-        self.assertEqual(self.elero_device._response['command'], 77)
-        self.assertEqual(self.elero_device._response['ch_h'], ())
-        self.assertEqual(self.elero_device._response['ch_l'], (7,))
-        self.assertEqual(self.elero_device._response['chs'], {7})
-        self.assertEqual(self.elero_device._response['status'],
-                         elero_platform.INFO_NO_INFORMATION)
-        self.assertEqual(self.elero_device._response['cs'], 196)
+            metrics.get_summary(elero_platform.METRIC_REJECTED_FRAMES), 1)
+        self.assertEqual(
+            metrics.get_summary(elero_platform.METRIC_DROPPED_BYTES), 1)
+
+    def test_response_deadline(self):
+        """Testing the deadline of an exchange with a partial frame."""
+        self.set_channel(11)
+        self.simulator.drop_rate = 1
+        # The header of a frame arrives shortly before the deadline.
+        timer = threading.Timer(
+            0.4, self.elero_transmitter._serial._EleroSimulatorSerial__receive,
+            (b'\xAA\x05',))
+        timer.start()
+        self.elero_transmitter.info(11)
+        exchange = self.elero_transmitter.get_exchanges()[1]
+        self.assertEqual(exchange['error'], 'timeout')
+        self.assertLess(exchange['duration_ms'], 600)
+
+    def test_response_timeout(self):
+        """Testing that a buffered response does not reconfigure the port."""
+        self.set_channel(11)
+        self.simulator.latency = 0.2
+        with mock.patch.object(
+                elero_simulator.EleroSimulatorSerial, 'timeout',
+                new_callable=mock.PropertyMock, return_value=0.5,
+                create=True) as timeout:
+            self.elero_transmitter.info(11)
+        self.assertEqual(self.responses[-1][0], 11)
+        self.assertEqual(
+            [c for c in timeout.call_args_list if c != mock.call()], [])
+
+    def test_exchanges(self):
+        """Testing the log of the last exchanges."""
+        self.set_channel(7)
+        self.simulator.drop_rate = 1
+        self.elero_transmitter.down(7)
+        exchanges = self.elero_transmitter.get_exchanges()
+        self.assertEqual(exchanges[0]['command'], 'aa024a0a')
+        self.assertEqual(exchanges[0]['response'], 'aa044b0447bc')
+        self.assertEqual(exchanges[0]['error'], None)
+        self.assertEqual([e['attempt'] for e in exchanges[1:]], [1, 2, 3, 4])
+        self.assertEqual({e['error'] for e in exchanges[1:]}, {'timeout'})
+        self.assertEqual({e['response'] for e in exchanges[1:]}, {None})
+
+    def test_reopen_replaced_port(self):
+        """Testing the keeping of a port which replaced the failed one."""
+        failed = self.elero_transmitter._serial
+        replaced = elero_simulator.EleroSimulatorSerial(self.simulator)
+        self.elero_transmitter._serial = replaced
+        self.elero_transmitter._EleroTransmitter__reopen_serial_port(failed)
+        self.assertIs(self.elero_transmitter._serial, replaced)
+        self.assertEqual(replaced.is_open, True)
+
+    def test_circuit_breaker(self):
+        """Testing the breaker of an unreachable channel."""
+        self.set_channel(3)
+        for _ in range(elero_platform.BREAKER_FAILURES):
+            self.assertEqual(
+                self.elero_transmitter.is_channel_available(3), True)
+            self.elero_transmitter.up(3)
+        self.assertEqual(self.elero_transmitter.is_channel_available(3), False)
+        self.assertEqual(self.responses[-2], (3, None))
+        commands = self.simulator.commands
+        self.elero_transmitter.info(3)
+        self.assertEqual(self.simulator.commands, commands)
+
+
+class EleroUnpluggableSerial(elero_simulator.EleroSimulatorSerial):
+    """Simulated port of a stick which fails while it is unplugged."""
+
+    def __init__(self, simulator, unplugged, **kwargs):
+        """Initialize an open port."""
+        super().__init__(simulator, **kwargs)
+        self._unplugged = unplugged
+
+    def write(self, data):
+        """Send the data to the simulated stick if it is plugged."""
+        if self._unplugged.is_set():
+            raise serial.serialutil.SerialException("The stick is unplugged.")
+        return super().write(data)
+
+
+class EleroTransmittersUnittest(unittest.TestCase):
+    """Unittest to the discovery of the Elero transmitters."""
 
-    def test_parse_response_unknown(self):
-        """Testing the parse_response method."""
-        # unknown info status - 7
-        ser_resp = b'\xAA\x05\x4D\x00\x40\x12\xb7'
-        self.assertEqual(self.elero_device._parse_response(ser_resp), None)
-        self.assertEqual(self.elero_device._response['bytes'], ser_resp)
-        self.assertEqual(self.elero_device._response['header'], 170)
-        self.assertEqual(self.elero_device._response['length'], 5)
-        self.assertEqual(self.elero_device._response['command'], 77)
-        self.assertEqual(self.elero_device._response['ch_h'], ())
-        self.assertEqual(self.elero_device._response['ch_l'], (7,))
-        self.assertEqual(self.elero_device._response['chs'], {7})
-        self.assertEqual(self.elero_device._response['status'],
-                         elero_platform.INFO_UNKNOWN)
-        self.assertEqual(self.elero_device._response['cs'], 183)
-
-    def test_parse_response_else(self):
-        """Testing the parse_response method."""
-        # main else
-        ser_resp = b'\xAA\xAA\xAA\x00\x00\xAA\xAA\xAA\xAA'
-        self.assertEqual(self.elero_device._parse_response(ser_resp), None)
-        self.assertEqual(self.elero_device._response['bytes'], ser_resp)
-        self.assertEqual(self.elero_device._response['header'], 170)
-        self.assertEqual(self.elero_device._response['length'], 170)
-        self.assertEqual(self.elero_device._response['command'], 170)
-        self.assertEqual(self.elero_device._response['ch_h'], ())
-        self.assertEqual(self.elero_device._response['ch_l'], ())
-        self.assertEqual(self.elero_device._response['chs'], set())
-        self.assertEqual(self.elero_device._response['status'],
-                         elero_platform.INFO_UNKNOWN)
-        self.assertEqual(self.elero_device._response['cs'], 170)
-
-    def test_calculate_checksum(self):
-        """Testing the _calculate_checksum method."""
-        # b'\xAA\x04\x4B\x00\x6F\x98'
-        self.assertEqual(self.elero_device._calculate_checksum(
-            0xAA, 0x04, 0x4B, 0x00, 0x6F), 0x98)
-        # b'\xAA\x05\x4D\x00\x40\x02\xC2'
-        self.assertEqual(self.elero_device._calculate_checksum(
-            0xAA, 0x05, 0x4D, 0x00, 0x40, 0x02), 0xC2)
-        # b'\xAA\x04\x4E\x00\x04\x00'
-        self.assertEqual(self.elero_device._calculate_checksum(
-            0xAA, 0x04, 0x4E, 0x00, 0x04), 0x00)
-        # b'\xAA\x04\x4E\x00\x10\xF4'
-        self.assertEqual(self.elero_device._calculate_checksum(
-            0xAA, 0x04, 0x4E, 0x00, 0x10), 0xF4)
-
-    def test_create_serial_data(self):
-        """Testing the _create_serial_data method."""
-        self.assertEqual(self.elero_device._create_serial_data(
-            [0xAA, 0x04, 0x4B, 0x00, 0x6F, 0x98]),
-            b'\xAA\x04\x4B\x00\x6F\x98')
-
-    def test_set_channel_bits(self):
-        """Testing the channel bit seting.
-
-        The the _set_upper_channel_bits and
-        the _set_lower_channel_bits method.
-        """
-        self.assertEqual(self.elero_device._set_upper_channel_bits(), 0x00)
-        self.assertEqual(self.elero_device._set_lower_channel_bits(), 0x01)
+    def setUp(self):
+        """Seting up the unittest with a configured local stick."""
+        self.simulator = elero_simulator.EleroSimulator((1, 2), latency=0.01)
+        self.unplugged = threading.Event()
+        patches = (
+            mock.patch.object(elero_platform.serial, 'Serial', self.open_port),
+            mock.patch.object(elero_platform.list_ports, 'comports',
+                              return_value=[]),
+            mock.patch.object(elero_platform, 'DISCOVERY_INTERVAL', 0.1),
+        )
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        self.elero_transmitters = elero_platform.EleroTransmitters([{
+            elero_platform.CONF_TRANSMITTER_SERIAL_NUMBER: 'SIM',
+            elero_platform.CONF_DEVICE_PATH: '/dev/ttySIM',
+            elero_platform.CONF_CHECK_TIMEOUT: 0.5,
+            elero_platform.CONF_SEND_TIMEOUT: 0.5,
+        }])
+        self.transmitters = []
+        self.elero_transmitters.subscribe('SIM', self.transmitters.append)
+
+    def tearDown(self):
+        """Stopping the discovery and closing the transmitters."""
+        self.elero_transmitters.stop()
+        self.elero_transmitters.close_transmitters()
+
+    def open_port(self, *args, **kwargs):
+        """Open the port of the simulated stick if it is plugged."""
+        if self.unplugged.is_set():
+            raise serial.serialutil.SerialException("The stick is unplugged.")
+        return EleroUnpluggableSerial(self.simulator, self.unplugged, **kwargs)
+
+    def wait_transmitter(self, count):
+        """Wait for the count of the attach and detach callbacks."""
+        deadline = time.monotonic() + 5
+        while (len(self.transmitters) < count
+               and time.monotonic() < deadline):
+            time.sleep(0.01)
+        self.assertEqual(len(self.transmitters), count)
+        return self.transmitters[-1]
+
+    def test_replug(self):
+        """Testing the attaching, the detaching and the reattaching."""
+        self.elero_transmitters.start()
+        transmitter = self.wait_transmitter(1)
+        self.assertEqual(transmitter.is_channel_learned(2), True)
+        self.unplugged.set()
+        transmitter.up(1)
+        self.assertEqual(transmitter.get_transmitter_state(), False)
+        self.assertEqual(self.wait_transmitter(2), None)
+        self.assertEqual(self.elero_transmitters.transmitters, {})
+        self.unplugged.clear()
+        replugged = self.wait_transmitter(3)
+        self.assertIsNot(replugged, transmitter)
+        self.assertEqual(replugged.get_transmitter_state(), True)
+        self.assertEqual(self.elero_transmitters.transmitters,
+                         {'SIM': replugged})
+
+
+class EleroRemoteTransmitterUnittest(unittest.TestCase):
+    """Unittest to the Elero remote transmitter with a simulated stick."""
 
-    def test_set_channel_bits_all(self):
-        """Testing the channel bit seting based on predefined channel.
+    def setUp(self):
+        """Seting up the unittest."""
+        self.simulator = elero_simulator.EleroSimulator(
+            (1, 5), latency=0.01)
+        self.server = elero_simulator.EleroSimulatorServer(self.simulator)
+        self.server.start()
+        self.elero_transmitter = elero_platform.EleroRemoteTransmitter(
+            'SIM', self.server.address, timeouts=TIMEOUTS)
+
+    def tearDown(self):
+        """Closing the transmitter and the simulator."""
+        self.elero_transmitter.close_serial()
+        self.server.stop()
+
+    def test_init_serial(self):
+        """Testing the init_serial method."""
+        self.elero_transmitter.init_serial()
+        self.assertEqual(self.elero_transmitter.get_transmitter_state(), True)
+        self.assertEqual(self.elero_transmitter.is_channel_learned(5), True)
+        self.assertEqual(self.elero_transmitter.is_channel_learned(2), False)
+
+    def test_info(self):
+        """Testing the info method."""
+        responses = []
+        self.elero_transmitter.init_serial()
+        self.elero_transmitter.set_channel(5, responses.append)
+        self.elero_transmitter.info(5)
+        self.assertEqual(responses[-1].state,
+                         elero_platform.INFO_TOP_POSITION_STOP)
 
-        The the _set_upper_channel_bits and
-        the _set_lower_channel_bits method.
-        """
-        self.elero_device._channels = (1,)
-        self.assertEqual(self.elero_device._set_upper_channel_bits(), 0x00)
-        self.assertEqual(self.elero_device._set_lower_channel_bits(), 0x01)
-        self.elero_device._channels = (2,)
-        self.assertEqual(self.elero_device._set_upper_channel_bits(), 0x00)
-        self.assertEqual(self.elero_device._set_lower_channel_bits(), 0x02)
-        self.elero_device._channels = (3,)
-        self.assertEqual(self.elero_device._set_upper_channel_bits(), 0x00)
-        self.assertEqual(self.elero_device._set_lower_channel_bits(), 0x04)
-        self.elero_device._channels = (4,)
-        self.assertEqual(self.elero_device._set_upper_channel_bits(), 0x00)
-        self.assertEqual(self.elero_device._set_lower_channel_bits(), 0x08)
-        self.elero_device._channels = (5,)
-        self.assertEqual(self.elero_device._set_upper_channel_bits(), 0x00)
-        self.assertEqual(self.elero_device._set_lower_channel_bits(), 0x10)
-        self.elero_device._channels = (6,)
-        self.assertEqual(self.elero_device._set_upper_channel_bits(), 0x00)
-        self.assertEqual(self.elero_device._set_lower_channel_bits(), 0x20)
-        self.elero_device._channels = (7,)
-        self.assertEqual(self.elero_device._set_upper_channel_bits(), 0x00)
-        self.assertEqual(self.elero_device._set_lower_channel_bits(), 0x40)
-        self.elero_device._channels = (8,)
-        self.assertEqual(self.elero_device._set_upper_channel_bits(), 0x00)
-        self.assertEqual(self.elero_device._set_lower_channel_bits(), 0x80)
-        self.elero_device._channels = (9,)
-        self.assertEqual(self.elero_device._set_upper_channel_bits(), 0x01)
-        self.assertEqual(self.elero_device._set_lower_channel_bits(), 0x00)
-        self.elero_device._channels = (10,)
-        self.assertEqual(self.elero_device._set_upper_channel_bits(), 0x02)
-        self.assertEqual(self.elero_device._set_lower_channel_bits(), 0x00)
-        self.elero_device._channels = (11,)
-        self.assertEqual(self.elero_device._set_upper_channel_bits(), 0x04)
-        self.assertEqual(self.elero_device._set_lower_channel_bits(), 0x00)
-        self.elero_device._channels = (12,)
-        self.assertEqual(self.elero_device._set_upper_channel_bits(), 0x08)
-        self.assertEqual(self.elero_device._set_lower_channel_bits(), 0x00)
-        self.elero_device._channels = (13,)
-        self.assertEqual(self.elero_device._set_upper_channel_bits(), 0x10)
-        self.assertEqual(self.elero_device._set_lower_channel_bits(), 0x00)
-        self.elero_device._channels = (14,)
-        self.assertEqual(self.elero_device._set_upper_channel_bits(), 0x20)
-        self.assertEqual(self.elero_device._set_lower_channel_bits(), 0x00)
-        self.elero_device._channels = (15,)
-        self.assertEqual(self.elero_device._set_upper_channel_bits(), 0x40)
-        self.assertEqual(self.elero_device._set_lower_channel_bits(), 0x00)
-        self.elero_device._channels = (16,)
-        self.assertEqual(self.elero_device._set_upper_channel_bits(), 128)
-        self.assertEqual(self.elero_device._set_lower_channel_bits(), 0x00)
-
-    def test_get_learned_channels(self):
-        """Testing the _get_learned_channels method."""
-        self.assertEqual(self.elero_device._get_learned_channels(0x00),
-                         ())
-        self.assertEqual(self.elero_device._get_learned_channels(0x01),
-                         (1,))
-        self.assertEqual(self.elero_device._get_learned_channels(0x02),
-                         (2,))
-        self.assertEqual(self.elero_device._get_learned_channels(0x03),
-                         (1, 2))
-        self.assertEqual(self.elero_device._get_learned_channels(0x04),
-                         (3,))
-        self.assertEqual(self.elero_device._get_learned_channels(0x05),
-                         (1, 3))
-        self.assertEqual(self.elero_device._get_learned_channels(0x06),
-                         (2, 3))
-        self.assertEqual(self.elero_device._get_learned_channels(0x07),
-                         (1, 2, 3))
-        self.assertEqual(self.elero_device._get_learned_channels(0x08),
-                         (4,))
-        self.assertEqual(self.elero_device._get_learned_channels(0x09),
-                         (1, 4))
-        self.assertEqual(self.elero_device._get_learned_channels(0x0A),
-                         (2, 4))
-        self.assertEqual(self.elero_device._get_learned_channels(0x0B),
-                         (1, 2, 4))
-        self.assertEqual(self.elero_device._get_learned_channels(0x0C),
-                         (3, 4))
-        self.assertEqual(self.elero_device._get_learned_channels(0x0D),
-                         (1, 3, 4))
-        self.assertEqual(self.elero_device._get_learned_channels(0x0E),
-                         (2, 3, 4))
-        self.assertEqual(self.elero_device._get_learned_channels(0x0F),
-                         (1, 2, 3, 4))
-        self.assertEqual(self.elero_device._get_learned_channels(0x10),
-                         (5,))
-        self.assertEqual(self.elero_device._get_learned_channels(0x11),
-                         (1, 5))
-        self.assertEqual(self.elero_device._get_learned_channels(0x12),
-                         (2, 5))
-        self.assertEqual(self.elero_device._get_learned_channels(0x13),
-                         (1, 2, 5))
-        self.assertEqual(self.elero_device._get_learned_channels(0x14),
-                         (3, 5))
-        self.assertEqual(self.elero_device._get_learned_channels(0x15),
-                         (1, 3, 5))
-        self.assertEqual(self.elero_device._get_learned_channels(0x16),
-                         (2, 3, 5))
-        self.assertEqual(self.elero_device._get_learned_channels(0x17),
-                         (1, 2, 3, 5))
-        self.assertEqual(self.elero_device._get_learned_channels(0x18),
-                         (4, 5))
-        self.assertEqual(self.elero_device._get_learned_channels(0x19),
-                         (1, 4, 5))
-        self.assertEqual(self.elero_device._get_learned_channels(0x1A),
-                         (2, 4, 5))
-        self.assertEqual(self.elero_device._get_learned_channels(0x1B),
-                         (1, 2, 4, 5))
-        self.assertEqual(self.elero_device._get_learned_channels(0x1C),
-                         (3, 4, 5))
-        self.assertEqual(self.elero_device._get_learned_channels(0x1D),
-                         (1, 3, 4, 5))
-        self.assertEqual(self.elero_device._get_learned_channels(0x1E),
-                         (2, 3, 4, 5))
-        self.assertEqual(self.elero_device._get_learned_channels(0x1F),
-                         (1, 2, 3, 4, 5))
-        self.assertEqual(self.elero_device._get_learned_channels(0x20),
-                         (6,))
-        self.assertEqual(self.elero_device._get_learned_channels(0x21),
-                         (1, 6))
-        self.assertEqual(self.elero_device._get_learned_channels(0x22),
-                         (2, 6))
-        self.assertEqual(self.elero_device._get_learned_channels(0x23),
-                         (1, 2, 6))
-        self.assertEqual(self.elero_device._get_learned_channels(0x24),
-                         (3, 6))
-        self.assertEqual(self.elero_device._get_learned_channels(0x25),
-                         (1, 3, 6))
-        self.assertEqual(self.elero_device._get_learned_channels(0x26),
-                         (2, 3, 6))
-        self.assertEqual(self.elero_device._get_learned_channels(0x27),
-                         (1, 2, 3, 6))
-        self.assertEqual(self.elero_device._get_learned_channels(0x28),
-                         (4, 6))
-        self.assertEqual(self.elero_device._get_learned_channels(0x29),
-                         (1, 4, 6))
-        self.assertEqual(self.elero_device._get_learned_channels(0x2A),
-                         (2, 4, 6))
-        self.assertEqual(self.elero_device._get_learned_channels(0x2B),
-                         (1, 2, 4, 6))
-        self.assertEqual(self.elero_device._get_learned_channels(0x2C),
-                         (3, 4, 6))
-        self.assertEqual(self.elero_device._get_learned_channels(0x2D),
-                         (1, 3, 4, 6))
-        self.assertEqual(self.elero_device._get_learned_channels(0x2E),
-                         (2, 3, 4, 6))
-        self.assertEqual(self.elero_device._get_learned_channels(0x2F),
-                         (1, 2, 3, 4, 6))
-        self.assertEqual(self.elero_device._get_learned_channels(0x30),
-                         (5, 6))
-        self.assertEqual(self.elero_device._get_learned_channels(0x31),
-                         (1, 5, 6))
-        self.assertEqual(self.elero_device._get_learned_channels(0x32),
-                         (2, 5, 6))
-        self.assertEqual(self.elero_device._get_learned_channels(0x33),
-                         (1, 2, 5, 6))
-        self.assertEqual(self.elero_device._get_learned_channels(0x34),
-                         (3, 5, 6))
-        self.assertEqual(self.elero_device._get_learned_channels(0x35),
-                         (1, 3, 5, 6))
-        self.assertEqual(self.elero_device._get_learned_channels(0x36),
-                         (2, 3, 5, 6))
-        self.assertEqual(self.elero_device._get_learned_channels(0x37),
-                         (1, 2, 3, 5, 6))
-        self.assertEqual(self.elero_device._get_learned_channels(0x38),
-                         (4, 5, 6))
-        self.assertEqual(self.elero_device._get_learned_channels(0x39),
-                         (1, 4, 5, 6))
-        self.assertEqual(self.elero_device._get_learned_channels(0x3A),
-                         (2, 4, 5, 6))
-        self.assertEqual(self.elero_device._get_learned_channels(0x3B),
-                         (1, 2, 4, 5, 6))
-        self.assertEqual(self.elero_device._get_learned_channels(0x3C),
-                         (3, 4, 5, 6))
-        self.assertEqual(self.elero_device._get_learned_channels(0x3D),
-                         (1, 3, 4, 5, 6))
-        self.assertEqual(self.elero_device._get_learned_channels(0x3E),
-                         (2, 3, 4, 5, 6))
-        self.assertEqual(self.elero_device._get_learned_channels(0x3F),
-                         (1, 2, 3, 4, 5, 6))
-        self.assertEqual(self.elero_device._get_learned_channels(0x40),
-                         (7,))
-        self.assertEqual(self.elero_device._get_learned_channels(0x41),
-                         (1, 7))
-        self.assertEqual(self.elero_device._get_learned_channels(0x42),
-                         (2, 7))
-        self.assertEqual(self.elero_device._get_learned_channels(0x43),
-                         (1, 2, 7))
-        self.assertEqual(self.elero_device._get_learned_channels(0x44),
-                         (3, 7))
-        self.assertEqual(self.elero_device._get_learned_channels(0x45),
-                         (1, 3, 7))
-        self.assertEqual(self.elero_device._get_learned_channels(0x46),
-                         (2, 3, 7))
-        self.assertEqual(self.elero_device._get_learned_channels(0x47),
-                         (1, 2, 3, 7))
-        self.assertEqual(self.elero_device._get_learned_channels(0x48),
-                         (4, 7))
-        self.assertEqual(self.elero_device._get_learned_channels(0x49),
-                         (1, 4, 7))
-        self.assertEqual(self.elero_device._get_learned_channels(0x4A),
-                         (2, 4, 7))
-        self.assertEqual(self.elero_device._get_learned_channels(0x4B),
-                         (1, 2, 4, 7))
-        self.assertEqual(self.elero_device._get_learned_channels(0x4C),
-                         (3, 4, 7))
-        self.assertEqual(self.elero_device._get_learned_channels(0x4D),
-                         (1, 3, 4, 7))
-        self.assertEqual(self.elero_device._get_learned_channels(0x4E),
-                         (2, 3, 4, 7))
-        self.assertEqual(self.elero_device._get_learned_channels(0x4F),
-                         (1, 2, 3, 4, 7))
-        self.assertEqual(self.elero_device._get_learned_channels(0x50),
-                         (5, 7))
-        self.assertEqual(self.elero_device._get_learned_channels(0x51),
-                         (1, 5, 7))
-        self.assertEqual(self.elero_device._get_learned_channels(0x52),
-                         (2, 5, 7))
-        self.assertEqual(self.elero_device._get_learned_channels(0x53),
-                         (1, 2, 5, 7))
-        self.assertEqual(self.elero_device._get_learned_channels(0x54),
-                         (3, 5, 7))
-        self.assertEqual(self.elero_device._get_learned_channels(0x55),
-                         (1, 3, 5, 7))
-        self.assertEqual(self.elero_device._get_learned_channels(0x56),
-                         (2, 3, 5, 7))
-        self.assertEqual(self.elero_device._get_learned_channels(0x57),
-                         (1, 2, 3, 5, 7))
-        self.assertEqual(self.elero_device._get_learned_channels(0x58),
-                         (4, 5, 7))
-        self.assertEqual(self.elero_device._get_learned_channels(0x59),
-                         (1, 4, 5, 7))
-        self.assertEqual(self.elero_device._get_learned_channels(0x5A),
-                         (2, 4, 5, 7))
-        self.assertEqual(self.elero_device._get_learned_channels(0x5B),
-                         (1, 2, 4, 5, 7))
-        self.assertEqual(self.elero_device._get_learned_channels(0x5C),
-                         (3, 4, 5, 7))
-        self.assertEqual(self.elero_device._get_learned_channels(0x5D),
-                         (1, 3, 4, 5, 7))
-        self.assertEqual(self.elero_device._get_learned_channels(0x5E),
-                         (2, 3, 4, 5, 7))
-        self.assertEqual(self.elero_device._get_learned_channels(0x5F),
-                         (1, 2, 3, 4, 5, 7))
-        self.assertEqual(self.elero_device._get_learned_channels(0x60),
-                         (6, 7))
-        self.assertEqual(self.elero_device._get_learned_channels(0x61),
-                         (1, 6, 7))
-        self.assertEqual(self.elero_device._get_learned_channels(0x62),
-                         (2, 6, 7))
-        self.assertEqual(self.elero_device._get_learned_channels(0x63),
-                         (1, 2, 6, 7))
-        self.assertEqual(self.elero_device._get_learned_channels(0x64),
-                         (3, 6, 7))
-        self.assertEqual(self.elero_device._get_learned_channels(0x65),
-                         (1, 3, 6, 7))
-        self.assertEqual(self.elero_device._get_learned_channels(0x66),
-                         (2, 3, 6, 7))
-        self.assertEqual(self.elero_device._get_learned_channels(0x67),
-                         (1, 2, 3, 6, 7))
-        self.assertEqual(self.elero_device._get_learned_channels(0x68),
-                         (4, 6, 7))
-        self.assertEqual(self.elero_device._get_learned_channels(0x69),
-                         (1, 4, 6, 7))
-        self.assertEqual(self.elero_device._get_learned_channels(0x6A),
-                         (2, 4, 6, 7))
-        self.assertEqual(self.elero_device._get_learned_channels(0x6B),
-                         (1, 2, 4, 6, 7))
-        self.assertEqual(self.elero_device._get_learned_channels(0x6C),
-                         (3, 4, 6, 7))
-        self.assertEqual(self.elero_device._get_learned_channels(0x6D),
-                         (1, 3, 4, 6, 7))
-        self.assertEqual(self.elero_device._get_learned_channels(0x6E),
-                         (2, 3, 4, 6, 7))
-        self.assertEqual(self.elero_device._get_learned_channels(0x6F),
-                         (1, 2, 3, 4, 6, 7))
-        self.assertEqual(self.elero_device._get_learned_channels(0x70),
-                         (5, 6, 7))
-        self.assertEqual(self.elero_device._get_learned_channels(0x71),
-                         (1, 5, 6, 7))
-        self.assertEqual(self.elero_device._get_learned_channels(0x72),
-                         (2, 5, 6, 7))
-        self.assertEqual(self.elero_device._get_learned_channels(0x73),
-                         (1, 2, 5, 6, 7))
-        self.assertEqual(self.elero_device._get_learned_channels(0x74),
-                         (3, 5, 6, 7))
-        self.assertEqual(self.elero_device._get_learned_channels(0x75),
-                         (1, 3, 5, 6, 7))
-        self.assertEqual(self.elero_device._get_learned_channels(0x76),
-                         (2, 3, 5, 6, 7))
-        self.assertEqual(self.elero_device._get_learned_channels(0x77),
-                         (1, 2, 3, 5, 6, 7))
-        self.assertEqual(self.elero_device._get_learned_channels(0x78),
-                         (4, 5, 6, 7))
-        self.assertEqual(self.elero_device._get_learned_channels(0x79),
-                         (1, 4, 5, 6, 7))
-        self.assertEqual(self.elero_device._get_learned_channels(0x7A),
-                         (2, 4, 5, 6, 7))
-        self.assertEqual(self.elero_device._get_learned_channels(0x7B),
-                         (1, 2, 4, 5, 6, 7))
-        self.assertEqual(self.elero_device._get_learned_channels(0x7C),
-                         (3, 4, 5, 6, 7))
-        self.assertEqual(self.elero_device._get_learned_channels(0x7D),
-                         (1, 3, 4, 5, 6, 7))
-        self.assertEqual(self.elero_device._get_learned_channels(0x7E),
-                         (2, 3, 4, 5, 6, 7))
-        self.assertEqual(self.elero_device._get_learned_channels(0x7F),
-                         (1, 2, 3, 4, 5, 6, 7))
-        self.assertEqual(self.elero_device._get_learned_channels(0x80),
-                         (8,))
-        self.assertEqual(self.elero_device._get_learned_channels(0x81),
-                         (1, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0x82),
-                         (2, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0x83),
-                         (1, 2, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0x84),
-                         (3, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0x85),
-                         (1, 3, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0x86),
-                         (2, 3, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0x87),
-                         (1, 2, 3, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0x88),
-                         (4, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0x89),
-                         (1, 4, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0x8A),
-                         (2, 4, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0x8B),
-                         (1, 2, 4, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0x8C),
-                         (3, 4, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0x8D),
-                         (1, 3, 4, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0x8E),
-                         (2, 3, 4, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0x8F),
-                         (1, 2, 3, 4, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0x90),
-                         (5, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0x91),
-                         (1, 5, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0x92),
-                         (2, 5, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0x93),
-                         (1, 2, 5, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0x94),
-                         (3, 5, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0x95),
-                         (1, 3, 5, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0x96),
-                         (2, 3, 5, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0x97),
-                         (1, 2, 3, 5, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0x98),
-                         (4, 5, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0x99),
-                         (1, 4, 5, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0x9A),
-                         (2, 4, 5, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0x9B),
-                         (1, 2, 4, 5, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0x9C),
-                         (3, 4, 5, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0x9D),
-                         (1, 3, 4, 5, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0x9E),
-                         (2, 3, 4, 5, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0x9F),
-                         (1, 2, 3, 4, 5, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xA0),
-                         (6, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xA1),
-                         (1, 6, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xA2),
-                         (2, 6, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xA3),
-                         (1, 2, 6, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xA4),
-                         (3, 6, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xA5),
-                         (1, 3, 6, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xA6),
-                         (2, 3, 6, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xA7),
-                         (1, 2, 3, 6, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xA8),
-                         (4, 6, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xA9),
-                         (1, 4, 6, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xAA),
-                         (2, 4, 6, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xAB),
-                         (1, 2, 4, 6, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xAC),
-                         (3, 4, 6, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xAD),
-                         (1, 3, 4, 6, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xAE),
-                         (2, 3, 4, 6, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xAF),
-                         (1, 2, 3, 4, 6, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xB0),
-                         (5, 6, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xB1),
-                         (1, 5, 6, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xB2),
-                         (2, 5, 6, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xB3),
-                         (1, 2, 5, 6, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xB4),
-                         (3, 5, 6, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xB5),
-                         (1, 3, 5, 6, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xB6),
-                         (2, 3, 5, 6, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xB7),
-                         (1, 2, 3, 5, 6, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xB8),
-                         (4, 5, 6, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xB9),
-                         (1, 4, 5, 6, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xBA),
-                         (2, 4, 5, 6, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xBB),
-                         (1, 2, 4, 5, 6, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xBC),
-                         (3, 4, 5, 6, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xBD),
-                         (1, 3, 4, 5, 6, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xBE),
-                         (2, 3, 4, 5, 6, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xBF),
-                         (1, 2, 3, 4, 5, 6, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xC0),
-                         (7, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xC1),
-                         (1, 7, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xC2),
-                         (2, 7, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xC3),
-                         (1, 2, 7, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xC4),
-                         (3, 7, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xC5),
-                         (1, 3, 7, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xC6),
-                         (2, 3, 7, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xC7),
-                         (1, 2, 3, 7, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xC8),
-                         (4, 7, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xC9),
-                         (1, 4, 7, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xCA),
-                         (2, 4, 7, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xCB),
-                         (1, 2, 4, 7, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xCC),
-                         (3, 4, 7, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xCD),
-                         (1, 3, 4, 7, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xCE),
-                         (2, 3, 4, 7, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xCF),
-                         (1, 2, 3, 4, 7, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xD0),
-                         (5, 7, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xD1),
-                         (1, 5, 7, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xD2),
-                         (2, 5, 7, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xD3),
-                         (1, 2, 5, 7, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xD4),
-                         (3, 5, 7, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xD5),
-                         (1, 3, 5, 7, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xD6),
-                         (2, 3, 5, 7, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xD7),
-                         (1, 2, 3, 5, 7, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xD8),
-                         (4, 5, 7, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xD9),
-                         (1, 4, 5, 7, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xDA),
-                         (2, 4, 5, 7, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xDB),
-                         (1, 2, 4, 5, 7, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xDC),
-                         (3, 4, 5, 7, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xDD),
-                         (1, 3, 4, 5, 7, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xDE),
-                         (2, 3, 4, 5, 7, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xDF),
-                         (1, 2, 3, 4, 5, 7, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xE0),
-                         (6, 7, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xE1),
-                         (1, 6, 7, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xE2),
-                         (2, 6, 7, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xE3),
-                         (1, 2, 6, 7, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xE4),
-                         (3, 6, 7, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xE5),
-                         (1, 3, 6, 7, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xE6),
-                         (2, 3, 6, 7, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xE7),
-                         (1, 2, 3, 6, 7, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xE8),
-                         (4, 6, 7, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xE9),
-                         (1, 4, 6, 7, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xEA),
-                         (2, 4, 6, 7, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xEB),
-                         (1, 2, 4, 6, 7, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xEC),
-                         (3, 4, 6, 7, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xED),
-                         (1, 3, 4, 6, 7, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xEE),
-                         (2, 3, 4, 6, 7, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xEF),
-                         (1, 2, 3, 4, 6, 7, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xF0),
-                         (5, 6, 7, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xF1),
-                         (1, 5, 6, 7, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xF2),
-                         (2, 5, 6, 7, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xF3),
-                         (1, 2, 5, 6, 7, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xF4),
-                         (3, 5, 6, 7, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xF5),
-                         (1, 3, 5, 6, 7, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xF6),
-                         (2, 3, 5, 6, 7, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xF7),
-                         (1, 2, 3, 5, 6, 7, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xF8),
-                         (4, 5, 6, 7, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xF9),
-                         (1, 4, 5, 6, 7, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xFA),
-                         (2, 4, 5, 6, 7, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xFB),
-                         (1, 2, 4, 5, 6, 7, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xFC),
-                         (3, 4, 5, 6, 7, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xFD),
-                         (1, 3, 4, 5, 6, 7, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xFE),
-                         (2, 3, 4, 5, 6, 7, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0xFF),
-                         (1, 2, 3, 4, 5, 6, 7, 8))
-        self.assertEqual(self.elero_device._get_learned_channels(0x100),
-                         (9,))
-        self.assertEqual(self.elero_device._get_learned_channels(0x300),
-                         (9, 10))
-        self.assertEqual(self.elero_device._get_learned_channels(0x400),
-                         (11,))
-        self.assertEqual(self.elero_device._get_learned_channels(0x401),
-                         (1, 11))
-
-    def test_get_upper_channel_bits(self):
-        """Testing the _create_serial_data method."""
-        # ch: 1
-        resp = b'\xaa\x04N\x00\x01\x02'
-        self.assertEqual(self.elero_device._get_upper_channel_bits(
-            resp[3]), ())
-        self.assertEqual(self.elero_device._get_lower_channel_bits(
-            resp[4]), (1, ))
-        # ch: 10
-        resp = b'\xaa\x04N\x02\x00\x02'
-        self.assertEqual(self.elero_device._get_upper_channel_bits(
-            resp[3]), (10,))
-        self.assertEqual(self.elero_device._get_lower_channel_bits(
-            resp[4]), ())
-        # ch: 12
-        resp = b'\xaa\x05M\x08\x00\x01\xfb'
-        self.assertEqual(self.elero_device._get_upper_channel_bits(
-            resp[3]), (12,))
-        self.assertEqual(self.elero_device._get_lower_channel_bits(
-            resp[4]), ())
-        # ch: 13
-        resp = b'\xaa\x05M\x10\x00\x01\xf3'
-        self.assertEqual(self.elero_device._get_upper_channel_bits(
-            resp[3]), (13,))
-        self.assertEqual(self.elero_device._get_lower_channel_bits(
-            resp[4]), ())
-
-    def test_verify_channel_same(self):
-        """Testing the _create_serial_data method."""
-        self.test_parse_response_easy_info_1()
-        self.assertEqual(self.elero_device._verify_channels(), True)
-
-    def test_verify_channel_not_same(self):
-        """Testing the _create_serial_data method."""
-        self.test_parse_response_easy_info_7()
-        self.assertEqual(self.elero_device._verify_channels(), False)
+    def test_reconnect(self):
+        """Testing the reconnection of a dropped connection."""
+        responses = []
+        self.elero_transmitter.init_serial()
+        self.elero_transmitter.set_channel(1, responses.append)
+        self.server.drop_connections()
+        # The command is repeated after the reconnection in the background.
+        self.elero_transmitter.up(1)
+        self.assertIn(None, responses)
+        self.assertEqual(responses[-1].state,
+                         elero_platform.INFO_TOP_POSITION_STOP)
+        self.assertEqual(self.elero_transmitter.get_transmitter_state(), True)
+        self.assertEqual(self.elero_transmitter.is_channel_available(1), True)
+        metrics = self.elero_transmitter.get_metrics()
+        self.assertEqual(
+            metrics.get_summary(elero_platform.METRIC_DISCONNECTS, 1), 1)
+        lines = metrics.get_prometheus_lines(
+            elero_platform.METRIC_DISCONNECTS, 'SIM')
+        self.assertIn(
+            'elero_disconnects_total{transmitter="SIM",channel="1"} 1', lines)
+
+
+    def test_reconnect_notify(self):
+        """Testing the notifications of a lost and a restored connection."""
+        responses = []
+        self.elero_transmitter.init_serial()
+        self.elero_transmitter.set_channel(1, responses.append)
+        host, port = self.server.server_address[:2]
+        with mock.patch.object(elero_platform, 'REMOTE_RECONNECT_MIN', 0.05), \
+                mock.patch.object(elero_platform, 'REMOTE_RECONNECT_MAX', 0.1):
+            self.server.stop()
+            # Every attempt of the command and of the reconnection fails.
+            self.elero_transmitter.up(1)
+            time.sleep(0.3)
+            self.assertEqual(responses, [None])
+            self.assertEqual(
+                self.elero_transmitter.is_channel_available(1), False)
+            self.server = elero_simulator.EleroSimulatorServer(
+                self.simulator, host, port)
+            self.server.start()
+            deadline = time.monotonic() + 5
+            while (not self.elero_transmitter.is_channel_available(1)
+                   and time.monotonic() < deadline):
+                time.sleep(0.01)
+        time.sleep(0.1)
+        self.assertEqual(responses, [None, None])
+        self.assertEqual(self.elero_transmitter.is_channel_available(1), True)
 
 
 if __name__ == '__main__':
@@ -8,10 +8,25 @@ import homeassistant.helpers.config_validation as cv
 import serial
 import voluptuous as vol
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import discovery
+from homeassistant.helpers.json import save_json
+from homeassistant.util.json import load_json
 from serial.tools import list_ports
 
+import asyncio
+import bisect
+import collections
+import concurrent.futures
+import copy
+import datetime
+import itertools
 import os
+import queue
+import random
+import socket
 import threading
+import time
 
 # Python libraries/modules that you would normally install for your component.
 REQUIREMENTS = ["pyserial>=3.4"]
@@ -24,6 +39,12 @@ _LOGGER = logging.getLogger(__name__)
 # values to bit shift.
 BIT_8 = 8
 
+# The consecutive failed commands of a channel which open its breaker, so
+# the channel is not polled and its cover is unavailable.
+BREAKER_FAILURES = 3
+# Seconds between the probes of a channel with open breaker.
+BREAKER_COOLDOWN = 120
+
 # Header for all command.
 BYTE_HEADER = 0xAA
 
@@ -32,6 +53,26 @@ BYTE_LENGTH_2 = 0x02
 BYTE_LENGTH_4 = 0x04
 BYTE_LENGTH_5 = 0x05
 
+# The valid values of the length byte of a frame, the frame is two bytes
+# longer: header and length.
+FRAME_LENGTHS = (BYTE_LENGTH_2, BYTE_LENGTH_4, BYTE_LENGTH_5)
+
+# The channel numbers of a transmitter.
+CHANNELS = range(1, 16)
+
+# The channel numbers of the set bits of the channel bytes by byte value.
+LOWER_BYTE_CHANNELS = tuple(
+    tuple(i + 1 for i in range(BIT_8) if (byt >> i) & 1) for byt in range(256)
+)
+UPPER_BYTE_CHANNELS = tuple(
+    tuple(i + 9 for i in range(BIT_8) if (byt >> i) & 1) for byt in range(256)
+)
+
+# The file of the persistent channel cache in the config folder.
+CHANNEL_CACHE_FILE = "elero_channels.json"
+# Seconds to collect the changes of the channel cache before saving it.
+CHANNEL_CACHE_SAVE_DELAY = 10
+
 # Configs to the serial connection.
 CONF_BAUDRATE = "baudrate"
 CONF_BYTESIZE = "bytesize"
@@ -39,6 +80,14 @@ CONF_PARITY = "parity"
 CONF_STOPBITS = "stopbits"
 CONF_TRANSMITTER_SERIAL_NUMBER = "serial_number"
 CONF_DEVICE_PATH = "device_path"
+CONF_GROUP_COMMANDS = "group_commands"
+CONF_CHECK_ATTEMPTS = "check_attempts"
+CONF_INFO_ATTEMPTS = "info_attempts"
+CONF_SEND_ATTEMPTS = "send_attempts"
+CONF_CHECK_TIMEOUT = "check_timeout"
+CONF_INFO_TIMEOUT = "info_timeout"
+CONF_SEND_TIMEOUT = "send_timeout"
+CONF_WRITE_TIMEOUT = "write_timeout"
 CONF_TRANSMITTERS = "transmitters"
 CONF_REMOTE_TRANSMITTERS = "remote_transmitters"
 CONF_REMOTE_TRANSMITTERS_ADDRESS = "address"
@@ -50,6 +99,33 @@ COMMAND_INFO = 0x4E
 COMMAND_INFO_TEXT = "Info"
 COMMAND_SEND = 0x4C
 
+# Easy responses.
+RESPONSE_ACK = 0x4D
+RESPONSE_CONFIRM = 0x4B
+
+# The response command of the Easy commands.
+RESPONSE_COMMANDS = {
+    COMMAND_CHECK: RESPONSE_CONFIRM,
+    COMMAND_INFO: RESPONSE_ACK,
+    COMMAND_SEND: RESPONSE_ACK,
+}
+
+# The attempts of the commands. A missing Info response is repaired by the
+# next poll, so it is not worth to hold the stick for long.
+DEFAULT_CHECK_ATTEMPTS = 4
+DEFAULT_INFO_ATTEMPTS = 2
+DEFAULT_SEND_ATTEMPTS = 4
+
+# Seconds to wait for the response of the commands. The Easy Confirm should
+# arrive with in 1 second and the Easy Act with in 4 seconds, plus margin.
+# A silent receiver holds the stick for every attempt of its poll, so the
+# Info waits less, its answer mostly comes with in 1-2 seconds.
+DEFAULT_CHECK_TIMEOUT = 1.5
+DEFAULT_INFO_TIMEOUT = 2.5
+DEFAULT_SEND_TIMEOUT = 4.5
+# Seconds to wait for writing a command to the serial port.
+DEFAULT_WRITE_TIMEOUT = 2
+
 # Default serial info.
 DEFAULT_BRAND = "elero"
 DEFAULT_PRODUCT = "Transmitter Stick"
@@ -60,6 +136,111 @@ DEFAULT_BYTESIZE = serial.EIGHTBITS
 DEFAULT_PARITY = serial.PARITY_NONE
 DEFAULT_STOPBITS = serial.STOPBITS_ONE
 
+# Seconds to wait for the transmitters at the discovery.
+DISCOVERY_TIMEOUT = 15
+# Seconds between the searches of the missing transmitters.
+DISCOVERY_INTERVAL = 60
+
+# Merge the concurrent Send commands into one multi-channel frame.
+DEFAULT_GROUP_COMMANDS = False
+# Seconds to collect the channels of a group command before sending it.
+GROUP_COMMAND_WINDOW = 0.1
+# Seconds a blocking read may run past the deadline of an exchange. The
+# timeout of the port is only lowered beyond it, as every change of the
+# timeout reconfigures the port.
+DEADLINE_TOLERANCE = 0.1
+
+# Services.
+SERVICE_DUMP_EXCHANGES = "dump_exchanges"
+SERVICE_DUMP_METRICS = "dump_metrics"
+
+# The kinds of the failed exchanges.
+ERROR_DISCONNECT = "disconnect"
+ERROR_GARBAGE = "garbage"
+ERROR_TIMEOUT = "timeout"
+
+# The upper bounds of the buckets of the histograms of the durations in
+# seconds and of the attempts of the commands.
+HISTOGRAM_BUCKETS_ATTEMPTS = (1, 2, 3, 4, 6, 8)
+HISTOGRAM_BUCKETS_SECONDS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5)
+# The count of the recent samples of a histogram for its percentiles.
+HISTOGRAM_WINDOW = 256
+
+# The metrics of the transmitters.
+METRIC_ATTEMPTS = "attempts"
+METRIC_DISCONNECTS = "disconnects"
+METRIC_DROPPED_BYTES = "dropped_bytes"
+METRIC_FAILURES = "failures"
+METRIC_GARBAGE = "garbage"
+METRIC_LOCK_WAIT = "lock_wait"
+METRIC_QUEUE_WAIT = "queue_wait"
+METRIC_REJECTED_FRAMES = "rejected_frames"
+METRIC_RETRIES = "retries"
+METRIC_RTT = "rtt"
+METRIC_TIMEOUTS = "timeouts"
+
+# The Prometheus name, help and the buckets of the metrics, the metrics
+# without buckets are counters.
+METRICS = {
+    METRIC_ATTEMPTS: (
+        "elero_attempts", "The attempts of the commands.",
+        HISTOGRAM_BUCKETS_ATTEMPTS,
+    ),
+    METRIC_LOCK_WAIT: (
+        "elero_lock_wait_seconds", "The wait for the serial port.",
+        HISTOGRAM_BUCKETS_SECONDS,
+    ),
+    METRIC_QUEUE_WAIT: (
+        "elero_queue_wait_seconds", "The wait of the commands in the queue.",
+        HISTOGRAM_BUCKETS_SECONDS,
+    ),
+    METRIC_RTT: (
+        "elero_rtt_seconds", "The round trip time of the commands.",
+        HISTOGRAM_BUCKETS_SECONDS,
+    ),
+    METRIC_TIMEOUTS: (
+        "elero_timeouts_total", "The missing responses of the commands.", None,
+    ),
+    METRIC_GARBAGE: (
+        "elero_garbage_total",
+        "The corrupted or incomplete responses of the commands.", None,
+    ),
+    METRIC_DISCONNECTS: (
+        "elero_disconnects_total",
+        "The attempts of the commands which lost the serial port.", None,
+    ),
+    METRIC_RETRIES: (
+        "elero_retries_total", "The repeated attempts of the commands.", None,
+    ),
+    METRIC_FAILURES: (
+        "elero_failures_total",
+        "The commands which failed after all of their attempts.", None,
+    ),
+    METRIC_REJECTED_FRAMES: (
+        "elero_rejected_frames_total",
+        "The received frames with invalid length or checksum.", None,
+    ),
+    METRIC_DROPPED_BYTES: (
+        "elero_dropped_bytes_total",
+        "The received bytes which are not part of a valid frame.", None,
+    ),
+}
+
+# The counters of the kinds of the failed exchanges.
+ERROR_METRICS = {
+    ERROR_DISCONNECT: METRIC_DISCONNECTS,
+    ERROR_GARBAGE: METRIC_GARBAGE,
+    ERROR_TIMEOUT: METRIC_TIMEOUTS,
+}
+
+# The file of the Prometheus text dump of the metrics in the config folder.
+METRICS_FILE = "elero_metrics.prom"
+
+# The count of the last exchanges of a transmitter kept for diagnostics.
+EXCHANGE_LOG_SIZE = 100
+# The file of the dump of the last exchanges in the config folder.
+EXCHANGE_LOG_FILE = "elero_exchanges.json"
+
 # The domain of your component. Equal to the filename of your component.
 DOMAIN = "elero"
 
@@ -89,6 +270,13 @@ INFO_TOP_POSITION_STOP = "top position stop"
 INFO_TOP_POS_STOP_WICH_TILT_POS = "top position stop wich is tilt position"
 INFO_UNKNOWN = "unknown response"
 
+INFO_MOVING = (
+    INFO_MOVING_DOWN,
+    INFO_MOVING_UP,
+    INFO_START_TO_MOVE_DOWN,
+    INFO_START_TO_MOVE_UP,
+)
+
 INFO = {
     0x00: INFO_NO_INFORMATION,
     0x01: INFO_TOP_POSITION_STOP,
@@ -109,6 +297,22 @@ INFO = {
     0x11: INFO_SWITCHING_DEVICE_SWITCHED_ON,
 }
 
+# Seconds while a response of a channel makes its Info poll redundant.
+INFO_CACHE_MAX_AGE = 5
+
+# Seconds between the Info polls of a moving channel.
+POLL_INTERVAL_MOVING = 1
+# Seconds between the Info polls of a channel in a stable state. It is
+# doubled after every poll up to the max while the state does not change.
+POLL_INTERVAL_MIN = 15
+POLL_INTERVAL_MAX = 300
+
+# Priorities of the queued commands, the lower is served first.
+PRIORITY_SEND = 0
+PRIORITY_CHECK = 1
+PRIORITY_INFO = 2
+PRIORITY_SHUTDOWN = 3
+
 # Playloads to send.
 PAYLOAD_DOWN = 0x40
 PAYLOAD_DOWN_TEXT = "Down"
@@ -121,11 +325,65 @@ PAYLOAD_UP_TEXT = "Up"
 PAYLOAD_VENTILATION_POS_TILTING = 0x24
 PAYLOAD_VENTILATION_POS_TILTING_TEXT = "Tilt/ventilation"
 
+PAYLOAD_TEXT = {
+    PAYLOAD_DOWN: PAYLOAD_DOWN_TEXT,
+    PAYLOAD_INTERMEDIATE_POS: PAYLOAD_INTERMEDIATE_POS_TEXT,
+    PAYLOAD_STOP: PAYLOAD_STOP_TEXT,
+    PAYLOAD_UP: PAYLOAD_UP_TEXT,
+    PAYLOAD_VENTILATION_POS_TILTING: PAYLOAD_VENTILATION_POS_TILTING_TEXT,
+}
+
+# The TCP keepalive of the remote transmitters: seconds of idle before the
+# first probe, seconds between the probes and the count of the lost probes.
+REMOTE_KEEPALIVE_COUNT = 3
+REMOTE_KEEPALIVE_IDLE = 30
+REMOTE_KEEPALIVE_INTERVAL = 10
+# Seconds of idle after which the connection of a remote transmitter is
+# probed by an Easy Check.
+REMOTE_PROBE_INTERVAL = 60
+# Seconds between the reconnect attempts of a remote transmitter, doubled
+# after every failed attempt up to the max.
+REMOTE_RECONNECT_MIN = 1
+REMOTE_RECONNECT_MAX = 60
+
 # Easy response lengths.
 RESPONSE_LENGTH_CHECK = 6
 RESPONSE_LENGTH_INFO = 7
 RESPONSE_LENGTH_SEND = 7
 
+# Seconds of the backoff before the second attempt of a command, it is
+# doubled by every further attempt up to the max and jittered.
+RETRY_BACKOFF = 0.1
+RETRY_BACKOFF_MAX = 2
+
+# The options of the commands of the local and the remote transmitters.
+ELERO_COMMAND_OPTIONS = {
+    vol.Optional(
+        CONF_GROUP_COMMANDS, default=DEFAULT_GROUP_COMMANDS
+    ): cv.boolean,
+    vol.Optional(
+        CONF_CHECK_ATTEMPTS, default=DEFAULT_CHECK_ATTEMPTS
+    ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+    vol.Optional(
+        CONF_INFO_ATTEMPTS, default=DEFAULT_INFO_ATTEMPTS
+    ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+    vol.Optional(
+        CONF_SEND_ATTEMPTS, default=DEFAULT_SEND_ATTEMPTS
+    ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+    vol.Optional(
+        CONF_CHECK_TIMEOUT, default=DEFAULT_CHECK_TIMEOUT
+    ): vol.All(vol.Coerce(float), vol.Range(min=0.1)),
+    vol.Optional(
+        CONF_INFO_TIMEOUT, default=DEFAULT_INFO_TIMEOUT
+    ): vol.All(vol.Coerce(float), vol.Range(min=0.1)),
+    vol.Optional(
+        CONF_SEND_TIMEOUT, default=DEFAULT_SEND_TIMEOUT
+    ): vol.All(vol.Coerce(float), vol.Range(min=0.1)),
+    vol.Optional(
+        CONF_WRITE_TIMEOUT, default=DEFAULT_WRITE_TIMEOUT
+    ): vol.All(vol.Coerce(float), vol.Range(min=0.1)),
+}
+
 ELERO_TRANSMITTER_SCHEMA = vol.Schema(
     {
         vol.Optional(CONF_TRANSMITTER_SERIAL_NUMBER): str,
@@ -134,13 +392,15 @@ ELERO_TRANSMITTER_SCHEMA = vol.Schema(
         vol.Optional(CONF_BYTESIZE, default=DEFAULT_BYTESIZE): cv.positive_int,
         vol.Optional(CONF_PARITY, default=DEFAULT_PARITY): str,
         vol.Optional(CONF_STOPBITS, default=DEFAULT_STOPBITS): cv.positive_int,
+        **ELERO_COMMAND_OPTIONS,
     }
 )
 
 ELERO_REMOTE_TRANSMITTER_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_TRANSMITTER_SERIAL_NUMBER): str,
-        vol.Required(CONF_REMOTE_TRANSMITTERS_ADDRESS): str
+        vol.Required(CONF_REMOTE_TRANSMITTERS_ADDRESS): str,
+        **ELERO_COMMAND_OPTIONS,
     }
 )
 
@@ -165,16 +425,42 @@ def setup(hass, config):
     transmitters_config = elero_config.get(CONF_TRANSMITTERS)
     remote_transmitters_config = elero_config.get(CONF_REMOTE_TRANSMITTERS)
 
-    ELERO_TRANSMITTERS = EleroTransmitters(transmitters_config)
-    ELERO_TRANSMITTERS.discover()
-    ELERO_TRANSMITTERS.connect_remote_transmitters(remote_transmitters_config)
+    # The transmitters are attached in the background as they come online,
+    # so a missing or a slow stick does not hold up the start of HA.
+    ELERO_TRANSMITTERS = EleroTransmitters(
+        transmitters_config,
+        remote_transmitters_config,
+        EleroChannelCache(hass.config.path(CHANNEL_CACHE_FILE)),
+    )
+    ELERO_TRANSMITTERS.start()
 
     def close_serial_ports(event):
         """Close the serial port."""
+        ELERO_TRANSMITTERS.stop()
         ELERO_TRANSMITTERS.close_transmitters()
 
     hass.bus.listen_once(EVENT_HOMEASSISTANT_STOP, close_serial_ports)
 
+    def dump_metrics(call):
+        """Write the metrics of the transmitters in Prometheus text format."""
+        path = hass.config.path(METRICS_FILE)
+        with open(path, "w") as file:
+            file.write(ELERO_TRANSMITTERS.get_prometheus_metrics())
+        _LOGGER.info(f"The metrics of the transmitters are written to '{path}'.")
+
+    hass.services.register(DOMAIN, SERVICE_DUMP_METRICS, dump_metrics)
+
+    def dump_exchanges(call):
+        """Write the last exchanges of the transmitters as JSON."""
+        path = hass.config.path(EXCHANGE_LOG_FILE)
+        save_json(path, ELERO_TRANSMITTERS.get_exchanges())
+        _LOGGER.info(f"The last exchanges of the transmitters are written to '{path}'.")
+
+    hass.services.register(DOMAIN, SERVICE_DUMP_EXCHANGES, dump_exchanges)
+
+    # The diagnostic sensors of the transmitters.
+    discovery.load_platform(hass, "sensor", DOMAIN, {}, config)
+
     # Return boolean to indicate that initialization was successfully.
     return True
 
@@ -182,56 +468,155 @@ def setup(hass, config):
 class EleroTransmitters(object):
     """Container for the Elero Centero USB Transmitter Sticks."""
 
-    def __init__(self, config):
+    def __init__(self, config, remote_config=None, channel_cache=None):
         """Initialize the usb sticks."""
         self.config = config
+        self.remote_config = remote_config
+        self.channel_cache = channel_cache
         self.transmitters = {}
+        # The callbacks of the users of the transmitters by serial number
+        # and of the users of all of the attached transmitters.
+        self._subscribers = {}
+        self._attach_listeners = []
+        # The serial numbers of the given up but still running probes.
+        self._probing = set()
+        self._lock = threading.RLock()
+        self._stop_event = threading.Event()
         _LOGGER.info(f"Elero lib version: {__version__}")
 
+    def start(self):
+        """Attach the transmitters in the background.
+
+        The missing and the lost (e.g. unplugged) transmitters are searched
+        again in every DISCOVERY_INTERVAL.
+        """
+        threading.Thread(
+            target=self.__run, name="elero_discovery", daemon=True
+        ).start()
+
+    def stop(self):
+        """Stop the background discovery."""
+        self._stop_event.set()
+
+    def __run(self):
+        """Discover the transmitters until stopped."""
+        while not self._stop_event.is_set():
+            self.__detach_lost_transmitters()
+            self.discover()
+            self._stop_event.wait(DISCOVERY_INTERVAL)
+
+    def subscribe(self, serial_number, callback):
+        """Call back with the transmitter whenever it is attached or lost.
+
+        The callback gets the transmitter or None if it is lost.
+        """
+        with self._lock:
+            self._subscribers.setdefault(serial_number, []).append(callback)
+            transmitter = self.transmitters.get(serial_number)
+        if transmitter:
+            callback(transmitter)
+
+    def listen_attached(self, callback):
+        """Call back with the serial number and the transmitter whenever
+        any transmitter is attached, including the already attached ones.
+        """
+        with self._lock:
+            self._attach_listeners.append(callback)
+            transmitters = list(self.transmitters.items())
+        for serial_number, transmitter in transmitters:
+            callback(serial_number, transmitter)
+
+    def __notify(self, serial_number, transmitter):
+        """Call back the subscribers of the transmitter."""
+        for callback in self._subscribers.get(serial_number, []):
+            callback(transmitter)
+        if transmitter:
+            for callback in self._attach_listeners:
+                callback(serial_number, transmitter)
+
+    def __detach_lost_transmitters(self):
+        """Detach the transmitters which have lost their connection."""
+        with self._lock:
+            lost = [
+                serial_number
+                for serial_number, t in self.transmitters.items()
+                if not t.get_transmitter_state()
+            ]
+            for serial_number in lost:
+                _LOGGER.error(f"The '{serial_number}' transmitter is lost!")
+                transmitter = self.transmitters.pop(serial_number)
+                transmitter.close_serial()
+                self.__notify(serial_number, None)
+
+    def __is_known(self, serial_number):
+        """Return True if the transmitter is attached or being probed."""
+        with self._lock:
+            return (
+                serial_number in self.transmitters
+                or serial_number in self._probing
+            )
+
     def discover(self):
-        """Discover the local connected Elero Transmitter Sticks."""
+        """Discover the local connected and the remote Transmitter Sticks.
+
+        The ports are probed concurrently, so a missing or a slow stick
+        does not delay the others. The probes which do not finish until
+        the DISCOVERY_TIMEOUT are given up.
+        """
+        transmitters = self.__get_local_transmitters()
+        transmitters.extend(self.__get_remote_transmitters(self.remote_config))
+        self.__probe_transmitters(transmitters)
+
+    def __get_transmitter_configs(self):
+        """Return the transmitter configs by serial number."""
+        return {
+            c.get(CONF_TRANSMITTER_SERIAL_NUMBER): c for c in self.config or []
+        }
+
+    def __create_transmitter(self, device_path, serial_number, transmitter_config):
+        """Create a local transmitter with the config of the serial number."""
+        return EleroTransmitter(
+            device_path,
+            serial_number,
+            transmitter_config.get(CONF_BAUDRATE, DEFAULT_BAUDRATE),
+            transmitter_config.get(CONF_BYTESIZE, DEFAULT_BYTESIZE),
+            transmitter_config.get(CONF_PARITY, DEFAULT_PARITY),
+            transmitter_config.get(CONF_STOPBITS, DEFAULT_STOPBITS),
+            transmitter_config.get(CONF_GROUP_COMMANDS, DEFAULT_GROUP_COMMANDS),
+            self.channel_cache,
+            get_command_attempts(transmitter_config),
+            get_command_timeouts(transmitter_config),
+            transmitter_config.get(CONF_WRITE_TIMEOUT, DEFAULT_WRITE_TIMEOUT),
+        )
+
+    def __get_local_transmitters(self):
+        """Return the not yet connected local Elero Transmitter Sticks."""
+        transmitters = []
+        configs = self.__get_transmitter_configs()
+        device_paths = set()
 
         # First, handle manually configured devices
-        if self.config:
-            for transmitter_config in self.config:
-                device_path = transmitter_config.get(CONF_DEVICE_PATH)
-                serial_number = transmitter_config.get(CONF_TRANSMITTER_SERIAL_NUMBER)
-                
-                if device_path:
-                    # Manual device specification
-                    _LOGGER.info(
-                        f"Attempting to connect to manually specified device: "
-                        f"'{device_path}' with serial number: '{serial_number}'"
-                    )
-                    
-                    baudrate = transmitter_config.get(CONF_BAUDRATE, DEFAULT_BAUDRATE)
-                    bytesize = transmitter_config.get(CONF_BYTESIZE, DEFAULT_BYTESIZE)
-                    parity = transmitter_config.get(CONF_PARITY, DEFAULT_PARITY)
-                    stopbits = transmitter_config.get(CONF_STOPBITS, DEFAULT_STOPBITS)
-                    
-                    elero_transmitter = EleroTransmitter(
-                        device_path, serial_number, baudrate, bytesize, parity, stopbits
+        for serial_number, transmitter_config in configs.items():
+            device_path = transmitter_config.get(CONF_DEVICE_PATH)
+            if device_path:
+                device_paths.add(device_path)
+                if self.__is_known(serial_number):
+                    continue
+                # Manual device specification
+                _LOGGER.info(
+                    f"Attempting to connect to manually specified device: "
+                    f"'{device_path}' with serial number: '{serial_number}'"
+                )
+                transmitters.append(
+                    self.__create_transmitter(
+                        device_path, serial_number, transmitter_config
                     )
-                    elero_transmitter.init_serial()
-                    
-                    if elero_transmitter.get_transmitter_state():
-                        if serial_number not in self.transmitters:
-                            self.transmitters[serial_number] = elero_transmitter
-                            _LOGGER.info(
-                                f"Successfully connected to manually specified device: "
-                                f"'{device_path}' with serial number: '{serial_number}'"
-                            )
-                        else:
-                            _LOGGER.error(
-                                f"'{serial_number}' transmitter is already added!"
-                            )
-                    else:
-                        _LOGGER.error(
-                            f"Failed to connect to manually specified device: '{device_path}'"
-                        )
+                )
 
         # Then, handle automatic discovery for devices not manually configured
         for cp in list_ports.comports():
+            if cp.device in device_paths:
+                continue
             found_elero_stick = True if (
                 cp and cp.manufacturer
                 and DEFAULT_BRAND in cp.manufacturer
@@ -257,80 +642,430 @@ class EleroTransmitters(object):
                 # use discovered serial number
                 if found_elero_stick:
                     elero_serial_number = cp.serial_number
-                
+                if self.__is_known(elero_serial_number):
+                    continue
+
                 _LOGGER.info(
                     f"Elero Transmitter Stick is found on port: "
                     f"'{cp.device}' with serial number: '{elero_serial_number}'."
                 )
-
-                if self.config and elero_serial_number in self.config:
-                    baudrate = self.config[elero_serial_number].get(CONF_BAUDRATE)
-                    bytesize = self.config[elero_serial_number].get(CONF_BYTESIZE)
-                    parity = self.config[elero_serial_number].get(CONF_PARITY)
-                    stopbits = self.config[elero_serial_number].get(CONF_STOPBITS)
-                else:
-                    baudrate = DEFAULT_BAUDRATE
-                    bytesize = DEFAULT_BYTESIZE
-                    parity = DEFAULT_PARITY
-                    stopbits = DEFAULT_STOPBITS
-
-                elero_transmitter = EleroTransmitter(
-                    cp.device, elero_serial_number, baudrate, bytesize, parity, stopbits
+                transmitters.append(
+                    self.__create_transmitter(
+                        cp.device,
+                        elero_serial_number,
+                        configs.get(elero_serial_number, {}),
+                    )
                 )
-                elero_transmitter.init_serial()
-
-                if elero_transmitter.get_transmitter_state():
-                    if elero_serial_number not in self.transmitters:
-                        self.transmitters[elero_serial_number] = elero_transmitter
-                    else:
-                        _LOGGER.error(
-                            f"'{elero_serial_number}' transmitter is already added!"
-                        )
-    def connect_remote_transmitters(self, config):
-        """Find remote transmitters."""
 
-        _LOGGER.debug("Connect Elero remote transmitters")
-        
-        if not config:  # No remote transmitters configured
-            return
-        
-        for remote_config in config:
+        return transmitters
+
+    def __get_remote_transmitters(self, config):
+        """Return the configured remote transmitters."""
+        transmitters = []
+        for remote_config in config or []:
+            if self.__is_known(remote_config[CONF_TRANSMITTER_SERIAL_NUMBER]):
+                continue
             _LOGGER.debug(f"Try to connect to remote transmitter "
                           f"'{remote_config[CONF_TRANSMITTER_SERIAL_NUMBER]} with " 
                           f"address '{remote_config[CONF_REMOTE_TRANSMITTERS_ADDRESS]}'")
-            
-            serial_number = remote_config[CONF_TRANSMITTER_SERIAL_NUMBER]
-            address = remote_config[CONF_REMOTE_TRANSMITTERS_ADDRESS]
-
-            elero_transmitter = EleroRemoteTransmitter(serial_number, address)
-            elero_transmitter.init_serial()
-
-            if elero_transmitter.get_transmitter_state():
-                    if serial_number not in self.transmitters:
-                        self.transmitters[serial_number] = elero_transmitter
-                    else:
-                        _LOGGER.error(
-                            f"'{serial_number}' transmitter has already been added!"
-                        )
 
-    def get_transmitter(self, serial_number):
-        """Return the given transmitter."""
-        if serial_number in self.transmitters:
-            return self.transmitters[serial_number]
-        else:
-            _LOGGER.error(f"The transmitter '{serial_number}' doesn't exist!")
-            return None
+            transmitters.append(
+                EleroRemoteTransmitter(
+                    remote_config[CONF_TRANSMITTER_SERIAL_NUMBER],
+                    remote_config[CONF_REMOTE_TRANSMITTERS_ADDRESS],
+                    remote_config.get(CONF_GROUP_COMMANDS, DEFAULT_GROUP_COMMANDS),
+                    self.channel_cache,
+                    get_command_attempts(remote_config),
+                    get_command_timeouts(remote_config),
+                    remote_config.get(CONF_WRITE_TIMEOUT, DEFAULT_WRITE_TIMEOUT),
+                )
+            )
+        return transmitters
+
+    def __probe_transmitters(self, transmitters):
+        """Connect the transmitters concurrently and add the usable ones."""
+        if not transmitters:
+            return
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=len(transmitters), thread_name_prefix="elero_discovery"
+        )
+        futures = {executor.submit(t.init_serial): t for t in transmitters}
+        executor.shutdown(wait=False)
+        done, not_done = concurrent.futures.wait(futures, timeout=DISCOVERY_TIMEOUT)
+
+        for future, transmitter in futures.items():
+            serial_number = transmitter.get_serial_number()
+            if future in not_done:
+                _LOGGER.error(
+                    f"The '{serial_number}' transmitter has not answered "
+                    f"within {DISCOVERY_TIMEOUT} seconds!"
+                )
+                with self._lock:
+                    self._probing.add(serial_number)
+                future.add_done_callback(
+                    lambda _, t=transmitter: self.__close_probe(t)
+                )
+            elif future.exception() is not None or not transmitter.get_transmitter_state():
+                _LOGGER.error(f"Failed to connect to the '{serial_number}' transmitter!")
+                transmitter.log_out_serial_port_details()
+                transmitter.close_serial()
+            elif serial_number in self.transmitters:
+                _LOGGER.error(f"'{serial_number}' transmitter is already added!")
+                transmitter.close_serial()
+            else:
+                with self._lock:
+                    self.transmitters[serial_number] = transmitter
+                    _LOGGER.info(f"The '{serial_number}' transmitter is connected.")
+                    self.__notify(serial_number, transmitter)
+
+    def __close_probe(self, transmitter):
+        """Close a given up probe when it is finished."""
+        transmitter.close_serial()
+        with self._lock:
+            self._probing.discard(transmitter.get_serial_number())
+
+    def get_exchanges(self):
+        """Return the last exchanges of the attached transmitters."""
+        with self._lock:
+            transmitters = list(self.transmitters.items())
+        return {
+            serial_number: transmitter.get_exchanges()
+            for serial_number, transmitter in transmitters
+        }
+
+    def get_prometheus_metrics(self):
+        """Return the metrics of the attached transmitters in Prometheus
+        text format.
+        """
+        with self._lock:
+            transmitters = list(self.transmitters.items())
+        lines = []
+        for name, (metric, text, buckets) in METRICS.items():
+            lines.append(f"# HELP {metric} {text}")
+            lines.append(f"# TYPE {metric} {'histogram' if buckets else 'counter'}")
+            for serial_number, transmitter in transmitters:
+                lines.extend(
+                    transmitter.get_metrics().get_prometheus_lines(
+                        name, serial_number
+                    )
+                )
+        return "\n".join(lines) + "\n"
 
     def close_transmitters(self):
         """Close the serial connection of the transmitters."""
         for _, t in self.transmitters.items():
             t.close_serial()
+        if self.channel_cache:
+            self.channel_cache.save()
+
+
+class EleroChannelCache(object):
+    """Persistent cache of the learned channels and of the channel states.
+
+    The learned channel mask and the last known status code of the
+    channels are stored by the serial number of the transmitters, so the
+    transmitters and the covers are usable at once after a restart.
+    """
+
+    def __init__(self, path):
+        """Load the cache file."""
+        self._path = path
+        self._lock = threading.Lock()
+        self._timer = None
+        try:
+            self._data = load_json(path, default={})
+        except HomeAssistantError as exc:
+            _LOGGER.warning(f"The Elero channel cache is not usable: '{exc}'.")
+            self._data = {}
+
+    def get_learned_mask(self, serial_number):
+        """Return the cached learned channel mask of the transmitter."""
+        return self._data.get(serial_number, {}).get("mask")
+
+    def get_statuses(self, serial_number):
+        """Return the cached status codes of the channels of the transmitter."""
+        statuses = self._data.get(serial_number, {}).get("statuses", {})
+        return {int(ch): status for ch, status in statuses.items()}
+
+    def set_learned_mask(self, serial_number, mask):
+        """Store the learned channel mask of the transmitter."""
+        with self._lock:
+            transmitter = self._data.setdefault(serial_number, {})
+            if transmitter.get("mask") != mask:
+                transmitter["mask"] = mask
+                self.__schedule_save()
+
+    def set_status(self, serial_number, channel, status):
+        """Store the last known status code of the channel."""
+        with self._lock:
+            statuses = self._data.setdefault(serial_number, {}).setdefault(
+                "statuses", {}
+            )
+            if statuses.get(str(channel)) != status:
+                statuses[str(channel)] = status
+                self.__schedule_save()
+
+    def __schedule_save(self):
+        """Save the changes after the CHANNEL_CACHE_SAVE_DELAY."""
+        if self._timer is None:
+            self._timer = threading.Timer(CHANNEL_CACHE_SAVE_DELAY, self.save)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def save(self):
+        """Write the cache file."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            data = copy.deepcopy(self._data)
+        try:
+            save_json(self._path, data)
+        except HomeAssistantError as exc:
+            _LOGGER.warning(f"Unable to save the Elero channel cache: '{exc}'.")
+
+
+def get_mask_channels(mask):
+    """Return the channel numbers of the 16 bit channel mask."""
+    return LOWER_BYTE_CHANNELS[mask & HEX_255] + UPPER_BYTE_CHANNELS[mask >> BIT_8]
+
+
+def get_command_attempts(config):
+    """Return the attempts of the commands from the transmitter config."""
+    return {
+        COMMAND_CHECK: config.get(CONF_CHECK_ATTEMPTS, DEFAULT_CHECK_ATTEMPTS),
+        COMMAND_INFO: config.get(CONF_INFO_ATTEMPTS, DEFAULT_INFO_ATTEMPTS),
+        COMMAND_SEND: config.get(CONF_SEND_ATTEMPTS, DEFAULT_SEND_ATTEMPTS),
+    }
+
+
+def get_command_timeouts(config):
+    """Return the response timeouts of the commands from the transmitter config."""
+    return {
+        COMMAND_CHECK: config.get(CONF_CHECK_TIMEOUT, DEFAULT_CHECK_TIMEOUT),
+        COMMAND_INFO: config.get(CONF_INFO_TIMEOUT, DEFAULT_INFO_TIMEOUT),
+        COMMAND_SEND: config.get(CONF_SEND_TIMEOUT, DEFAULT_SEND_TIMEOUT),
+    }
+
+
+class EleroResponse(
+    collections.namedtuple("EleroResponse", ("command", "mask", "status"))
+):
+    """An immutable response of the transmitter.
+
+    The command is the Easy response command, the mask is the 16 bit mask
+    of the responding channels and the status is the raw status code of
+    an Easy Ack or None.
+    """
+
+    __slots__ = ()
+
+    @property
+    def channels(self):
+        """Return the numbers of the responding channels."""
+        return get_mask_channels(self.mask)
+
+    @property
+    def state(self):
+        """Return the text of the status."""
+        return INFO.get(self.status, INFO_UNKNOWN)
+
+
+class EleroHistogram(object):
+    """Histogram of the samples of a metric.
+
+    The bucket counts, the count and the sum are cumulative, the
+    percentiles are calculated from the recent samples.
+    """
+
+    def __init__(self, buckets):
+        """Initialize an empty histogram with the upper bounds of the buckets."""
+        self.buckets = buckets
+        self.bucket_counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0
+        self._samples = collections.deque(maxlen=HISTOGRAM_WINDOW)
+
+    def observe(self, value):
+        """Add a sample to the histogram."""
+        self.count += 1
+        self.sum += value
+        self._samples.append(value)
+        index = bisect.bisect_left(self.buckets, value)
+        if index < len(self.buckets):
+            self.bucket_counts[index] += 1
+
+    def get_summary(self):
+        """Return the count and the percentiles of the recent samples."""
+        samples = sorted(self._samples)
+        if not samples:
+            return {"count": self.count}
+        return {
+            "count": self.count,
+            "p50": samples[len(samples) // 2],
+            "p90": samples[min(len(samples) * 9 // 10, len(samples) - 1)],
+            "p99": samples[min(len(samples) * 99 // 100, len(samples) - 1)],
+            "max": samples[-1],
+        }
+
+
+class EleroMetrics(object):
+    """The histograms and the counters of the metrics of a transmitter.
+
+    Every sample is also added to the metric of the whole stick, which
+    is the channel None.
+    """
+
+    def __init__(self):
+        """Initialize the empty metrics."""
+        self._histograms = {}
+        self._counters = collections.Counter()
+
+    def observe(self, name, value, channels=()):
+        """Add a sample to the histograms of the metric."""
+        for channel in (None,) + tuple(channels):
+            histogram = self._histograms.get((name, channel))
+            if histogram is None:
+                histogram = self._histograms.setdefault(
+                    (name, channel), EleroHistogram(METRICS[name][2])
+                )
+            histogram.observe(value)
+
+    def increment(self, name, channels=(), value=1):
+        """Increment the counters of the metric."""
+        for channel in (None,) + tuple(channels):
+            self._counters[(name, channel)] += value
+
+    def get_summary(self, name, channel=None):
+        """Return the summary of a histogram or the value of a counter."""
+        if METRICS[name][2] is None:
+            return self._counters[(name, channel)]
+        histogram = self._histograms.get((name, channel))
+        if histogram is None:
+            return {"count": 0}
+        return histogram.get_summary()
+
+    def get_channels(self, name):
+        """Return the channels which have samples of the metric."""
+        keys = list(self._histograms) + list(self._counters)
+        return sorted({ch for n, ch in keys if n == name and ch is not None})
+
+    def get_prometheus_lines(self, name, serial_number):
+        """Return the samples of the metric in Prometheus text format.
+
+        The metric of the whole stick has the channel label "all".
+        """
+        metric, _, buckets = METRICS[name]
+        lines = []
+        for channel in [None] + self.get_channels(name):
+            labels = (
+                f'transmitter="{serial_number}",'
+                f'channel="{"all" if channel is None else channel}"'
+            )
+            if buckets is None:
+                value = self._counters[(name, channel)]
+                lines.append(f"{metric}{{{labels}}} {value}")
+                continue
+            histogram = self._histograms.get((name, channel))
+            if histogram is None:
+                continue
+            cumulative = 0
+            for bound, count in zip(buckets, histogram.bucket_counts):
+                cumulative += count
+                lines.append(f'{metric}_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f'{metric}_bucket{{{labels},le="+Inf"}} {histogram.count}')
+            lines.append(f"{metric}_sum{{{labels}}} {histogram.sum}")
+            lines.append(f"{metric}_count{{{labels}}} {histogram.count}")
+        return lines
+
+
+class EleroFrameDecoder(object):
+    """Incremental decoder of the frames of the serial byte stream.
+
+    The bytes are collected in a buffer and the complete frames are
+    yielded by iterating over the decoder. A frame starts with the
+    BYTE_HEADER, its length byte has to be valid and the sum of all of
+    its bytes must be 0x00. Otherwise the decoder drops the header and
+    searches the next one, so the stream is resynchronized after a
+    stale or a corrupted byte.
+    """
+
+    def __init__(self):
+        """Initialize the decoder with an empty buffer."""
+        self._buffer = bytearray()
+        # Statistics of the decoded stream.
+        self.frames = 0
+        self.rejected_frames = 0
+        self.dropped_bytes = 0
+        # The last complete frame which is rejected by its checksum.
+        self.rejected_frame = None
+
+    def feed(self, data):
+        """Append the received bytes to the buffer."""
+        self._buffer.extend(data)
+
+    def clear(self):
+        """Drop the buffered bytes."""
+        self.dropped_bytes += len(self._buffer)
+        self._buffer.clear()
+
+    def __iter__(self):
+        """Yield the complete frames of the buffer."""
+        buf = self._buffer
+        while buf:
+            start = buf.find(BYTE_HEADER)
+            if start < 0:
+                self.clear()
+                return
+            self.dropped_bytes += start
+            del buf[:start]
+            if len(buf) < 2:
+                return
+            if buf[1] not in FRAME_LENGTHS:
+                self.__reject()
+                continue
+            frame_length = buf[1] + 2
+            if len(buf) < frame_length:
+                return
+            if sum(buf[:frame_length]) % 256:
+                self.__reject(bytes(buf[:frame_length]))
+                continue
+            frame = bytes(buf[:frame_length])
+            del buf[:frame_length]
+            self.frames += 1
+            yield frame
+
+    def get_missing_bytes(self):
+        """Return the count of the bytes which complete the buffered frame.
+
+        It is the header and the length byte if nothing is buffered,
+        otherwise the rest of the frame given by its length byte, so a
+        read of this size returns as soon as the frame is complete.
+        """
+        buf = self._buffer
+        if len(buf) < 2:
+            return 2 - len(buf)
+        return max(buf[1] + 2 - len(buf), 1)
+
+    def __reject(self, frame=None):
+        """Drop the header of an invalid frame to resynchronize.
+
+        The frame is given if it is complete but its checksum is wrong.
+        """
+        self.rejected_frame = frame
+        self.rejected_frames += 1
+        self.dropped_bytes += 1
+        del self._buffer[0]
 
 
 class EleroTransmitter(object):
     """Representation of an Elero Centero USB Transmitter Stick."""
 
-    def __init__(self, serial_device, serial_number, baudrate, bytesize, parity, stopbits):
+    def __init__(
+        self, serial_device, serial_number, baudrate, bytesize, parity, stopbits,
+        group_commands=DEFAULT_GROUP_COMMANDS, channel_cache=None,
+        attempts=None, timeouts=None, write_timeout=DEFAULT_WRITE_TIMEOUT,
+    ):
         """Initialize a elero transmitter."""
         self._port = serial_device
         self._serial_number = serial_number
@@ -338,47 +1073,141 @@ class EleroTransmitter(object):
         self._bytesize = bytesize
         self._parity = parity
         self._stopbits = stopbits
-        self._threading_lock = threading.Lock()
         # Setup the serial connection to the transmitter.
         self._serial = None
-        self._learned_channels = {}
-
+        self._decoder = EleroFrameDecoder()
+        # The attempts of the commands.
+        self._attempts = attempts or get_command_attempts({})
+        self._metrics = EleroMetrics()
+        # The monotonic time of the last response.
+        self._last_response = None
+        # The last exchanges: (time, command, response, seconds, attempt, error).
+        self._exchanges = collections.deque(maxlen=EXCHANGE_LOG_SIZE)
+        # The response timeouts of the commands.
+        self._timeouts = timeouts or get_command_timeouts({})
+        self._write_timeout = write_timeout
+        # The consecutive failures of the channels and the monotonic time
+        # of the next probe of the channels with open breaker.
+        self._channel_failures = {}
+        self._channel_tripped = {}
+        # The callbacks of the channels and the mask of the learned ones.
+        self._channel_callbacks = {}
+        self._learned_mask = 0
+        # The last known status codes of the channels.
+        self._channel_statuses = {}
+        self._channel_cache = channel_cache
+        if channel_cache:
+            self._learned_mask = channel_cache.get_learned_mask(serial_number) or 0
+            self._channel_statuses = channel_cache.get_statuses(serial_number)
+        self.__build_frame_tables()
+        # The monotonic time of the last response of the channels.
+        self._channel_updated = {}
+        # The adaptive Info polling of the channels: channel -> seconds and
+        # channel -> the monotonic time of the next poll.
+        self._poll_intervals = {}
+        self._poll_due = {}
+        self._poll_condition = threading.Condition()
+        self._poll_stopped = False
+        # The earliest time of the next poll of a channel in stable state.
+        self._poll_next_slot = 0
         self._threading_lock = threading.Lock()
-        
+        self._closed = False
+        # Every serial exchange runs on the own I/O worker of the transmitter
+        # served from a priority queue: command key -> pending future.
+        self._queue = queue.PriorityQueue()
+        self._queue_lock = threading.Lock()
+        self._queue_sequence = itertools.count()
+        self._pending = {}
+        # The submit time and the attempt of the request served by the
+        # worker, and the error of its failed attempt which is repeated.
+        self._request = (None, 1)
+        self._retry = None
+        # The submit time of the last Send of the channels.
+        self._channel_sent = {}
+        # The pending group commands: payload -> (channels, sent event).
+        self._group_commands = group_commands
+        self._group_lock = threading.Lock()
+        self._group_batches = {}
+        # The threads are started when the whole state exists.
+        self._poller = threading.Thread(
+            target=self.__poll, name=f"elero_{serial_number}_poll", daemon=True
+        )
+        self._worker = threading.Thread(
+            target=self.__work, name=f"elero_{serial_number}", daemon=True
+        )
+        self._poller.start()
+        self._worker.start()
+
     def init_serial(self):
-        """Setup serial connection and get learned channels from the transmitter."""
+        """Setup serial connection and get learned channels from the transmitter.
+
+        If the learned channels are known from the channel cache, the
+        transmitter is usable at once and the Easy Check only reconciles
+        the channels in the background.
+        """
 
         # Setup the serial connection to the transmitter.
         self.init_serial_port()
         # Get the learned channels from the transmitter.
         if self._serial:
-            self.check()
+            if self._learned_mask:
+                self.__submit(PRIORITY_CHECK, (COMMAND_CHECK,), self.__check)
+            else:
+                self.check()
 
     def init_serial_port(self):
         """Init the serial port to the transmitter."""
+        self._decoder.clear()
         try:
-            self._serial = serial.Serial(
+            port = serial.Serial(
                 self._port,
                 self._baudrate,
                 self._bytesize,
                 self._parity,
                 self._stopbits,
-                timeout=2,
-                write_timeout=2,
+                timeout=self._timeouts[COMMAND_SEND],
+                write_timeout=self._write_timeout,
             )
         except serial.serialutil.SerialException as exc:
             _LOGGER.exception(
                 f"Unable to open serial port for '{self._serial_number}' to"
                 f"the Transmitter Stick: '{exc}'."
             )
+            return
+        with self._threading_lock:
+            if self._closed:
+                port.close()
+                return
+            self._serial = port
 
     def log_out_serial_port_details(self):
         """Log out the details of the serial connection."""
         _LOGGER.debug(f"Transmitter stick on port '{self._port}' serial: '{self._serial_number}'.")
 
     def close_serial(self):
-        """Close the serial connection of the transmitter."""
-        self._serial.close()
+        """Close the serial connection of the transmitter.
+
+        The queued requests and the collected group commands are answered
+        at once without sending them. The port is closed after the
+        current exchange.
+        """
+        with self._queue_lock:
+            self._closed = True
+            pending = list(self._pending.values())
+            self._pending.clear()
+        with self._group_lock:
+            batches = list(self._group_batches.values())
+            self._group_batches.clear()
+        for future in [p[0] for p in pending] + [b[1] for b in batches]:
+            if not future.done():
+                future.set_result(None)
+        with self._poll_condition:
+            self._poll_stopped = True
+            self._poll_condition.notify()
+        self._queue.put((PRIORITY_SHUTDOWN, next(self._queue_sequence), None))
+        with self._threading_lock:
+            if self._serial:
+                self._serial.close()
 
     def get_transmitter_state(self):
         """Return with transmitter is usable or not."""
@@ -388,32 +1217,195 @@ class EleroTransmitter(object):
         """Return the ID of the transmitter."""
         return self._serial_number
 
+    def __submit(self, priority, key, func, *args):
+        """Queue the func to the I/O worker and return with its future.
+
+        A request with the same key as a still pending one is coalesced,
+        so the waiters share the result of one exchange. The key None
+        means that the request can not be coalesced.
+        """
+        with self._queue_lock:
+            if key is not None and key in self._pending:
+                return self._pending[key][0]
+            future = concurrent.futures.Future()
+            if self._closed:
+                future.set_result(None)
+                return future
+            sequence = next(self._queue_sequence)
+            if key is None:
+                key = sequence
+            self._pending[key] = (future, func, args, time.monotonic(), 1)
+            self._queue.put((priority, sequence, key))
+        return future
+
+    def __work(self):
+        """Serve the queued requests of the transmitter one by one.
+
+        A request which failed an attempt is queued again after its
+        backoff, so the worker serves the other requests meanwhile.
+        """
+        while True:
+            item = self._queue.get()
+            key = item[2]
+            if key is None:
+                break
+            with self._queue_lock:
+                request = self._pending.pop(key, None)
+            # The request has been answered by closing the transmitter.
+            if request is None:
+                continue
+            future, func, args, submitted, attempt = request
+            if attempt == 1:
+                self._metrics.observe(
+                    METRIC_QUEUE_WAIT, time.monotonic() - submitted
+                )
+                if not future.set_running_or_notify_cancel():
+                    continue
+            self._request = (submitted, attempt)
+            self._retry = None
+            try:
+                result = func(*args)
+            except Exception as exc:
+                future.set_exception(exc)
+                continue
+            if self._retry is None:
+                future.set_result(result)
+                continue
+            with self._queue_lock:
+                if self._closed:
+                    future.set_result(None)
+                    continue
+                self._pending[key] = (future, func, args, submitted, attempt + 1)
+            self.__requeue(item, self.__get_backoff(attempt + 1, self._retry))
+
+    def __requeue(self, item, backoff):
+        """Queue the item of a failed request again after the backoff.
+
+        It keeps its sequence, so it is not overtaken by the later
+        requests of the same priority.
+        """
+        if not backoff:
+            self._queue.put(item)
+            return
+        timer = threading.Timer(backoff, self._queue.put, (item,))
+        timer.daemon = True
+        timer.start()
+
+    def __build_frame_tables(self):
+        """Precompute the complete command frames of all of the channels."""
+        self._check_frame = self.__create_frame(
+            [BYTE_HEADER, BYTE_LENGTH_2, COMMAND_CHECK]
+        )
+        self._info_frames = {}
+        self._send_frames = {}
+        for channel in CHANNELS:
+            upper = self.__set_upper_channel_bits(channel)
+            lower = self.__set_lower_channel_bits(channel)
+            self._info_frames[channel] = self.__create_frame(
+                [BYTE_HEADER, BYTE_LENGTH_4, COMMAND_INFO, upper, lower]
+            )
+            for payload in PAYLOAD_TEXT:
+                self._send_frames[(channel, payload)] = self.__create_frame(
+                    [BYTE_HEADER, BYTE_LENGTH_5, COMMAND_SEND, upper, lower, payload]
+                )
+
     def __get_check_command(self):
-        """Create a hex list to Check command."""
-        int_list = [BYTE_HEADER, BYTE_LENGTH_2, COMMAND_CHECK]
-        return int_list
+        """Return the frame of the Check command."""
+        return self._check_frame
 
     def check(self):
         """Wich channels are learned.
 
         Should be received an answer "Easy Confirm" with in 1 second.
         """
-        int_list = self.__get_check_command()
-        self.__process_command(COMMAND_CHECH_TEXT, int_list, 0, RESPONSE_LENGTH_CHECK)
+        self.__submit(PRIORITY_CHECK, (COMMAND_CHECK,), self.__check).result()
+
+    def __check(self):
+        """Send the Check command."""
+        frame = self.__get_check_command()
+        self.__process_command(COMMAND_CHECH_TEXT, frame, 0)
 
     def __set_learned_channels(self, resp):
         """Store learned channels."""
-        self._learned_channels = dict.fromkeys(resp["chs"])
-        chs = " ".join(map(str, list(self._learned_channels.keys())))
+        changed = self._learned_mask ^ resp.mask
+        self._learned_mask = resp.mask
+        chs = " ".join(map(str, resp.channels))
         _LOGGER.debug(
             f"The taught channels on the '{self._serial_number}' "
             f"transmitter are '{chs}'."
         )
+        if self._channel_cache:
+            self._channel_cache.set_learned_mask(self._serial_number, resp.mask)
+        # The set channels which have become learned are polled at once.
+        for channel in self._channel_callbacks:
+            if channel in resp.channels and channel not in self._poll_intervals:
+                self.__schedule_poll(channel, POLL_INTERVAL_MIN, 0)
+        # The availability of the set channels which are taught or deleted
+        # since the last Check is pushed.
+        for channel, callback in list(self._channel_callbacks.items()):
+            if changed & (1 << (channel - 1)):
+                callback(None)
+
+    def is_channel_learned(self, channel):
+        """Return True if the channel is taught to the transmitter."""
+        return bool(self._learned_mask & (1 << (channel - 1)))
+
+    def is_channel_available(self, channel):
+        """Return True if the channel is learned and its breaker is closed."""
+        return (
+            self.is_channel_learned(channel)
+            and channel not in self._channel_tripped
+        )
+
+    def __record_failure(self, channels):
+        """Count a failed command of the channels and open their breaker.
+
+        A channel with open breaker is only probed by one Info attempt in
+        every BREAKER_COOLDOWN, so a receiver out of range does not hold
+        the stick for the other channels.
+        """
+        probe = time.monotonic() + BREAKER_COOLDOWN
+        for ch in channels:
+            failures = self._channel_failures.get(ch, 0) + 1
+            self._channel_failures[ch] = failures
+            if ch in self._channel_tripped:
+                self._channel_tripped[ch] = probe
+            elif failures >= BREAKER_FAILURES:
+                self._channel_tripped[ch] = probe
+                _LOGGER.warning(
+                    f"Transmitter: '{self._serial_number}' ch: '{ch}' "
+                    f"does not respond after '{failures}' commands, it is "
+                    f"probed in every '{BREAKER_COOLDOWN}' seconds."
+                )
+                # The None tells the channel that its availability changed.
+                callback = self._channel_callbacks.get(ch)
+                if callback:
+                    callback(None)
+
+    def __record_success(self, channel):
+        """Reset the failures of the channel and close its breaker."""
+        self._channel_failures.pop(channel, None)
+        if self._channel_tripped.pop(channel, None) is not None:
+            _LOGGER.info(
+                f"Transmitter: '{self._serial_number}' ch: '{channel}' "
+                f"responds again."
+            )
 
     def set_channel(self, channel, obj):
-        """Set the channel if it is learned."""
-        if channel in self._learned_channels:
-            self._learned_channels[channel] = obj
+        """Set the channel if it is learned.
+
+        The callback gets the cached status of the channel at once. The
+        first polls of the channels are spread over the POLL_INTERVAL_MIN,
+        so a restart does not cause a burst of Info commands.
+        """
+        self._channel_callbacks[channel] = obj
+        if self.is_channel_learned(channel):
+            status = self._channel_statuses.get(channel)
+            if status is not None:
+                obj(EleroResponse(RESPONSE_ACK, 1 << (channel - 1), status))
+            self.__schedule_poll(
+                channel, POLL_INTERVAL_MIN, random.uniform(0, POLL_INTERVAL_MIN)
+            )
             return True
         else:
             _LOGGER.error(
@@ -423,243 +1415,617 @@ class EleroTransmitter(object):
             return False
 
     def __get_info_command(self, channel):
-        """Create a hex list to the Info command."""
-        int_list = [
-            BYTE_HEADER,
-            BYTE_LENGTH_4,
-            COMMAND_INFO,
-            self.__set_upper_channel_bits(channel),
-            self.__set_lower_channel_bits(channel),
-        ]
-        return int_list
+        """Return the frame of the Info command of the channel."""
+        return self._info_frames[channel]
 
     def info(self, channel):
         """Return the current state of the cover.
 
         Should be received an answer "Easy Act" with in 4 seconds.
         """
-        int_list = self.__get_info_command(channel)
+        self.__submit_info(channel).result()
+
+    async def async_info(self, channel):
+        """Return the current state of the cover from the event loop.
+
+        The event loop only awaits the result, so it does not occupy a
+        thread of the executor pool of HA during the radio round trip.
+        """
+        await asyncio.wrap_future(self.__submit_info(channel))
+
+    def __submit_info(self, channel, force=False):
+        """Return the future of the Info command of the channel.
+
+        The Info commands are served after the movement commands and
+        the pending ones of the same channel are coalesced. The forced
+        ones are coalesced separately, so they are not skipped.
+        """
+        return self.__submit(
+            PRIORITY_INFO, (COMMAND_INFO, channel, force), self.__info,
+            channel, force,
+        )
+
+    def __info(self, channel, force=False):
+        """Send the Info command.
+
+        It is skipped if a recent response, e.g. an Easy Ack of an other
+        channel or a group command, has already covered the channel, or
+        if the breaker of the channel is open until its next probe. The
+        forced Info, e.g. the poll of a moving cover, is only skipped by
+        the breaker.
+        """
+        if not force and self.is_channel_fresh(channel):
+            _LOGGER.debug(
+                f"Transmitter: '{self._serial_number}' ch: '{channel}' "
+                f"Info is skipped, the state is up to date."
+            )
+            return
+        attempts = None
+        if channel in self._channel_tripped:
+            if time.monotonic() < self._channel_tripped[channel]:
+                return
+            attempts = 1
+        self.__process_command(
+            COMMAND_INFO_TEXT,
+            self.__get_info_command(channel),
+            channel,
+            attempts,
+        )
+
+    def __get_send_command(self, channels, payload):
+        """Return the frame of a Send command of one or more channels."""
+        if len(channels) == 1:
+            return self._send_frames[(channels[0], payload)]
+        mask = self.__get_channel_mask(channels)
+        return self.__create_frame(
+            [BYTE_HEADER, BYTE_LENGTH_5, COMMAND_SEND, mask >> BIT_8,
+             mask & HEX_255, payload]
+        )
+
+    def send_group(self, channels, payload):
+        """Send the payload to all of the given channels with one command.
+
+        The channel bytes of the Easy Send are a bitmask so the stick
+        addresses every selected receiver with a single radio frame.
+        Should be received an answer "Easy Act" with in 4 seconds.
+        """
+        self.__submit(
+            PRIORITY_SEND, None, self.__send_group,
+            tuple(sorted(set(channels))), payload,
+        ).result()
+
+    async def async_send_group(self, channels, payload):
+        """Send the payload to the given channels from the event loop."""
+        await asyncio.wrap_future(
+            self.__submit(
+                PRIORITY_SEND, None, self.__send_group,
+                tuple(sorted(set(channels))), payload,
+            )
+        )
+
+    def __send_group(self, channels, payload):
+        """Send the Send command.
+
+        A repeated command is dropped if a later command of one of its
+        channels has been sent during its backoff, so the older command
+        does not override it.
+        """
+        submitted, attempt = self._request
+        if attempt > 1 and any(
+            self._channel_sent.get(channel, submitted) > submitted
+            for channel in channels
+        ):
+            _LOGGER.debug(
+                f"Transmitter: '{self._serial_number}' ch: '{channels}' "
+                f"'{PAYLOAD_TEXT[payload]}' command is superseded."
+            )
+            return
+        for channel in channels:
+            self._channel_sent[channel] = submitted
         self.__process_command(
-            COMMAND_INFO_TEXT, int_list, channel, RESPONSE_LENGTH_INFO
+            PAYLOAD_TEXT[payload],
+            self.__get_send_command(channels, payload),
+            channels,
         )
+        # Follow the movement closely.
+        for channel in channels:
+            if channel in self._poll_intervals:
+                self.__schedule_poll(channel, POLL_INTERVAL_MOVING)
 
-    def __get_up_command(self, channel):
-        """Create a hex list to Open command."""
-        int_list = [
-            BYTE_HEADER,
-            BYTE_LENGTH_5,
-            COMMAND_SEND,
-            self.__set_upper_channel_bits(channel),
-            self.__set_lower_channel_bits(channel),
-            PAYLOAD_UP,
-        ]
-        return int_list
+    def __schedule_poll(self, channel, interval, delay=None):
+        """Schedule the next Info poll of the channel.
+
+        The poll is due after the interval or the given delay. The poll of
+        a channel with open breaker is its next probe.
+        """
+        probe = self._channel_tripped.get(channel)
+        if delay is None and probe is not None:
+            delay = max(probe - time.monotonic(), 0)
+        elif delay is None:
+            delay = interval
+        with self._poll_condition:
+            self._poll_intervals[channel] = interval
+            self._poll_due[channel] = time.monotonic() + delay
+            self._poll_condition.notify()
+
+    def __update_poll_interval(self, channel, status):
+        """Adapt the poll interval of the channel to its reported status.
+
+        A moving cover is polled fast to detect the end of the movement,
+        a cover in a stable state is polled with an exponential backoff.
+        """
+        interval = self._poll_intervals[channel]
+        if status in INFO_MOVING:
+            interval = POLL_INTERVAL_MOVING
+        elif interval < POLL_INTERVAL_MIN:
+            interval = POLL_INTERVAL_MIN
+        else:
+            interval = min(interval * 2, POLL_INTERVAL_MAX)
+        self.__schedule_poll(channel, interval)
+
+    def __poll(self):
+        """Send the Info commands of the channels as they become due.
+
+        The polls of the channels in a stable state are spread evenly over
+        the POLL_INTERVAL_MIN, so they do not come in bursts which delay
+        the commands of the user. The moving channels are polled at once.
+        Every transmitter has its own poller, so the sticks are polled in
+        parallel. The polls of the moving channels are forced, the
+        response of the movement command must not make them redundant.
+        """
+        with self._poll_condition:
+            while not self._poll_stopped:
+                now = time.monotonic()
+                next_due = now + POLL_INTERVAL_MAX
+                for channel, due in sorted(
+                    self._poll_due.items(), key=lambda item: item[1]
+                ):
+                    moving = self._poll_intervals[channel] <= POLL_INTERVAL_MOVING
+                    if not moving:
+                        due = max(due, self._poll_next_slot)
+                    if due > now:
+                        next_due = min(next_due, due)
+                        continue
+                    if not moving:
+                        self._poll_next_slot = now + POLL_INTERVAL_MIN / len(
+                            self._poll_intervals
+                        )
+                    # It is rescheduled by the response or the result.
+                    del self._poll_due[channel]
+                    self.__submit_info(channel, moving).add_done_callback(
+                        lambda _, ch=channel: self.__reschedule_poll(ch)
+                    )
+                self._poll_condition.wait(next_due - now)
+
+    def __reschedule_poll(self, channel):
+        """Schedule the next poll of a channel which has not responded."""
+        with self._poll_condition:
+            if channel not in self._poll_due:
+                self.__schedule_poll(channel, self._poll_intervals[channel])
+
+    def __submit_send(self, channel, payload):
+        """Return the future of sending the payload to the channel.
+
+        If the group commands are enabled the same payload sent to other
+        channels within the GROUP_COMMAND_WINDOW is merged into one frame,
+        so the members of a cover group are moved together.
+        """
+        if not self._group_commands:
+            return self.__submit(
+                PRIORITY_SEND, None, self.__send_group, (channel,), payload
+            )
+
+        with self._group_lock:
+            batch = self._group_batches.get(payload)
+            if batch:
+                batch[0].add(channel)
+                return batch[1]
+            batch = ({channel}, concurrent.futures.Future())
+            self._group_batches[payload] = batch
+
+        timer = threading.Timer(GROUP_COMMAND_WINDOW, self.__flush_group, (payload,))
+        timer.daemon = True
+        timer.start()
+        return batch[1]
+
+    def __flush_group(self, payload):
+        """Queue the collected channels of a group command."""
+        with self._group_lock:
+            batch = self._group_batches.pop(payload, None)
+        # The batch has been answered by closing the transmitter.
+        if batch is None:
+            return
+        channels, future = batch
+        self.__submit(
+            PRIORITY_SEND, None, self.__send_group, tuple(sorted(channels)),
+            payload,
+        ).add_done_callback(lambda sent: self.__resolve_group(sent, future))
+
+    def __resolve_group(self, sent, future):
+        """Pass the result of the sent group command to its waiters."""
+        if sent.exception() is not None:
+            future.set_exception(sent.exception())
+        else:
+            future.set_result(sent.result())
+
+    def send(self, channel, payload):
+        """Send the payload to the channel.
+
+        Should be received an answer "Easy Act" with in 4 seconds.
+        """
+        self.__submit_send(channel, payload).result()
+
+    async def async_send(self, channel, payload):
+        """Send the payload to the channel from the event loop."""
+        await asyncio.wrap_future(self.__submit_send(channel, payload))
 
     def up(self, channel):
         """Open the cover.
 
         Should be received an answer "Easy Act" with in 4 seconds.
         """
-        self.__process_command(
-            PAYLOAD_UP_TEXT,
-            self.__get_up_command(channel),
-            channel,
-            RESPONSE_LENGTH_SEND,
-        )
+        self.send(channel, PAYLOAD_UP)
 
-    def __get_down_command(self, channel):
-        """Create a hex list to Close command."""
-        int_list = [
-            BYTE_HEADER,
-            BYTE_LENGTH_5,
-            COMMAND_SEND,
-            self.__set_upper_channel_bits(channel),
-            self.__set_lower_channel_bits(channel),
-            PAYLOAD_DOWN,
-        ]
-        return int_list
+    async def async_up(self, channel):
+        """Open the cover from the event loop."""
+        await self.async_send(channel, PAYLOAD_UP)
 
     def down(self, channel):
         """Close the cover.
 
         Should be received an answer "Easy Act" with in 4 seconds.
         """
-        self.__process_command(
-            PAYLOAD_DOWN_TEXT,
-            self.__get_down_command(channel),
-            channel,
-            RESPONSE_LENGTH_SEND,
-        )
+        self.send(channel, PAYLOAD_DOWN)
 
-    def __get_stop_command(self, channel):
-        """Create a hex list to the Stop command."""
-        int_list = [
-            BYTE_HEADER,
-            BYTE_LENGTH_5,
-            COMMAND_SEND,
-            self.__set_upper_channel_bits(channel),
-            self.__set_lower_channel_bits(channel),
-            PAYLOAD_STOP,
-        ]
-        return int_list
+    async def async_down(self, channel):
+        """Close the cover from the event loop."""
+        await self.async_send(channel, PAYLOAD_DOWN)
 
     def stop(self, channel):
         """Stop the cover.
 
         Should be received an answer "Easy Act" with in 4 seconds.
         """
-        self.__process_command(
-            PAYLOAD_STOP_TEXT,
-            self.__get_stop_command(channel),
-            channel,
-            RESPONSE_LENGTH_SEND,
-        )
+        self.send(channel, PAYLOAD_STOP)
 
-    def __get_intermediate_command(self, channel):
-        """Create a hex list to the intermediate command."""
-        int_list = [
-            BYTE_HEADER,
-            BYTE_LENGTH_5,
-            COMMAND_SEND,
-            self.__set_upper_channel_bits(channel),
-            self.__set_lower_channel_bits(channel),
-            PAYLOAD_INTERMEDIATE_POS,
-        ]
-        return int_list
+    async def async_stop(self, channel):
+        """Stop the cover from the event loop."""
+        await self.async_send(channel, PAYLOAD_STOP)
 
     def intermediate(self, channel):
         """Set the cover in intermediate position.
 
         Should be received an answer "Easy Act" with in 4 seconds.
         """
-        self.__process_command(
-            PAYLOAD_INTERMEDIATE_POS_TEXT,
-            self.__get_intermediate_command(channel),
-            channel,
-            RESPONSE_LENGTH_SEND,
-        )
+        self.send(channel, PAYLOAD_INTERMEDIATE_POS)
 
-    def __get_ventilation_tilting_command(self, channel):
-        """Create a hex list to the ventilation command."""
-        int_list = [
-            BYTE_HEADER,
-            BYTE_LENGTH_5,
-            COMMAND_SEND,
-            self.__set_upper_channel_bits(channel),
-            self.__set_lower_channel_bits(channel),
-            PAYLOAD_VENTILATION_POS_TILTING,
-        ]
-        return int_list
+    async def async_intermediate(self, channel):
+        """Set the cover in intermediate position from the event loop."""
+        await self.async_send(channel, PAYLOAD_INTERMEDIATE_POS)
 
     def ventilation_tilting(self, channel):
         """Set the cover in ventilation/tilting position.
 
         Should be received an answer "Easy Act" with in 4 seconds.
         """
-        self.__process_command(
-            PAYLOAD_VENTILATION_POS_TILTING_TEXT,
-            self.__get_ventilation_tilting_command(channel),
-            channel,
-            RESPONSE_LENGTH_SEND,
-        )
+        self.send(channel, PAYLOAD_VENTILATION_POS_TILTING)
 
-    def __process_command(self, command_text, int_list, channel, resp_length):
-        """Ensure the recursive func handling."""
-        int_list.append(self.__calculate_checksum(*int_list))
-        bytes_data = self.__create_serial_data(int_list)
+    async def async_ventilation_tilting(self, channel):
+        """Set the cover in ventilation/tilting position from the event loop."""
+        await self.async_send(channel, PAYLOAD_VENTILATION_POS_TILTING)
 
-        attempt = 0
-        while attempt < 4:
-            attempt += 1
-            try:
-                with self._threading_lock:
-                    if not self._serial.is_open:
-                        self._serial.open()
-                    self._serial.write(bytes_data)
-                    ser_resp = self._serial.read(resp_length)
-                if ser_resp:
-                    resp = self.__parse_response(ser_resp, channel)
-                    rsp = resp["status"]
-                    chs = resp["chs"]
-                    _LOGGER.debug(
-                        f"Send '{command_text}' command to the transmitter: "
-                        f"'{self._serial_number}' ch: '{channel}' serial command: "
-                        f"'{bytes_data}' serial response: '{ser_resp}' "
-                        f"response: '{rsp}' from ch(s): '{chs}' "
-                        f"attempt: '{attempt}'."
+    def __process_command(self, command_text, bytes_data, channel, attempts=None):
+        """Send the command and process its response.
+
+        Every attempt waits for the response up to the timeout of the
+        command type. A failed attempt is repeated up to the attempts of
+        its type by the worker: a corrupted response at once, a missing
+        response or a lost connection after a jittered exponential backoff.
+        """
+        if attempts is None:
+            attempts = self._attempts[bytes_data[2]]
+        timeout = self._timeouts[bytes_data[2]]
+        # The addressed channels of the metrics, none for the Easy Check.
+        channels = ()
+        if bytes_data[2] != COMMAND_CHECK:
+            channels = get_mask_channels((bytes_data[3] << BIT_8) | bytes_data[4])
+        _, attempt = self._request
+        if attempt > 1:
+            self._metrics.increment(METRIC_RETRIES, channels)
+        try:
+            waited = time.monotonic()
+            with self._threading_lock:
+                sent = time.monotonic()
+                self._metrics.observe(METRIC_LOCK_WAIT, sent - waited)
+                # A closed transmitter is never reopened.
+                if self._closed:
+                    return
+                port = self._serial
+                if not self._serial:
+                    raise serial.serialutil.SerialException(
+                        "The serial port is not open."
                     )
-                    # Easy Check.
-                    if command_text == COMMAND_CHECH_TEXT:
-                        self.__set_learned_channels(resp)
-                    else:
-                        self.__process_response(resp)
-                    break
-            except serial.serialutil.SerialException as exc:
+                if not self._serial.is_open:
+                    self._serial.open()
+                # The port is only reconfigured when the type changes.
+                if self._serial.timeout != timeout:
+                    self._serial.timeout = timeout
+                self._serial.write(bytes_data)
+                ser_resp, error = self.__read_response(bytes_data, timeout)
+                duration = time.monotonic() - sent
+                self._exchanges.append(
+                    (time.time(), bytes_data, ser_resp, duration, attempt, error)
+                )
+                if ser_resp:
+                    self._metrics.observe(METRIC_RTT, duration, channels)
+        except serial.serialutil.SerialException as exc:
+            ser_resp = None
+            error = ERROR_DISCONNECT
+            self._exchanges.append(
+                (time.time(), bytes_data, None, time.monotonic() - waited,
+                 attempt, error)
+            )
+            _LOGGER.debug(
+                f"Problem communicating with transmitter: "
+                f"'{self._serial_number}' send command: '{command_text}' "
+                f"ch: '{channel}' serial command: '{bytes_data}' "
+                f"attempt: '{attempt}' exception: '{exc}'"
+            )
+            self.__reopen_serial_port(port)
+        if ser_resp:
+            resp = self.__parse_response(ser_resp, channel)
+            # The message is only formatted if it is logged.
+            if _LOGGER.isEnabledFor(logging.DEBUG):
                 _LOGGER.debug(
-                    f"Problem communicating with transmitter: "
-                    f"'{self._serial_number}' send command: '{command_text}' "
-                    f"ch: '{channel}' serial command: '{bytes_data}' "
-                    f"attempt: '{attempt}' exception: '{exc}'"
+                    f"Send '{command_text}' command to the transmitter: "
+                    f"'{self._serial_number}' ch: '{channel}' serial command: "
+                    f"'{bytes_data}' serial response: '{ser_resp}' "
+                    f"response: '{resp.state}' from ch(s): '{resp.channels}' "
+                    f"attempt: '{attempt}'."
                 )
-                self.init_serial_port()
+            self._metrics.observe(METRIC_ATTEMPTS, attempt, channels)
+            self._last_response = time.monotonic()
+            # Easy Check.
+            if command_text == COMMAND_CHECH_TEXT:
+                self.__set_learned_channels(resp)
+            else:
+                self.__process_response(resp)
+            return
+        self._metrics.increment(ERROR_METRICS[error], channels)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                f"Transmitter: '{self._serial_number}' ch: '{channel}' "
+                f"'{command_text}' command failed: '{error}' "
+                f"attempt: '{attempt}/{attempts}'."
+            )
+        if attempt < attempts:
+            self._retry = error
+            return
+        self._metrics.increment(METRIC_FAILURES, channels)
+        self._metrics.observe(METRIC_ATTEMPTS, attempts, channels)
+        _LOGGER.warning(
+            f"Transmitter: '{self._serial_number}' ch: '{channel}' "
+            f"'{command_text}' command failed after '{attempts}' "
+            f"attempt(s), the last error: '{error}'."
+        )
+        # A lost connection is not the failure of the channels.
+        if error != ERROR_DISCONNECT:
+            self.__record_failure(channels)
+
+    def __get_backoff(self, attempt, error):
+        """Return the seconds to wait before the attempt of a command."""
+        if error == ERROR_GARBAGE:
+            return 0
+        backoff = min(RETRY_BACKOFF * 2 ** (attempt - 2), RETRY_BACKOFF_MAX)
+        return random.uniform(backoff / 2, backoff)
+
+    def __reopen_serial_port(self, port):
+        """Close the broken serial port and try to open it again.
+
+        If the port can not be opened, e.g. the stick is unplugged, the
+        transmitter becomes unusable until it is discovered again. A port
+        which has been replaced meanwhile, e.g. by the reconnection of a
+        remote transmitter, is kept.
+        """
+        with self._threading_lock:
+            if self._closed or self._serial is not port:
+                return
+            if port:
+                try:
+                    port.close()
+                except serial.serialutil.SerialException:
+                    pass
+            self._serial = None
+        self.init_serial_port()
+
+    def __read_response(self, command, timeout):
+        """Read the serial stream until the response of the command arrives.
+
+        The stream is read frame by frame: the header and the length byte
+        first, then the rest of the frame, so any kind of frame is complete
+        without waiting for the timeout of the port. The timeout of the
+        port is only lowered for a read which would block past the deadline
+        of the exchange by more than the DEADLINE_TOLERANCE. The frames of
+        the stream which are not the response of the command, e.g. a late
+        answer of a previous timed out command, are routed to their
+        channels. Return the response and None, or None and the kind of the error if
+        the response does not arrive.
+        """
+        deadline = time.monotonic() + timeout
+        rejected_frames = self._decoder.rejected_frames
+        dropped_bytes = self._decoder.dropped_bytes
+        try:
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                missing = self._decoder.get_missing_bytes()
+                if (
+                    self._serial.timeout > remaining + DEADLINE_TOLERANCE
+                    and self._serial.in_waiting < missing
+                ):
+                    self._serial.timeout = remaining
+                data = self._serial.read(missing)
+                if not data:
+                    break
+                self._decoder.feed(data)
+                self._decoder.rejected_frame = None
+                for frame in self._decoder:
+                    if self.__is_response(command, frame):
+                        return frame, None
+                    self.__process_unsolicited(frame)
+                # Retry at once instead of waiting for a corrupted response,
+                # a stray header is skipped and the reading goes on.
+                if self.__is_corrupted_response(
+                    command, self._decoder.rejected_frame
+                ):
+                    _LOGGER.warning(
+                        f"Transmitter: '{self._serial_number}' corrupted frame "
+                        f"is rejected, the command is repeated."
+                    )
+                    return None, ERROR_GARBAGE
+            if self._decoder.dropped_bytes != dropped_bytes:
+                return None, ERROR_GARBAGE
+            return None, ERROR_TIMEOUT
+        finally:
+            self.__record_noise(rejected_frames, dropped_bytes)
+
+    def __record_noise(self, rejected_frames, dropped_bytes):
+        """Count the rejected frames and the dropped bytes of an exchange.
+
+        They show the noise of the serial line which costs repeated
+        commands.
+        """
+        self._metrics.increment(
+            METRIC_REJECTED_FRAMES,
+            value=self._decoder.rejected_frames - rejected_frames,
+        )
+        self._metrics.increment(
+            METRIC_DROPPED_BYTES,
+            value=self._decoder.dropped_bytes - dropped_bytes,
+        )
+
+    def __is_corrupted_response(self, command, frame):
+        """Return True if the rejected frame stood in for the response."""
+        return frame is not None and frame[2] == RESPONSE_COMMANDS.get(command[2])
+
+    def __is_response(self, command, frame):
+        """Return True if the frame is the response of the command."""
+        if frame[2] != RESPONSE_COMMANDS.get(command[2]):
+            return False
+        if frame[2] == RESPONSE_CONFIRM:
+            return True
+        # The Easy Ack should come from one of the addressed channels.
+        return bool(frame[3] & command[3] or frame[4] & command[4])
+
+    def __process_unsolicited(self, frame):
+        """Route a frame which is not the response of the current command."""
+        if frame[2] == RESPONSE_ACK and len(frame) == RESPONSE_LENGTH_SEND:
+            resp = self.__parse_response(frame, None)
+            _LOGGER.debug(
+                f"Transmitter: '{self._serial_number}' unsolicited response: "
+                f"'{frame}' from ch(s): '{resp.channels}'."
+            )
+            self.__process_response(resp)
+        else:
+            _LOGGER.debug(
+                f"Transmitter: '{self._serial_number}' unexpected frame "
+                f"is dropped: '{frame}'."
+            )
+
+    def get_exchanges(self):
+        """Return the last exchanges of the transmitter, the oldest first.
+
+        The frames are hex strings, the response is None if it has not
+        arrived.
+        """
+        return [
+            {
+                "time": datetime.datetime.fromtimestamp(
+                    timestamp, datetime.timezone.utc
+                ).isoformat(),
+                "command": command.hex(),
+                "response": response.hex() if response else None,
+                "duration_ms": round(duration * 1000, 1),
+                "attempt": attempt,
+                "error": error,
+            }
+            for timestamp, command, response, duration, attempt, error in list(
+                self._exchanges
+            )
+        ]
+
+    def get_metrics(self):
+        """Return the metrics of the exchanges of the transmitter."""
+        return self._metrics
+
+    def get_channel_age(self, channel):
+        """Return the seconds since the last response of the channel."""
+        updated = self._channel_updated.get(channel)
+        if updated is None:
+            return None
+        return time.monotonic() - updated
+
+    def is_channel_fresh(self, channel):
+        """Return True if the channel has responded recently."""
+        age = self.get_channel_age(channel)
+        return age is not None and age < INFO_CACHE_MAX_AGE
 
     def __process_response(self, resp):
         """Read the response form the device."""
+        now = time.monotonic()
+        mask = resp.mask
+        if mask & ~self._learned_mask:
+            chs = get_mask_channels(mask & ~self._learned_mask)
+            _LOGGER.error(
+                f"The channel is not learned '{self._serial_number}' "
+                f"on the transmitter: '{chs}'."
+            )
         # Reply to the appropriate channel.
-        for ch in resp["chs"]:
+        for ch in get_mask_channels(mask & self._learned_mask):
+            # The stick reports the timeout of an unreachable receiver.
+            if resp.state == INFO_TIMEOUT:
+                self.__record_failure((ch,))
+            elif resp.state != INFO_UNKNOWN:
+                self.__record_success(ch)
+            if resp.state not in (INFO_TIMEOUT, INFO_UNKNOWN):
+                self._channel_updated[ch] = now
+                self._channel_statuses[ch] = resp.status
+                if self._channel_cache:
+                    self._channel_cache.set_status(
+                        self._serial_number, ch, resp.status
+                    )
+            if ch in self._poll_intervals:
+                self.__update_poll_interval(ch, resp.state)
             # Call back the channel with its result.
-            if ch in self._learned_channels:
-                self._learned_channels[ch](resp)
-            else:
-                _LOGGER.error(
-                    f"The channel is not learned '{self._serial_number}' "
-                    f"on the transmitter: '{ch}'."
-                )
+            callback = self._channel_callbacks.get(ch)
+            if callback:
+                callback(resp)
 
     def __parse_response(self, ser_resp, channel):
         """Parse the serial data as a response."""
-        response = {
-            "bytes": None,
-            "header": None,
-            "length": None,
-            "command": None,
-            "ch_h": None,
-            "ch_l": None,
-            "chs": set(),
-            "status": None,
-            "cs": None,
-        }
-        response["bytes"] = ser_resp
+        status = None
         resp_length = len(ser_resp)
-        # Common parts.
-        response["header"] = ser_resp[0]
-        response["length"] = ser_resp[1]
-        response["command"] = ser_resp[2]
-        response["ch_h"] = self.__get_upper_channel_bits(ser_resp[3])
-        response["ch_l"] = self.__get_lower_channel_bits(ser_resp[4])
-        response["chs"] = set(response["ch_h"] + response["ch_l"])
         # Easy Confirmed (the answer on Easy Check).
         if resp_length == RESPONSE_LENGTH_CHECK:
-            response["cs"] = ser_resp[5]
+            pass
         # Easy Ack (the answer on Easy Info).
         elif resp_length == RESPONSE_LENGTH_SEND:
-            if ser_resp[5] in INFO:
-                response["status"] = INFO[ser_resp[5]]
-            else:
-                response["status"] = INFO_UNKNOWN
+            status = ser_resp[5]
+            if status not in INFO:
                 _LOGGER.error(
                     f"Transmitter: '{self._serial_number}' ch: '{channel}' "
-                    f"status is unknown: '{ser_resp[5]:X}'."
+                    f"status is unknown: '{status:X}'."
                 )
-            response["cs"] = ser_resp[6]
         else:
             _LOGGER.error(
                 f"Transmitter: '{self._serial_number}' ch: '{channel}' "
                 f"unknown response: '{ser_resp}'."
             )
-            response["status"] = INFO_UNKNOWN
 
-        return response
+        return EleroResponse(
+            ser_resp[2], (ser_resp[3] << BIT_8) | ser_resp[4], status
+        )
 
     def __calculate_checksum(self, *args):
         """Calculate checksum.
@@ -668,10 +2034,9 @@ class EleroTransmitter(object):
         """
         return (256 - sum(args)) % 256
 
-    def __create_serial_data(self, int_list):
-        """Convert integers to bytes for serial communication."""
-        bytes_data = bytes(int_list)
-        return bytes_data
+    def __create_frame(self, int_list):
+        """Append the checksum and convert the frame to bytes."""
+        return bytes(int_list + [self.__calculate_checksum(*int_list)])
 
     def __set_upper_channel_bits(self, channel):
         """Set upper channel bits, for channel 9 to 15."""
@@ -683,65 +2048,190 @@ class EleroTransmitter(object):
         res = (1 << (channel - 1)) & HEX_255
         return res
 
-    def __get_upper_channel_bits(self, byt):
-        """Return the set channel numbers from 9 to 15."""
-        channels = []
-        for i in range(0, 8):
-            if (byt >> i) & 1 == 1:
-                ch = i + 9
-                channels.append(ch)
-
-        return tuple(channels)
-
-    def __get_lower_channel_bits(self, byt):
-        """Return the set channel numbers from 1 to 8."""
-        channels = []
-        for i in range(0, 8):
-            if (byt >> i) & 1 == 1:
-                ch = i + 1
-                channels.append(ch)
-
-        return tuple(channels)
+    def __get_channel_mask(self, channels):
+        """Return the 16 bit channel mask of the given channels."""
+        mask = 0
+        for channel in channels:
+            mask |= 1 << (channel - 1)
+        return mask
 
 
 class EleroRemoteTransmitter(EleroTransmitter):
     """Representation of a remotely connected Elero Centero USB Transmitter Stick.
     
        Using ser2net
-    
+
+       The TCP connection is kept alive and probed while idle. A lost
+       connection is reconnected in the background with backoff, so the
+       commands of the users do not wait for the reconnection.
     """
-    def __init__(self, serial_number, address):
+    def __init__(
+        self, serial_number, address, group_commands=DEFAULT_GROUP_COMMANDS,
+        channel_cache=None, attempts=None, timeouts=None,
+        write_timeout=DEFAULT_WRITE_TIMEOUT,
+    ):
         
         self._address = address
-        super().__init__(None, serial_number, None, None, None, None, )
-
-    
-    def init_serial(self):
-        """Setup serial connection and get learned channels from the transmitter."""
-        
-        # Setup the serial connection to the transmitter.
-        self.init_serial_port()
-        # Get the learned channels from the transmitter.
-        if self._serial:
-            self.check()
-
+        # The transmitter is managed after its first connection.
+        self._connected_once = False
+        self._reconnect_event = threading.Event()
+        super().__init__(
+            None, serial_number, None, None, None, None, group_commands,
+            channel_cache, attempts, timeouts, write_timeout,
+        )
+        threading.Thread(
+            target=self.__manage_connection,
+            name=f"elero_{serial_number}_connection",
+            daemon=True,
+        ).start()
 
     def init_serial_port(self):
-        """Init the serial port to the transmitter."""
+        """Init the serial port to the transmitter.
 
+        The first connection is made at once, a lost one is reconnected
+        in the background.
+        """
+        if self._connected_once:
+            self._reconnect_event.set()
+        else:
+            self.__connect()
+
+    def __connect(self):
+        """Connect to the remote transmitter, return True on success."""
+        self._decoder.clear()
         url = f"socket://{self._address}"
         # https://pyserial.readthedocs.io/en/latest/url_handlers.html#urls
+        # The connect timeout of the socket url handler is 5 seconds.
         try:
-            self._serial = serial.serial_for_url(url)
-            _LOGGER.info(
-                    f"Elero Transmitter Stick is remotely connected to '{self._address}' "
-                    f"with serial number: '{self._serial_number}'."
-                )
+            port = serial.serial_for_url(
+                url,
+                timeout=self._timeouts[COMMAND_SEND],
+                write_timeout=self._write_timeout,
+                do_not_open=True,
+            )
+            port.open()
         except serial.serialutil.SerialException as exc:
-            _LOGGER.exception(
+            _LOGGER.error(
                 f"Unable to connect to remote serial port '{url}' for serial "
                 f"number {self._serial_number}: '{exc}'."
             )
+            return False
+        self.__set_socket_options(port)
+        with self._threading_lock:
+            if self._closed:
+                port.close()
+                return False
+            self._serial = port
+        self._connected_once = True
+        _LOGGER.info(
+                f"Elero Transmitter Stick is remotely connected to '{self._address}' "
+                f"with serial number: '{self._serial_number}'."
+            )
+        return True
+
+    def __set_socket_options(self, port):
+        """Disable the Nagle algorithm and enable the TCP keepalive."""
+        # The socket of the socket url handler of pyserial.
+        sock = getattr(port, "_socket", None)
+        if sock is None:
+            return
+        options = [
+            (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+            (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+        ]
+        # The keepalive timing is not available on every platform.
+        for name, value in (
+            ("TCP_KEEPIDLE", REMOTE_KEEPALIVE_IDLE),
+            ("TCP_KEEPINTVL", REMOTE_KEEPALIVE_INTERVAL),
+            ("TCP_KEEPCNT", REMOTE_KEEPALIVE_COUNT),
+        ):
+            if hasattr(socket, name):
+                options.append((socket.IPPROTO_TCP, getattr(socket, name), value))
+        for level, option, value in options:
+            try:
+                sock.setsockopt(level, option, value)
+            except OSError as exc:
+                _LOGGER.warning(
+                    f"Unable to set the socket option '{option}' of the remote "
+                    f"transmitter '{self._serial_number}': '{exc}'."
+                )
+
+    def __manage_connection(self):
+        """Reconnect the lost connection and probe the idle one until closed.
+
+        The wait for the next probe is interrupted by a lost connection,
+        the backoff of the reconnection only by closing. The channels are
+        notified when the connection is lost and when it is restored, not
+        on every failed attempt.
+        """
+        backoff = REMOTE_RECONNECT_MIN
+        lost = False
+        while not self._closed:
+            if self._connected_once and self._serial is None:
+                if not lost:
+                    lost = True
+                    self.__notify_channels()
+                if self.__connect():
+                    backoff = REMOTE_RECONNECT_MIN
+                    lost = False
+                    self.__notify_channels()
+                    continue
+                deadline = time.monotonic() + random.uniform(backoff / 2, backoff)
+                backoff = min(backoff * 2, REMOTE_RECONNECT_MAX)
+                while not self._closed and time.monotonic() < deadline:
+                    self._reconnect_event.wait(deadline - time.monotonic())
+                    self._reconnect_event.clear()
+                continue
+            self._reconnect_event.wait(REMOTE_PROBE_INTERVAL)
+            self._reconnect_event.clear()
+            if self._serial is not None and self.__is_idle():
+                self.__probe()
+
+    def __is_idle(self):
+        """Return True if the transmitter has not responded recently."""
+        return (
+            self._last_response is None
+            or time.monotonic() - self._last_response > REMOTE_PROBE_INTERVAL
+        )
+
+    def __probe(self):
+        """Send an Easy Check and drop the connection if it does not respond.
+
+        It runs on the connection manager, which reconnects the dropped
+        connection next.
+        """
+        probed = time.monotonic()
+        self.check()
+        if self._closed or (self._last_response or 0) >= probed:
+            return
+        _LOGGER.warning(
+            f"The remote transmitter '{self._serial_number}' does not respond, "
+            f"it is reconnected."
+        )
+        with self._threading_lock:
+            if self._serial:
+                self._serial.close()
+            self._serial = None
+
+    def __notify_channels(self):
+        """Tell the channels that their availability has changed."""
+        for callback in list(self._channel_callbacks.values()):
+            callback(None)
+
+    def get_transmitter_state(self):
+        """Return True while the connection is managed, even if it is lost."""
+        return self._connected_once and not self._closed
+
+    def is_channel_available(self, channel):
+        """Return True if the transmitter is connected and the channel is
+        available.
+        """
+        return self._serial is not None and super().is_channel_available(channel)
+
+    def close_serial(self):
+        """Close the connection and stop managing it."""
+        super().close_serial()
+        self._reconnect_event.set()
 
     def log_out_serial_port_details(self):
         """Log out the details of the serial connection."""
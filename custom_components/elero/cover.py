@@ -2,6 +2,7 @@
 
 __version__ = "3.2.1"
 
+import collections
 import logging
 
 import homeassistant.helpers.config_validation as cv
@@ -13,9 +14,10 @@ from homeassistant.components.light import PLATFORM_SCHEMA
 from homeassistant.const import (CONF_COVERS, CONF_DEVICE_CLASS, CONF_NAME,
                                  STATE_CLOSED, STATE_CLOSING, STATE_OPEN,
                                  STATE_OPENING, STATE_UNKNOWN)
+from homeassistant.helpers.restore_state import RestoreEntity
 
 import custom_components.elero as elero
-from custom_components.elero import (CONF_TRANSMITTER_SERIAL_NUMBER,
+from custom_components.elero import (CONF_TRANSMITTER_SERIAL_NUMBER, INFO,
                                      INFO_BLOCKING,
                                      INFO_BOTTOM_POS_STOP_WICH_INT_POS,
                                      INFO_BOTTOM_POSITION_STOP,
@@ -30,7 +32,10 @@ from custom_components.elero import (CONF_TRANSMITTER_SERIAL_NUMBER,
                                      INFO_TILT_VENTILATION_POS_STOP,
                                      INFO_TIMEOUT,
                                      INFO_TOP_POS_STOP_WICH_TILT_POS,
-                                     INFO_TOP_POSITION_STOP)
+                                     INFO_TOP_POSITION_STOP, PAYLOAD_DOWN,
+                                     PAYLOAD_INTERMEDIATE_POS, PAYLOAD_STOP,
+                                     PAYLOAD_UP,
+                                     PAYLOAD_VENTILATION_POS_TILTING)
 
 # Python libraries/modules that you would normally install for your component.
 REQUIREMENTS = []
@@ -66,6 +71,94 @@ STATE_STOPPED = "stopped"
 STATE_TILT_VENTILATION = "ventilation/tilt"
 STATE_UNDEFINED = "undefined"
 
+# The state of a cover.
+CoverState = collections.namedtuple(
+    "CoverState",
+    ("closed", "is_opening", "is_closing", "state", "position", "tilt_position"),
+)
+
+COVER_STATE_UNKNOWN = CoverState(None, None, None, STATE_UNKNOWN, None, None)
+
+# The cover states of the Elero statuses.
+STATUS_COVER_STATES = {
+    INFO_NO_INFORMATION: COVER_STATE_UNKNOWN,
+    INFO_TOP_POSITION_STOP: CoverState(
+        False, False, False, STATE_OPEN, POSITION_OPEN, POSITION_UNDEFINED
+    ),
+    INFO_BOTTOM_POSITION_STOP: CoverState(
+        True, False, False, STATE_CLOSED, POSITION_CLOSED, POSITION_UNDEFINED
+    ),
+    INFO_INTERMEDIATE_POSITION_STOP: CoverState(
+        False, False, False, STATE_INTERMEDIATE, POSITION_INTERMEDIATE,
+        POSITION_INTERMEDIATE,
+    ),
+    INFO_TILT_VENTILATION_POS_STOP: CoverState(
+        False, False, False, STATE_TILT_VENTILATION, POSITION_TILT_VENTILATION,
+        POSITION_TILT_VENTILATION,
+    ),
+    INFO_START_TO_MOVE_UP: CoverState(
+        False, True, False, STATE_OPENING, POSITION_UNDEFINED, POSITION_UNDEFINED
+    ),
+    INFO_START_TO_MOVE_DOWN: CoverState(
+        False, False, True, STATE_CLOSING, POSITION_UNDEFINED, POSITION_UNDEFINED
+    ),
+    INFO_MOVING_UP: CoverState(
+        False, True, False, STATE_OPENING, POSITION_UNDEFINED, POSITION_UNDEFINED
+    ),
+    INFO_MOVING_DOWN: CoverState(
+        False, False, True, STATE_CLOSING, POSITION_UNDEFINED, POSITION_UNDEFINED
+    ),
+    INFO_STOPPED_IN_UNDEFINED_POSITION: CoverState(
+        False, False, False, STATE_UNDEFINED, POSITION_UNDEFINED,
+        POSITION_UNDEFINED,
+    ),
+    INFO_TOP_POS_STOP_WICH_TILT_POS: CoverState(
+        False, False, False, STATE_TILT_VENTILATION, POSITION_TILT_VENTILATION,
+        POSITION_TILT_VENTILATION,
+    ),
+    INFO_BOTTOM_POS_STOP_WICH_INT_POS: CoverState(
+        True, False, False, STATE_INTERMEDIATE, POSITION_INTERMEDIATE,
+        POSITION_INTERMEDIATE,
+    ),
+    INFO_BLOCKING: COVER_STATE_UNKNOWN,
+    INFO_OVERHEATED: COVER_STATE_UNKNOWN,
+    INFO_TIMEOUT: COVER_STATE_UNKNOWN,
+    INFO_SWITCHING_DEVICE_SWITCHED_ON: COVER_STATE_UNKNOWN,
+    INFO_SWITCHING_DEVICE_SWITCHED_OFF: COVER_STATE_UNKNOWN,
+}
+
+# The expected cover states after the Elero commands.
+COMMAND_COVER_STATES = {
+    PAYLOAD_DOWN: CoverState(
+        False, False, True, STATE_CLOSING, POSITION_CLOSED, POSITION_UNDEFINED
+    ),
+    PAYLOAD_UP: CoverState(
+        False, True, False, STATE_OPENING, POSITION_OPEN, POSITION_UNDEFINED
+    ),
+    PAYLOAD_STOP: CoverState(
+        False, False, False, STATE_STOPPED, POSITION_UNDEFINED, POSITION_UNDEFINED
+    ),
+    PAYLOAD_VENTILATION_POS_TILTING: CoverState(
+        False, False, False, STATE_TILT_VENTILATION, POSITION_TILT_VENTILATION,
+        POSITION_TILT_VENTILATION,
+    ),
+    PAYLOAD_INTERMEDIATE_POS: CoverState(
+        False, False, False, STATE_INTERMEDIATE, POSITION_INTERMEDIATE,
+        POSITION_INTERMEDIATE,
+    ),
+}
+
+# The status codes of the Elero statuses.
+ELERO_STATUS_CODES = {status: code for code, status in INFO.items()}
+
+# The Elero statuses which are logged as an error.
+ERROR_STATUSES = (INFO_BLOCKING, INFO_OVERHEATED, INFO_TIMEOUT)
+
+# The fields of the cover states which differ by device class.
+DEVICE_CLASS_COVER_STATES = {
+    "rolling door": {"tilt_position": None},
+}
+
 # Supported features.
 SUPPORTED_FEATURES = {
     "close_tilt": CoverEntityFeature.CLOSE_TILT,
@@ -109,23 +202,10 @@ def setup_platform(hass, config, add_devices, discovery_info=None):
     covers = []
     covers_conf = config.get(CONF_COVERS, {})
     for _, cover_conf in covers_conf.items():
-        transmitter = elero.ELERO_TRANSMITTERS.get_transmitter(
-            cover_conf.get(CONF_TRANSMITTER_SERIAL_NUMBER)
-        )
-        if not transmitter:
-            t = cover_conf.get(CONF_TRANSMITTER_SERIAL_NUMBER)
-            ch = cover_conf.get(CONF_CHANNEL)
-            n = cover_conf.get(CONF_NAME)
-            _LOGGER.error(
-                f"The transmitter '{t}' of the '{ch}' - '{n}' channel is "
-                "non-existent transmitter!"
-            )
-            continue
-
         covers.append(
             EleroCover(
                 hass,
-                transmitter,
+                cover_conf.get(CONF_TRANSMITTER_SERIAL_NUMBER),
                 cover_conf.get(CONF_NAME),
                 cover_conf.get(CONF_CHANNEL),
                 cover_conf.get(CONF_DEVICE_CLASS),
@@ -133,29 +213,45 @@ def setup_platform(hass, config, add_devices, discovery_info=None):
             )
         )
 
-    add_devices(covers, True)
+    # The covers restore their last known state, the transmitters spread
+    # their first polls instead of polling all of them before adding.
+    add_devices(covers)
 
+    # The covers are unavailable until their transmitter is attached.
+    for cover in covers:
+        elero.ELERO_TRANSMITTERS.subscribe(
+            cover.transmitter_serial_number, cover.set_transmitter
+        )
 
-class EleroCover(CoverEntity):
+
+class EleroCover(CoverEntity, RestoreEntity):
     """Representation of a Elero cover device."""
 
     def __init__(
-        self, hass, transmitter, name, channel, device_class, supported_features
+        self, hass, serial_number, name, channel, device_class, supported_features
     ):
         """Init of a Elero cover."""
         self.hass = hass
-        self._transmitter = transmitter
+        self._serial_number = serial_number
+        self._transmitter = None
         self._name = name
         self._channel = channel
         self._device_class = ELERO_COVER_DEVICE_CLASSES[device_class]
+        # The cover states by status code and by command payload.
+        fields = DEVICE_CLASS_COVER_STATES.get(device_class, {})
+        self._status_states = {
+            code: STATUS_COVER_STATES[status]._replace(**fields)
+            for code, status in INFO.items()
+        }
+        self._command_states = {
+            payload: state._replace(**fields)
+            for payload, state in COMMAND_COVER_STATES.items()
+        }
 
         self._supported_features = 0
         for f in supported_features:
             self._supported_features |= SUPPORTED_FEATURES[f]
 
-        self._available = self._transmitter.set_channel(
-            self._channel, self.response_handler
-        )
         self._position = None
         self._is_opening = None
         self._is_closing = None
@@ -163,17 +259,22 @@ class EleroCover(CoverEntity):
         self._tilt_position = None
         self._state = None
         self._elero_state = None
-        self._response = dict()
+        self._response = None
 
     @property
     def unique_id(self):
         """
         Gets the unique ID of the cover.
         """
-        ser_num = self._transmitter.get_serial_number()
+        ser_num = self._serial_number
         ch = self._channel
         return f"{ser_num}_{ch}"
 
+    @property
+    def transmitter_serial_number(self):
+        """Return the serial number of the transmitter of the cover."""
+        return self._serial_number
+
     @property
     def name(self):
         """Return the name of the cover."""
@@ -191,18 +292,22 @@ class EleroCover(CoverEntity):
 
     @property
     def should_poll(self):
-        """Return True if entity has to be polled for state.
+        """Return False, the transmitter polls the entity and pushes its state.
 
         Because of you can use other remote control (like MultiTel2)
         next to the HA in your system and the status of the Elero devices
         may change therefore it is necessary to monitor their statuses.
+        The transmitter polls a moving cover fast and backs off while it
+        is in a stable state.
         """
-        return True
+        return False
 
     @property
     def available(self):
         """Return True if entity is available."""
-        return self._available
+        return self._transmitter is not None and self._transmitter.is_channel_available(
+            self._channel
+        )
 
     @property
     def current_cover_position(self):
@@ -248,221 +353,139 @@ class EleroCover(CoverEntity):
 
         return data
 
-    def update(self):
-        """Get the device sate and update its attributes and state."""
-        self._transmitter.info(self._channel)
+    async def async_added_to_hass(self):
+        """Restore the last known state of the cover."""
+        await super().async_added_to_hass()
+        if self._response is not None:
+            # The transmitter has already given the state.
+            return
+        last_state = await self.async_get_last_state()
+        if last_state is None:
+            return
+        status = ELERO_STATUS_CODES.get(last_state.attributes.get(ATTR_ELERO_STATE))
+        if status is not None:
+            self._elero_state = INFO[status]
+            self.__set_cover_state(self._status_states[status])
+
+    def set_transmitter(self, transmitter):
+        """Attach the cover to its transmitter or detach it if None."""
+        self._transmitter = transmitter
+        if transmitter:
+            transmitter.set_channel(self._channel, self.response_handler)
+        if self.entity_id is not None:
+            self.schedule_update_ha_state()
+
+    async def async_update(self):
+        """Get the device sate without occupying an executor thread."""
+        if self._transmitter:
+            await self._transmitter.async_info(self._channel)
+
+    async def __async_command(self, command, payload):
+        """Send the command and write the expected state of the cover.
 
-    def close_cover(self, **kwargs):
+        The entity is not polled, so HA does not write its state after
+        the service call.
+        """
+        await command(self._channel)
+        self.__set_cover_state(self._command_states[payload])
+        if self.entity_id is not None:
+            self.async_write_ha_state()
+
+    async def async_close_cover(self, **kwargs):
         """Close the cover."""
-        self._transmitter.down(self._channel)
-        self._closed = False
-        self._is_closing = True
-        self._is_opening = False
-        self._state = STATE_CLOSING
-        self._position = POSITION_CLOSED
-        self._tilt_position = POSITION_UNDEFINED
-
-    def open_cover(self, **kwargs):
+        await self.__async_command(self._transmitter.async_down, PAYLOAD_DOWN)
+
+    async def async_open_cover(self, **kwargs):
         """Open the cover."""
-        self._transmitter.up(self._channel)
-        self._closed = False
-        self._is_closing = False
-        self._is_opening = True
-        self._state = STATE_OPENING
-        self._position = POSITION_OPEN
-        self._tilt_position = POSITION_UNDEFINED
-
-    def stop_cover(self, **kwargs):
+        await self.__async_command(self._transmitter.async_up, PAYLOAD_UP)
+
+    async def async_stop_cover(self, **kwargs):
         """Stop the cover."""
-        self._transmitter.stop(self._channel)
-        self._closed = False
-        self._is_closing = False
-        self._is_opening = False
-        self._state = STATE_STOPPED
-        self._position = POSITION_UNDEFINED
-        self._tilt_position = POSITION_UNDEFINED
-
-    def set_cover_position(self, **kwargs):
+        await self.__async_command(self._transmitter.async_stop, PAYLOAD_STOP)
+
+    async def async_set_cover_position(self, **kwargs):
         """Move the cover to a specific position."""
         position = kwargs.get(ATTR_POSITION)
         if position < 13:
-            self.close_cover()
+            await self.async_close_cover()
         elif position > 13 and position < 50:
-            self.cover_ventilation_tilting_position()
+            await self.async_cover_ventilation_tilting_position()
         elif position > 50 and position < 88:
-            self.cover_intermediate_position()
+            await self.async_cover_intermediate_position()
         elif position > 88:
-            self.open_cover()
+            await self.async_open_cover()
         else:
             _LOGGER.error(f"Wrong Position slider data: {position}")
 
-    def cover_ventilation_tilting_position(self, **kwargs):
+    async def async_cover_ventilation_tilting_position(self, **kwargs):
         """Move into the ventilation/tilting position."""
-        self._transmitter.ventilation_tilting(self._channel)
-        self._closed = False
-        self._is_closing = False
-        self._is_opening = False
-        self._state = STATE_TILT_VENTILATION
-        self._position = POSITION_TILT_VENTILATION
-        self._tilt_position = POSITION_TILT_VENTILATION
-
-    def cover_intermediate_position(self, **kwargs):
+        await self.__async_command(self._transmitter.async_ventilation_tilting, PAYLOAD_VENTILATION_POS_TILTING)
+
+    async def async_cover_intermediate_position(self, **kwargs):
         """Move into the intermediate position."""
-        self._transmitter.intermediate(self._channel)
-        self._closed = False
-        self._is_closing = False
-        self._is_opening = False
-        self._state = STATE_INTERMEDIATE
-        self._position = POSITION_INTERMEDIATE
-        self._tilt_position = POSITION_INTERMEDIATE
-
-    def close_cover_tilt(self, **kwargs):
+        await self.__async_command(self._transmitter.async_intermediate, PAYLOAD_INTERMEDIATE_POS)
+
+    async def async_close_cover_tilt(self, **kwargs):
         """Close the cover tilt."""
-        self.cover_ventilation_tilting_position()
+        await self.async_cover_ventilation_tilting_position()
 
-    def open_cover_tilt(self, **kwargs):
+    async def async_open_cover_tilt(self, **kwargs):
         """Open the cover tilt."""
-        self.cover_intermediate_position()
+        await self.async_cover_intermediate_position()
 
-    def stop_cover_tilt(self, **kwargs):
+    async def async_stop_cover_tilt(self, **kwargs):
         """Stop the cover tilt."""
-        self.stop_cover()
+        await self.async_stop_cover()
 
-    def set_cover_tilt_position(self, **kwargs):
+    async def async_set_cover_tilt_position(self, **kwargs):
         """Move the cover tilt to a specific position."""
         tilt_position = kwargs.get(ATTR_TILT_POSITION)
         if tilt_position < 50:
-            self.cover_ventilation_tilting_position()
+            await self.async_cover_ventilation_tilting_position()
         elif tilt_position > 50:
-            self.cover_intermediate_position()
+            await self.async_cover_intermediate_position()
         else:
             _LOGGER.error(f"Wrong Tilt Position slider data: {tilt_position}")
 
     def response_handler(self, response):
-        """Handle callback to the response from the Transmitter."""
-        self._response = response
-        self.set_states()
+        """Handle callback to the response from the Transmitter.
+
+        The None response means that only the availability has changed.
+        """
+        if response is not None:
+            self._response = response
+            self.set_states()
+        # Push the new state if the entity is already added to HA.
+        if self.entity_id is not None:
+            self.schedule_update_ha_state()
 
     def set_states(self):
         """Set the state of the cover."""
-        self._elero_state = self._response["status"]
-        if self._response["status"] == INFO_NO_INFORMATION:
-            self._closed = None
-            self._is_closing = None
-            self._is_opening = None
-            self._state = STATE_UNKNOWN
-            self._position = None
-            self._tilt_position = None
-        elif self._response["status"] == INFO_TOP_POSITION_STOP:
-            self._closed = False
-            self._is_closing = False
-            self._is_opening = False
-            self._state = STATE_OPEN
-            self._position = POSITION_OPEN
-            self._tilt_position = POSITION_UNDEFINED
-        elif self._response["status"] == INFO_BOTTOM_POSITION_STOP:
-            self._closed = True
-            self._is_closing = False
-            self._is_opening = False
-            self._state = STATE_CLOSED
-            self._position = POSITION_CLOSED
-            self._tilt_position = POSITION_UNDEFINED
-        elif self._response["status"] == INFO_INTERMEDIATE_POSITION_STOP:
-            self._closed = False
-            self._is_closing = False
-            self._is_opening = False
-            self._state = STATE_INTERMEDIATE
-            self._position = POSITION_INTERMEDIATE
-            self._tilt_position = POSITION_INTERMEDIATE
-        elif self._response["status"] == INFO_TILT_VENTILATION_POS_STOP:
-            self._closed = False
-            self._is_closing = False
-            self._is_opening = False
-            self._state = STATE_TILT_VENTILATION
-            self._position = POSITION_TILT_VENTILATION
-            self._tilt_position = POSITION_TILT_VENTILATION
-        elif self._response["status"] == INFO_START_TO_MOVE_UP:
-            self._closed = False
-            self._is_closing = False
-            self._is_opening = True
-            self._state = STATE_OPENING
-            self._position = POSITION_UNDEFINED
-            self._tilt_position = POSITION_UNDEFINED
-        elif self._response["status"] == INFO_START_TO_MOVE_DOWN:
-            self._closed = False
-            self._is_closing = True
-            self._is_opening = False
-            self._state = STATE_CLOSING
-            self._position = POSITION_UNDEFINED
-            self._tilt_position = POSITION_UNDEFINED
-        elif self._response["status"] == INFO_MOVING_UP:
-            self._closed = False
-            self._is_closing = False
-            self._is_opening = True
-            self._state = STATE_OPENING
-            self._position = POSITION_UNDEFINED
-            self._tilt_position = POSITION_UNDEFINED
-        elif self._response["status"] == INFO_MOVING_DOWN:
-            self._closed = False
-            self._is_closing = True
-            self._is_opening = False
-            self._state = STATE_CLOSING
-            self._position = POSITION_UNDEFINED
-            self._tilt_position = POSITION_UNDEFINED
-        elif self._response["status"] == INFO_STOPPED_IN_UNDEFINED_POSITION:
-            self._closed = False
-            self._is_closing = False
-            self._is_opening = False
-            self._state = STATE_UNDEFINED
-            self._position = POSITION_UNDEFINED
-            self._tilt_position = POSITION_UNDEFINED
-        elif self._response["status"] == INFO_TOP_POS_STOP_WICH_TILT_POS:
-            self._closed = False
-            self._is_closing = False
-            self._is_opening = False
-            self._state = STATE_TILT_VENTILATION
-            self._position = POSITION_TILT_VENTILATION
-            self._tilt_position = POSITION_TILT_VENTILATION
-        elif self._response["status"] == INFO_BOTTOM_POS_STOP_WICH_INT_POS:
-            self._closed = True
-            self._is_closing = False
-            self._is_opening = False
-            self._state = STATE_INTERMEDIATE
-            self._position = POSITION_INTERMEDIATE
-            self._tilt_position = POSITION_INTERMEDIATE
-        elif self._response["status"] in (INFO_BLOCKING, INFO_OVERHEATED, INFO_TIMEOUT):
-            self._closed = None
-            self._is_closing = None
-            self._is_opening = None
-            self._state = STATE_UNKNOWN
-            self._position = None
-            self._tilt_position = None
-            t = self._transmitter.get_serial_number()
-            r = self._response["status"]
+        status = self._response.status
+        self._elero_state = self._response.state
+        cover_state = self._status_states.get(status)
+        if cover_state is None:
+            cover_state = COVER_STATE_UNKNOWN
+            t = self._serial_number
             _LOGGER.error(
-                f"Transmitter: '{t}' ch: '{self._channel}'  error response: '{r}'."
+                f"Transmitter: '{t}' ch: '{self._channel}' "
+                f"unhandled response: '{self._elero_state}'."
             )
-
-        elif self._response["status"] in (
-            INFO_SWITCHING_DEVICE_SWITCHED_ON,
-            INFO_SWITCHING_DEVICE_SWITCHED_OFF,
-        ):
-            self._closed = None
-            self._is_closing = None
-            self._is_opening = None
-            self._state = STATE_UNKNOWN
-            self._position = None
-            self._tilt_position = None
-        else:
-            self._closed = None
-            self._is_closing = None
-            self._is_opening = None
-            self._state = STATE_UNKNOWN
-            self._position = None
-            self._tilt_position = None
-            t = self._transmitter.get_serial_number()
-            r = self._response["status"]
+        elif self._elero_state in ERROR_STATUSES:
+            t = self._serial_number
             _LOGGER.error(
-                f"Transmitter: '{t}' ch: '{self._channel}' "
-                f"unhandled response: '{r}'."
+                f"Transmitter: '{t}' ch: '{self._channel}'  "
+                f"error response: '{self._elero_state}'."
             )
+        self.__set_cover_state(cover_state)
+
+    def __set_cover_state(self, cover_state):
+        """Set the attributes of the cover from a cover state."""
+        (
+            self._closed,
+            self._is_opening,
+            self._is_closing,
+            self._state,
+            self._position,
+            self._tilt_position,
+        ) = cover_state
@@ -0,0 +1,152 @@
+"""Support for the diagnostic sensors of the Elero transmitters."""
+
+__version__ = "3.3.1"
+
+import logging
+
+from homeassistant.components.sensor import SensorEntity, SensorStateClass
+from homeassistant.const import UnitOfInformation, UnitOfTime
+from homeassistant.helpers.entity import EntityCategory
+
+import custom_components.elero as elero
+from custom_components.elero import (METRIC_ATTEMPTS, METRIC_DISCONNECTS,
+                                     METRIC_DROPPED_BYTES, METRIC_FAILURES,
+                                     METRIC_GARBAGE, METRIC_LOCK_WAIT,
+                                     METRIC_QUEUE_WAIT, METRIC_REJECTED_FRAMES,
+                                     METRIC_RETRIES, METRIC_RTT,
+                                     METRIC_TIMEOUTS)
+
+# Other HASS components that should be setup before the platform is loaded.
+DEPENDENCIES = ["elero"]
+
+_LOGGER = logging.getLogger(__name__)
+
+# The name, the unit and the state statistic of the sensors of the metrics.
+SENSOR_TYPES = {
+    METRIC_RTT: ("Round trip time", UnitOfTime.MILLISECONDS, "p50"),
+    METRIC_LOCK_WAIT: ("Lock wait", UnitOfTime.MILLISECONDS, "p99"),
+    METRIC_QUEUE_WAIT: ("Queue wait", UnitOfTime.MILLISECONDS, "p99"),
+    METRIC_ATTEMPTS: ("Attempts", None, "p99"),
+    METRIC_TIMEOUTS: ("Timeouts", None, None),
+    METRIC_GARBAGE: ("Garbage responses", None, None),
+    METRIC_DISCONNECTS: ("Disconnects", None, None),
+    METRIC_RETRIES: ("Retries", None, None),
+    METRIC_FAILURES: ("Failures", None, None),
+    METRIC_REJECTED_FRAMES: ("Rejected frames", None, None),
+    METRIC_DROPPED_BYTES: ("Dropped bytes", UnitOfInformation.BYTES, None),
+}
+
+# The statistics of the histograms in the attributes.
+STATISTICS = ("p50", "p90", "p99", "max", "count")
+
+
+def setup_platform(hass, config, add_devices, discovery_info=None):
+    """Set up the diagnostic sensors of the transmitters as they attach."""
+    if discovery_info is None:
+        return
+    added = set()
+
+    def add_transmitter_sensors(serial_number, transmitter):
+        """Add the sensors of a newly attached transmitter."""
+        if serial_number in added:
+            return
+        added.add(serial_number)
+        add_devices(
+            [EleroMetricSensor(serial_number, name) for name in SENSOR_TYPES]
+        )
+
+    elero.ELERO_TRANSMITTERS.listen_attached(add_transmitter_sensors)
+
+
+class EleroMetricSensor(SensorEntity):
+    """Representation of a metric of an Elero transmitter."""
+
+    def __init__(self, serial_number, metric):
+        """Init of an Elero metric sensor."""
+        self._serial_number = serial_number
+        self._metric = metric
+        self._name, self._unit, self._statistic = SENSOR_TYPES[metric]
+        self._transmitter = None
+        self._state = None
+        self._attributes = {}
+        elero.ELERO_TRANSMITTERS.subscribe(serial_number, self.set_transmitter)
+
+    @property
+    def unique_id(self):
+        """Return the unique ID of the sensor."""
+        return f"{self._serial_number}_{self._metric}"
+
+    @property
+    def name(self):
+        """Return the name of the sensor."""
+        return f"Elero {self._serial_number} {self._name}"
+
+    @property
+    def entity_category(self):
+        """Return the diagnostic category of the sensor."""
+        return EntityCategory.DIAGNOSTIC
+
+    @property
+    def state_class(self):
+        """Return the counters as total and the percentiles as measurement."""
+        if self._statistic is None:
+            return SensorStateClass.TOTAL_INCREASING
+        return SensorStateClass.MEASUREMENT
+
+    @property
+    def native_unit_of_measurement(self):
+        """Return the unit of the sensor."""
+        return self._unit
+
+    @property
+    def native_value(self):
+        """Return the state of the sensor."""
+        return self._state
+
+    @property
+    def available(self):
+        """Return True if the transmitter is attached."""
+        return self._transmitter is not None
+
+    @property
+    def extra_state_attributes(self):
+        """Return the statistics of the stick and of its channels."""
+        return self._attributes
+
+    def set_transmitter(self, transmitter):
+        """Attach the sensor to its transmitter or detach it if None."""
+        self._transmitter = transmitter
+
+    def update(self):
+        """Read the metric of the transmitter."""
+        if self._transmitter is None:
+            return
+        metrics = self._transmitter.get_metrics()
+        summary = metrics.get_summary(self._metric)
+        attributes = {}
+        if self._statistic is None:
+            self._state = summary
+            for channel in metrics.get_channels(self._metric):
+                attributes[f"channel_{channel}"] = metrics.get_summary(
+                    self._metric, channel
+                )
+        else:
+            self._state = self.__convert(summary.get(self._statistic))
+            for statistic in STATISTICS:
+                if statistic in summary:
+                    attributes[statistic] = self.__convert(
+                        summary[statistic], statistic
+                    )
+            for channel in metrics.get_channels(self._metric):
+                attributes[f"channel_{channel}_{self._statistic}"] = self.__convert(
+                    metrics.get_summary(self._metric, channel).get(self._statistic)
+                )
+        self._attributes = attributes
+
+    def __convert(self, value, statistic=None):
+        """Convert the seconds of a statistic to milliseconds."""
+        if value is None or statistic == "count":
+            return value
+        if self._unit == UnitOfTime.MILLISECONDS:
+            return round(value * 1000, 1)
+        return value
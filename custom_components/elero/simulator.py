@@ -0,0 +1,364 @@
+"""Simulated Elero Centero USB Transmitter Stick.
+
+The simulator speaks the serial protocol of the stick, so the transmitter
+can be exercised without hardware. It is reachable in-process as a
+pyserial like port or as a TCP server for a remote transmitter:
+
+    python -m custom_components.elero.simulator --port 20109
+
+and configure a remote transmitter with the address "127.0.0.1:20109".
+"""
+
+import argparse
+import logging
+import random
+import socket
+import socketserver
+import threading
+import time
+
+import serial
+
+from custom_components.elero import (BIT_8, BYTE_HEADER, BYTE_LENGTH_4,
+                                     BYTE_LENGTH_5, CHANNELS, COMMAND_CHECK,
+                                     COMMAND_INFO, COMMAND_SEND, HEX_255,
+                                     PAYLOAD_DOWN, PAYLOAD_INTERMEDIATE_POS,
+                                     PAYLOAD_STOP, PAYLOAD_UP,
+                                     PAYLOAD_VENTILATION_POS_TILTING,
+                                     RESPONSE_ACK, RESPONSE_CONFIRM,
+                                     EleroFrameDecoder, get_mask_channels)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Default behaviour of the simulated stick.
+DEFAULT_DROP_RATE = 0
+DEFAULT_LATENCY = 0.05
+DEFAULT_TRAVEL_TIME = 2
+
+# Seconds while a motor reports that it starts to move.
+START_TIME = 0.5
+
+# The status codes of the simulated motors.
+STATUS_BOTTOM_POSITION_STOP = 0x02
+STATUS_INTERMEDIATE_POSITION_STOP = 0x03
+STATUS_MOVING_DOWN = 0x0B
+STATUS_MOVING_UP = 0x0A
+STATUS_START_TO_MOVE_DOWN = 0x09
+STATUS_START_TO_MOVE_UP = 0x08
+STATUS_STOPPED_IN_UNDEFINED_POSITION = 0x0D
+STATUS_TILT_VENTILATION_POS_STOP = 0x04
+STATUS_TIMEOUT = 0x07
+STATUS_TOP_POSITION_STOP = 0x01
+
+# The end status and the part of the travel time of the movement commands.
+PAYLOAD_MOVES = {
+    PAYLOAD_DOWN: (STATUS_BOTTOM_POSITION_STOP, 1),
+    PAYLOAD_INTERMEDIATE_POS: (STATUS_INTERMEDIATE_POSITION_STOP, 0.5),
+    PAYLOAD_UP: (STATUS_TOP_POSITION_STOP, 1),
+    PAYLOAD_VENTILATION_POS_TILTING: (STATUS_TILT_VENTILATION_POS_STOP, 0.25),
+}
+
+
+def create_frame(int_list):
+    """Append the checksum and convert the frame to bytes."""
+    return bytes(int_list + [(256 - sum(int_list)) % 256])
+
+
+class EleroSimulatedMotor(object):
+    """Representation of a simulated Elero motor with its travel time."""
+
+    def __init__(self, travel_time):
+        """Initialize a stopped motor in the top position."""
+        self._travel_time = travel_time
+        self._status = STATUS_TOP_POSITION_STOP
+        self._up = True
+        self._started = 0
+        self._arrives = 0
+
+    def get_status(self, now):
+        """Return the status code of the motor at the given time."""
+        if now >= self._arrives:
+            return self._status
+        if now - self._started < START_TIME:
+            return STATUS_START_TO_MOVE_UP if self._up else STATUS_START_TO_MOVE_DOWN
+        return STATUS_MOVING_UP if self._up else STATUS_MOVING_DOWN
+
+    def command(self, payload, now):
+        """Start or stop the motor by the payload of a Send command."""
+        if payload == PAYLOAD_STOP:
+            if now < self._arrives:
+                self._status = STATUS_STOPPED_IN_UNDEFINED_POSITION
+                self._arrives = now
+            return
+        status, part = PAYLOAD_MOVES[payload]
+        if status == self.get_status(now):
+            return
+        self._up = payload == PAYLOAD_UP
+        self._status = status
+        self._started = now
+        self._arrives = now + self._travel_time * part
+
+
+class EleroSimulator(object):
+    """Representation of the radio side of a simulated transmitter stick.
+
+    The stick answers the Easy Check with the learned channels and the
+    Info and Send commands with Easy Acks. The addressed channels with the
+    same status share one multi-channel Easy Ack. A dropped command is
+    not answered at all, an unreachable channel is answered with the
+    timeout status.
+    """
+
+    def __init__(
+        self, learned_channels=CHANNELS, latency=DEFAULT_LATENCY,
+        drop_rate=DEFAULT_DROP_RATE, travel_time=DEFAULT_TRAVEL_TIME,
+        unreachable_channels=(), seed=None,
+    ):
+        """Initialize the simulator."""
+        self.latency = latency
+        self.drop_rate = drop_rate
+        self.unreachable_channels = set(unreachable_channels)
+        self._learned_mask = 0
+        for channel in learned_channels:
+            self._learned_mask |= 1 << (channel - 1)
+        self._motors = {
+            channel: EleroSimulatedMotor(travel_time)
+            for channel in learned_channels
+        }
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        # Statistics of the served commands.
+        self.commands = 0
+        self.dropped_commands = 0
+
+    def get_status(self, channel):
+        """Return the current status code of the motor of the channel."""
+        with self._lock:
+            return self._motors[channel].get_status(time.monotonic())
+
+    def process(self, frame):
+        """Return the response frames of a command frame."""
+        with self._lock:
+            self.commands += 1
+            if self.drop_rate and self._random.random() < self.drop_rate:
+                self.dropped_commands += 1
+                return []
+            command = frame[2]
+            if command == COMMAND_CHECK:
+                return [
+                    create_frame(
+                        [BYTE_HEADER, BYTE_LENGTH_4, RESPONSE_CONFIRM,
+                         self._learned_mask >> BIT_8, self._learned_mask & HEX_255]
+                    )
+                ]
+            if command not in (COMMAND_INFO, COMMAND_SEND):
+                return []
+            now = time.monotonic()
+            mask = ((frame[3] << BIT_8) | frame[4]) & self._learned_mask
+            statuses = {}
+            for channel in get_mask_channels(mask):
+                if channel in self.unreachable_channels:
+                    status = STATUS_TIMEOUT
+                else:
+                    motor = self._motors[channel]
+                    if command == COMMAND_SEND:
+                        motor.command(frame[5], now)
+                    status = motor.get_status(now)
+                statuses[status] = statuses.get(status, 0) | 1 << (channel - 1)
+            return [
+                create_frame(
+                    [BYTE_HEADER, BYTE_LENGTH_5, RESPONSE_ACK, mask >> BIT_8,
+                     mask & HEX_255, status]
+                )
+                for status, mask in statuses.items()
+            ]
+
+
+class EleroSimulatorSerial(object):
+    """In-process serial port of a simulator with the API of pyserial.
+
+    The responses become readable after the latency of the simulator, at
+    once if it is zero.
+    """
+
+    def __init__(self, simulator, timeout=None, write_timeout=None):
+        """Initialize an open port."""
+        self._simulator = simulator
+        self._decoder = EleroFrameDecoder()
+        self._buffer = bytearray()
+        self._condition = threading.Condition()
+        self.timeout = timeout
+        self.write_timeout = write_timeout
+        self.is_open = True
+
+    @property
+    def in_waiting(self):
+        """Return the count of the readable bytes."""
+        with self._condition:
+            return len(self._buffer)
+
+    def open(self):
+        """Open the port."""
+        self.is_open = True
+
+    def close(self):
+        """Close the port."""
+        self.is_open = False
+        with self._condition:
+            self._condition.notify_all()
+
+    def reset_input_buffer(self):
+        """Drop the readable bytes."""
+        with self._condition:
+            self._buffer.clear()
+
+    def write(self, data):
+        """Send the data to the simulated stick."""
+        if not self.is_open:
+            raise serial.serialutil.SerialException("The port is not open.")
+        self._decoder.feed(data)
+        for frame in self._decoder:
+            responses = self._simulator.process(frame)
+            if not responses:
+                continue
+            if self._simulator.latency <= 0:
+                self.__receive(b"".join(responses))
+                continue
+            timer = threading.Timer(
+                self._simulator.latency, self.__receive, (b"".join(responses),)
+            )
+            timer.daemon = True
+            timer.start()
+        return len(data)
+
+    def __receive(self, data):
+        """Make the response readable."""
+        with self._condition:
+            self._buffer.extend(data)
+            self._condition.notify_all()
+
+    def read(self, size=1):
+        """Read up to size bytes, wait for them up to the timeout."""
+        if not self.is_open:
+            raise serial.serialutil.SerialException("The port is not open.")
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+        with self._condition:
+            while len(self._buffer) < size and self.is_open:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+            data = bytes(self._buffer[:size])
+            del self._buffer[:size]
+            return data
+
+
+class EleroSimulatorHandler(socketserver.BaseRequestHandler):
+    """Serve the serial stream of a TCP connection like ser2net."""
+
+    def setup(self):
+        """Register the connection, so the server can drop it."""
+        with self.server.connections_lock:
+            self.server.connections.add(self.request)
+
+    def finish(self):
+        """Unregister the connection."""
+        with self.server.connections_lock:
+            self.server.connections.discard(self.request)
+
+    def handle(self):
+        """Answer the command frames of the connection."""
+        simulator = self.server.simulator
+        decoder = EleroFrameDecoder()
+        while True:
+            try:
+                data = self.request.recv(256)
+            except OSError:
+                return
+            if not data:
+                return
+            decoder.feed(data)
+            for frame in decoder:
+                responses = simulator.process(frame)
+                if responses:
+                    time.sleep(simulator.latency)
+                    self.request.sendall(b"".join(responses))
+
+
+class EleroSimulatorServer(socketserver.ThreadingTCPServer):
+    """TCP server of a simulated stick for a remote transmitter."""
+
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self, simulator, host="127.0.0.1", port=0):
+        """Initialize the server, the port 0 selects a free port."""
+        self.simulator = simulator
+        self.connections = set()
+        self.connections_lock = threading.Lock()
+        super().__init__((host, port), EleroSimulatorHandler)
+        self._thread = None
+
+    @property
+    def address(self):
+        """Return the address of the server for a remote transmitter."""
+        host, port = self.server_address[:2]
+        return f"{host}:{port}"
+
+    def start(self):
+        """Serve the connections in the background."""
+        self._thread = threading.Thread(
+            target=self.serve_forever, name="elero_simulator", daemon=True
+        )
+        self._thread.start()
+
+    def drop_connections(self):
+        """Close the open connections like a restarted ser2net."""
+        with self.connections_lock:
+            connections = list(self.connections)
+        for connection in connections:
+            try:
+                connection.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+    def stop(self):
+        """Stop serving, drop the connections and close the server."""
+        self.shutdown()
+        self.drop_connections()
+        self.server_close()
+
+
+def main():
+    """Run a simulated stick as a TCP server."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=20109)
+    parser.add_argument(
+        "--channels", type=int, nargs="+", default=list(CHANNELS),
+        help="the learned channels",
+    )
+    parser.add_argument(
+        "--unreachable", type=int, nargs="*", default=[],
+        help="the channels which answer with the timeout status",
+    )
+    parser.add_argument("--latency", type=float, default=DEFAULT_LATENCY)
+    parser.add_argument("--drop-rate", type=float, default=DEFAULT_DROP_RATE)
+    parser.add_argument("--travel-time", type=float, default=DEFAULT_TRAVEL_TIME)
+    args = parser.parse_args()
+    simulator = EleroSimulator(
+        args.channels, args.latency, args.drop_rate, args.travel_time,
+        args.unreachable,
+    )
+    server = EleroSimulatorServer(simulator, args.host, args.port)
+    print(f"Simulated Elero Transmitter Stick on '{server.address}'.")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()